@@ -0,0 +1,132 @@
+"""Compare ``Dict[str, ColumnQuality]`` with the struct-of-arrays ``ColumnTable``.
+
+Run with ``python benchmarks/bench_columnar.py [--columns N]`` after installing the
+package (``pip install -e .``). For both representations it reports the memory
+retained after building them (``tracemalloc``), the pickled size, the time to
+pickle and unpickle, and the time of a filter query (the mask alone and the
+filtered result) and of a sort. For the table it also times the conversions to
+and from the dataclasses, Arrow and pandas.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import pickle
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from quality_toolkit.analysis import ColumnQuality
+from quality_toolkit.columnar import ColumnTable
+
+DTYPES = ("int64", "float64", "str", "bool", "datetime64[ns]")
+
+
+def build_columns(count: int, rows: int = 1_000_000, seed: int = 0) -> Dict[str, ColumnQuality]:
+    rng = np.random.default_rng(seed)
+    missing = rng.integers(0, rows // 10, count)
+    distinct = rng.integers(1, rows, count)
+    columns = {}
+    for index in range(count):
+        columns[f"column_{index:06d}"] = ColumnQuality(
+            dtype=DTYPES[index % len(DTYPES)],
+            missing_count=int(missing[index]),
+            missing_ratio=round(int(missing[index]) / rows, 4),
+            distinct_count=int(distinct[index]),
+            sample_values=[f"value-{index}-{item}" for item in range(5)],
+        )
+    return columns
+
+
+def best_of(repeats: int, func: Callable[[], object]) -> float:
+    timings: List[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def retained_bytes(func: Callable[[], Any]) -> int:
+    """Memory still allocated once ``func``'s result is built."""
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del result
+    return retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--columns", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    repeats = args.repeats
+
+    columns = build_columns(args.columns)
+    table = ColumnTable.from_columns(columns)
+    dict_bytes = pickle.dumps(columns, protocol=pickle.HIGHEST_PROTOCOL)
+    table_bytes = pickle.dumps(table, protocol=pickle.HIGHEST_PROTOCOL)
+
+    rows = [
+        (
+            "memory (MiB)",
+            retained_bytes(lambda: build_columns(args.columns)) / 2**20,
+            retained_bytes(lambda: ColumnTable.from_columns(columns)) / 2**20,
+        ),
+        ("pickled size (MiB)", len(dict_bytes) / 2**20, len(table_bytes) / 2**20),
+        (
+            "pickle (s)",
+            best_of(repeats, lambda: pickle.dumps(columns, protocol=pickle.HIGHEST_PROTOCOL)),
+            best_of(repeats, lambda: pickle.dumps(table, protocol=pickle.HIGHEST_PROTOCOL)),
+        ),
+        (
+            "unpickle (s)",
+            best_of(repeats, lambda: pickle.loads(dict_bytes)),
+            best_of(repeats, lambda: pickle.loads(table_bytes)),
+        ),
+        (
+            "missing_ratio > 0.05 mask (s)",
+            best_of(repeats, lambda: [c.missing_ratio > 0.05 for c in columns.values()]),
+            best_of(repeats, lambda: table.missing_ratio > 0.05),
+        ),
+        (
+            "missing_ratio > 0.05 filter (s)",
+            best_of(
+                repeats,
+                lambda: {n: c for n, c in columns.items() if c.missing_ratio > 0.05},
+            ),
+            best_of(repeats, lambda: table.filter(table.missing_ratio > 0.05)),
+        ),
+        (
+            "sort by distinct (s)",
+            best_of(repeats, lambda: sorted(columns, key=lambda n: columns[n].distinct_count)),
+            best_of(repeats, lambda: table.take(np.argsort(table.distinct_count, kind="stable"))),
+        ),
+    ]
+    print(f"{args.columns:,} columns{'':>14}{'dataclasses':>14}{'ColumnTable':>14}")
+    for label, before, after in rows:
+        print(f"{label:<32}{before:>14.4f}{after:>14.4f}")
+
+    print()
+    conversions = (
+        ("from_columns", lambda: ColumnTable.from_columns(columns)),
+        ("to_columns", table.to_columns),
+        ("to_arrow", table.to_arrow),
+        ("to_frame", table.to_frame),
+    )
+    for label, func in conversions:
+        print(f"{label:<32}{best_of(repeats, func):>14.4f}s")
+
+
+if __name__ == "__main__":
+    main()
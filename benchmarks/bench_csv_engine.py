@@ -0,0 +1,72 @@
+"""Compare the pandas and Arrow CSV engines on a wide generated CSV file.
+
+Parse time (``load_dataset``) and analysis time (``evaluate_data_quality``) are
+reported separately for each engine, best of ``--repeats`` runs.
+
+Run with ``python benchmarks/bench_csv_engine.py [--rows N] [--columns N]`` after
+installing the package (``pip install -e .``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from quality_toolkit.analysis import evaluate_data_quality
+from quality_toolkit.data_loader import load_dataset
+
+
+def write_csv(path: Path, rows: int, columns: int, seed: int = 0) -> None:
+    rng = np.random.default_rng(seed)
+    data = {}
+    for index in range(columns):
+        if index % 3 == 0:
+            data[f"text_{index}"] = rng.choice(["alpha", "beta", "gamma", "", "delta"], rows)
+        elif index % 3 == 1:
+            data[f"int_{index}"] = rng.integers(0, 10_000, rows)
+        else:
+            values = rng.normal(size=rows)
+            values[rng.random(rows) < 0.05] = np.nan
+            data[f"float_{index}"] = values
+    pd.DataFrame(data).to_csv(path, index=False)
+
+
+def best_of(repeats: int, func: Callable[[], object]) -> Tuple[float, object]:
+    timings: List[float] = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--columns", type=int, default=60)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "wide.csv"
+        write_csv(path, args.rows, args.columns)
+        for engine in ("pandas", "arrow"):
+            parse, frame = best_of(
+                args.repeats, lambda engine=engine: load_dataset(path, engine=engine)
+            )
+            analyze, _ = best_of(args.repeats, lambda frame=frame: evaluate_data_quality(frame))
+            print(
+                f"{engine:>6}: parse {parse:.2f}s  analyze {analyze:.2f}s  "
+                f"total {parse + analyze:.2f}s  ({parse / (parse + analyze):.0%} parsing)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Compare the full-load Excel path against streamed, concurrent sheet evaluation.
+
+A workbook with ``--sheets`` sheets of ``--rows`` rows is generated once, then each
+variant runs in a fresh interpreter so its peak resident memory is measured alone:
+
+* ``full``: ``pd.read_excel`` per sheet followed by ``evaluate_data_quality``.
+* ``streamed``: ``evaluate_sheets`` reading each sheet in read-only chunks, with
+  ``--jobs`` sheets evaluated concurrently.
+
+Run with ``python benchmarks/bench_excel.py [--rows N] [--sheets N] [--jobs N]`` after
+installing the package (``pip install -e .``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+
+def write_workbook(path: Path, rows: int, sheets: int, seed: int = 0) -> None:
+    from openpyxl import Workbook
+
+    rng = np.random.default_rng(seed)
+    workbook = Workbook(write_only=True)
+    for sheet in range(sheets):
+        worksheet = workbook.create_sheet(f"sheet_{sheet}")
+        worksheet.append(["id", "amount", "category", "comment"])
+        amounts = rng.normal(100, 15, rows).round(2)
+        categories = rng.choice(["alpha", "beta", "gamma", "delta"], rows)
+        for index in range(rows):
+            comment = None if index % 7 == 0 else f"row {index % 1000}"
+            worksheet.append([index, float(amounts[index]), str(categories[index]), comment])
+    workbook.save(path)
+
+
+def run_variant(variant: str, path: Path, jobs: int) -> dict:
+    import pandas as pd
+
+    from quality_toolkit.analysis import evaluate_data_quality
+    from quality_toolkit.data_loader import list_excel_sheets
+    from quality_toolkit.pipeline import evaluate_sheets
+
+    start = time.perf_counter()
+    if variant == "full":
+        for sheet in list_excel_sheets(path):
+            evaluate_data_quality(pd.read_excel(path, sheet_name=sheet))
+    else:
+        evaluate_sheets(path, workers=jobs)
+    seconds = time.perf_counter() - start
+    peak_kib = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    return {"seconds": seconds, "peak_mib": peak_kib / 1024}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--sheets", type=int, default=4)
+    parser.add_argument("--jobs", type=int, default=4)
+    parser.add_argument("--variant", choices=["full", "streamed"], help=argparse.SUPPRESS)
+    parser.add_argument("--path", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        print(json.dumps(run_variant(args.variant, args.path, args.jobs)))
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "bench.xlsx"
+        write_workbook(path, args.rows, args.sheets)
+        results = {}
+        for variant in ("full", "streamed"):
+            completed = subprocess.run(
+                [sys.executable, __file__, "--variant", variant, "--path", str(path),
+                 "--jobs", str(args.jobs)],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            results[variant] = json.loads(completed.stdout)
+            print(
+                f"{variant:>8}: {results[variant]['seconds']:.2f}s  "
+                f"peak {results[variant]['peak_mib']:.0f} MiB"
+            )
+        speedup = results["full"]["seconds"] / results["streamed"]["seconds"]
+        print(f"speedup {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Compare the factorizing column profiler against the previous per-Series calls.
+
+Run with ``python benchmarks/bench_profiler.py [--rows N] [--columns N]`` after installing
+the package (``pip install -e .``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+
+from quality_toolkit.analysis import format_value, profile_column
+
+
+def legacy_profile(series: pd.Series, sample_size: int = 5) -> tuple:
+    """The original implementation: three separate full passes per column."""
+
+    missing_count = int(series.isna().sum())
+    distinct_count = int(series.nunique(dropna=True))
+    samples = [format_value(value) for value in series.dropna().unique()[:sample_size]]
+    return missing_count, distinct_count, samples
+
+
+def build_frame(rows: int, columns: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    data = {}
+    for index in range(columns):
+        if index % 4 == 3:
+            values = rng.normal(size=rows)
+            values[rng.random(rows) < 0.1] = np.nan
+            data[f"num_{index}"] = values
+        else:
+            vocabulary = np.array([f"value-{item}" for item in range(10 ** (2 + index % 3))])
+            values = rng.choice(vocabulary, rows).astype(object)
+            values[rng.random(rows) < 0.1] = None
+            data[f"text_{index}"] = values
+    return pd.DataFrame(data)
+
+
+def best_of(repeats: int, func: Callable[[], object]) -> float:
+    timings: List[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--columns", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    frame = build_frame(args.rows, args.columns)
+    variants = (("object", frame), ("arrow", frame.convert_dtypes(dtype_backend="pyarrow")))
+    for label, data in variants:
+        before = best_of(args.repeats, lambda data=data: [legacy_profile(data[c]) for c in data])
+        after = best_of(args.repeats, lambda data=data: [profile_column(data[c]) for c in data])
+        print(
+            f"{label:>6} strings: before {before:.3f}s  after {after:.3f}s  "
+            f"speedup {before / after:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Measure cold-start import time of the package and the CLI against a budget.
+
+Each target is imported in a fresh interpreter with ``python -X importtime`` and the
+best cumulative time over ``--repeats`` runs is reported. The script exits with status 1
+when a target exceeds its budget or loads a module that should stay deferred.
+
+Run with ``python benchmarks/bench_startup.py [--package-budget MS] [--cli-budget MS]``
+after installing the package (``pip install -e .``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+DEFERRED_MODULES = ("pandas", "numpy", "tkinter", "pyarrow", "openpyxl")
+
+
+def import_profile(module: str) -> Tuple[float, List[str]]:
+    """Return the cumulative import time of ``module`` in milliseconds and what it loaded."""
+
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative: Dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = (part.strip() for part in line[len("import time:") :].split("|"))
+        if total.isdigit():
+            cumulative[name] = int(total)
+    loaded = [name for name in DEFERRED_MODULES if name in cumulative]
+    return cumulative.get(module, 0) / 1000, loaded
+
+
+def best_profile(module: str, repeats: int) -> Tuple[float, List[str]]:
+    runs = [import_profile(module) for _ in range(repeats)]
+    return min(runs, key=lambda run: run[0])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--package-budget", type=float, default=25.0, metavar="MS")
+    parser.add_argument("--cli-budget", type=float, default=150.0, metavar="MS")
+    args = parser.parse_args()
+
+    failed = False
+    targets = (("quality_toolkit", args.package_budget), ("quality_toolkit.cli", args.cli_budget))
+    for module, budget in targets:
+        milliseconds, loaded = best_profile(module, args.repeats)
+        status = "ok" if milliseconds <= budget and not loaded else "REGRESSION"
+        failed = failed or status != "ok"
+        extra = f"  loaded {', '.join(loaded)}" if loaded else ""
+        print(f"{module:>20}: {milliseconds:7.1f}ms (budget {budget:.0f}ms) {status}{extra}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
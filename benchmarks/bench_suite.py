@@ -0,0 +1,278 @@
+"""Time and measure each stage of the toolkit on synthetic datasets, with regression gates.
+
+Every scenario describes a :class:`synthetic.DatasetSpec`. The dataset is generated
+once per scenario and written in each requested format. Then four stages run on it:
+
+* ``load``: ``load_dataset``
+* ``evaluate``: ``evaluate_data_quality``
+* ``summary``: ``calculate_summary_statistics``
+* ``report``: ``build_markdown_report``
+
+Time is the best of ``--repeats`` runs. Peak memory is the ``tracemalloc`` high-water
+mark of one further run, which counts Python and NumPy allocations but not buffers
+that pyarrow allocates itself.
+
+``--save PATH`` writes the results as a JSON baseline together with the Python,
+pandas, numpy and pyarrow versions. ``--compare PATH`` checks a run against a
+baseline and exits with status 1 when a stage is slower than ``--time-threshold``
+or uses more memory than ``--memory-threshold`` (relative). Tiny absolute changes
+are ignored, so noise on fast stages does not fail the gate. A typical upgrade
+check is::
+
+    python benchmarks/bench_suite.py --scenario medium --save baseline.json
+    pip install --upgrade pandas
+    python benchmarks/bench_suite.py --scenario medium --compare baseline.json
+
+Run after installing the package (``pip install -e .``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+from synthetic import COLUMN_KINDS, FORMAT_SUFFIXES, DatasetSpec, generate_frame, write_dataset
+
+from quality_toolkit.analysis import calculate_summary_statistics, evaluate_data_quality
+from quality_toolkit.data_loader import load_dataset
+from quality_toolkit.report import build_markdown_report
+
+BASELINE_VERSION = 1
+SCENARIOS = {
+    "smoke": DatasetSpec(rows=10_000, columns=10),
+    "medium": DatasetSpec(rows=1_000_000, columns=20),
+    "tall": DatasetSpec(rows=10_000_000, columns=10, cardinality=100_000),
+    "wide": DatasetSpec(rows=10_000, columns=1_000),
+    "very-wide": DatasetSpec(rows=10_000, columns=10_000),
+    "high-cardinality": DatasetSpec(rows=1_000_000, columns=10, cardinality=1_000_000),
+    "sparse": DatasetSpec(rows=1_000_000, columns=20, null_ratio=0.6, duplicate_ratio=0.2),
+}
+EXCEL_MAX_CELLS = 2_000_000
+MIN_SECONDS_CHANGE = 0.05
+MIN_MEMORY_CHANGE_MIB = 1.0
+
+Measurement = Dict[str, float]
+
+
+def measure(
+    func: Callable[[], object],
+    repeats: int,
+    results: Dict[str, Measurement],
+    *key_parts: str,
+) -> object:
+    """Record the best time and the traced peak memory of ``func`` under ``key_parts``."""
+
+    timings: List[float] = []
+    output = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        output = func()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    key = "/".join(key_parts)
+    results[key] = {"seconds": min(timings), "peak_mib": peak / 2**20}
+    print(f"{key:<40} {results[key]['seconds']:>9.3f}s {results[key]['peak_mib']:>9.1f} MiB")
+    return output
+
+
+def run_scenario(
+    name: str,
+    spec: DatasetSpec,
+    formats: List[str],
+    directory: Path,
+    repeats: int,
+) -> Dict[str, Measurement]:
+    results: Dict[str, Measurement] = {}
+    frame = generate_frame(spec)
+    for format_name in formats:
+        if format_name == "excel" and spec.rows * spec.columns > EXCEL_MAX_CELLS:
+            print(f"{name}/excel: skipped, more than {EXCEL_MAX_CELLS:,} cells")
+            continue
+        path = directory / f"{name}-{spec.key}{FORMAT_SUFFIXES[format_name]}"
+        if not path.exists():
+            write_dataset(frame, path)
+
+        loaded = measure(
+            lambda path=path: load_dataset(path), repeats, results, name, format_name, "load"
+        )
+        quality = measure(
+            lambda loaded=loaded: evaluate_data_quality(loaded),
+            repeats, results, name, format_name, "evaluate",
+        )
+        if any(pd.api.types.is_numeric_dtype(dtype) for dtype in loaded.dtypes):
+            measure(
+                lambda loaded=loaded: calculate_summary_statistics(loaded),
+                repeats, results, name, format_name, "summary",
+            )
+        measure(
+            lambda quality=quality: build_markdown_report(quality),
+            repeats, results, name, format_name, "report",
+        )
+    return results
+
+
+def environment() -> Dict[str, str]:
+    import numpy
+
+    versions = {
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": numpy.__version__,
+        "machine": platform.machine(),
+    }
+    try:
+        import pyarrow
+    except ImportError:
+        versions["pyarrow"] = "missing"
+    else:
+        versions["pyarrow"] = pyarrow.__version__
+    return versions
+
+
+def compare(
+    results: Dict[str, Measurement],
+    baseline: Dict[str, Measurement],
+    time_threshold: float,
+    memory_threshold: float,
+) -> List[str]:
+    """Return one message per stage that regressed beyond the thresholds."""
+
+    regressions: List[str] = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            print(f"{key:<40} new, no baseline")
+            continue
+        checks = (
+            ("seconds", time_threshold, MIN_SECONDS_CHANGE, "s"),
+            ("peak_mib", memory_threshold, MIN_MEMORY_CHANGE_MIB, " MiB"),
+        )
+        for metric, threshold, min_change, unit in checks:
+            before, after = previous[metric], current[metric]
+            if after > before * (1 + threshold) and after - before > min_change:
+                regressions.append(
+                    f"{key} {metric}: {before:.3f}{unit} -> {after:.3f}{unit} "
+                    f"(+{(after / before - 1) if before else float('inf'):.0%})"
+                )
+    return regressions
+
+
+def _parse_dtypes(value: str) -> Dict[str, float]:
+    weights: Dict[str, float] = {}
+    for item in value.split(","):
+        kind, _, weight = item.partition("=")
+        if kind.strip() not in COLUMN_KINDS:
+            raise argparse.ArgumentTypeError(
+                f"unknown column kind {kind!r}; choose from {', '.join(COLUMN_KINDS)}"
+            )
+        weights[kind.strip()] = float(weight or 1)
+    return weights
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Preset scenario; repeat to run several (default: smoke).",
+    )
+    parser.add_argument("--rows", type=int, help="Run a custom scenario with this many rows.")
+    parser.add_argument("--columns", type=int, help="Column count for the custom scenario.")
+    parser.add_argument(
+        "--dtypes",
+        type=_parse_dtypes,
+        help="Column kind weights for the custom scenario, e.g. int=2,string=1,datetime=1.",
+    )
+    parser.add_argument("--null-ratio", type=float)
+    parser.add_argument("--cardinality", type=int)
+    parser.add_argument("--duplicate-ratio", type=float)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument(
+        "--formats", default="csv,parquet,excel", help="Comma-separated: csv, parquet, excel."
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument(
+        "--data-dir", type=Path, help="Keep generated files here and reuse them across runs."
+    )
+    parser.add_argument("--save", type=Path, help="Write the results as a JSON baseline.")
+    parser.add_argument("--compare", type=Path, help="Fail on regressions against a baseline.")
+    parser.add_argument("--time-threshold", type=float, default=0.25)
+    parser.add_argument("--memory-threshold", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    formats = [item.strip() for item in args.formats.split(",") if item.strip()]
+    unknown = set(formats) - set(FORMAT_SUFFIXES)
+    if unknown:
+        parser.error(f"unknown formats: {', '.join(sorted(unknown))}")
+
+    scenarios = {name: SCENARIOS[name] for name in args.scenario or []}
+    overrides = {
+        name: getattr(args, name)
+        for name in ("rows", "columns", "dtypes", "null_ratio", "cardinality",
+                     "duplicate_ratio", "seed")
+        if getattr(args, name) is not None
+    }
+    if overrides:
+        try:
+            scenarios["custom"] = DatasetSpec(**{**DatasetSpec().__dict__, **overrides})
+        except ValueError as error:
+            parser.error(str(error))
+    if not scenarios:
+        scenarios["smoke"] = SCENARIOS["smoke"]
+
+    results: Dict[str, Measurement] = {}
+    with tempfile.TemporaryDirectory() as temporary:
+        directory = args.data_dir or Path(temporary)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, spec in scenarios.items():
+            results.update(run_scenario(name, spec, formats, directory, args.repeats))
+
+    if args.save:
+        document = {
+            "version": BASELINE_VERSION,
+            "environment": environment(),
+            "scenarios": {name: spec.__dict__ for name, spec in scenarios.items()},
+            "results": results,
+        }
+        args.save.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+        print(f"baseline written to {args.save}")
+
+    if args.compare:
+        document = json.loads(args.compare.read_text())
+        if document.get("version") != BASELINE_VERSION:
+            parser.error(f"{args.compare} is not a version {BASELINE_VERSION} baseline")
+        current = environment()
+        for package, version in document.get("environment", {}).items():
+            if current.get(package) != version:
+                print(f"environment: {package} {version} -> {current.get(package)}")
+        regressions = compare(
+            results, document["results"], args.time_threshold, args.memory_threshold
+        )
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            return 1
+        print("no regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""Seeded synthetic datasets for the benchmark suite.
+
+:func:`generate_frame` builds a frame from a :class:`DatasetSpec` that controls the
+row and column counts, the mix of column types, the share of missing values, the
+number of distinct values per column and the share of duplicated rows.
+:func:`write_dataset` writes it as CSV, Parquet or Excel. The same spec and seed
+always produce the same data, so timings from different runs are comparable.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+COLUMN_KINDS = ("int", "float", "string", "category", "bool", "datetime")
+FORMAT_SUFFIXES = {"csv": ".csv", "parquet": ".parquet", "excel": ".xlsx"}
+EXCEL_MAX_ROWS = 1_048_575
+EXCEL_MAX_COLUMNS = 16_384
+CATEGORY_CARDINALITY = 12
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """Shape and content of a synthetic dataset.
+
+    ``dtypes`` weights the column kinds in :data:`COLUMN_KINDS`; columns are
+    assigned round-robin in proportion to the weights. ``cardinality`` caps the
+    distinct values of int, string and datetime columns, ``null_ratio`` is the
+    share of missing values per column and ``duplicate_ratio`` the share of rows
+    that repeat an earlier row exactly.
+    """
+
+    rows: int = 10_000
+    columns: int = 10
+    dtypes: Dict[str, float] = field(
+        default_factory=lambda: {"int": 1, "float": 1, "string": 1, "category": 1}
+    )
+    null_ratio: float = 0.05
+    cardinality: int = 1_000
+    duplicate_ratio: float = 0.01
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.rows <= 0 or self.columns <= 0:
+            raise ValueError("rows and columns must be positive")
+        unknown = set(self.dtypes) - set(COLUMN_KINDS)
+        if unknown:
+            raise ValueError(f"Unknown column kinds: {', '.join(sorted(unknown))}")
+        if not any(weight > 0 for weight in self.dtypes.values()):
+            raise ValueError("At least one column kind needs a positive weight")
+        for name in ("null_ratio", "duplicate_ratio"):
+            if not 0 <= getattr(self, name) < 1:
+                raise ValueError(f"{name} must be in [0, 1)")
+        if self.cardinality <= 0:
+            raise ValueError("cardinality must be positive")
+
+    @property
+    def key(self) -> str:
+        """Short stable digest of the spec, used to name and reuse generated files."""
+
+        encoded = json.dumps(asdict(self), sort_keys=True).encode()
+        return hashlib.sha1(encoded).hexdigest()[:12]
+
+    def column_kinds(self) -> List[str]:
+        weights = {kind: weight for kind, weight in self.dtypes.items() if weight > 0}
+        total = sum(weights.values())
+        kinds: List[str] = []
+        credit = dict.fromkeys(weights, 0.0)
+        # Smooth weighted round-robin: interleaves kinds instead of grouping them.
+        for _ in range(self.columns):
+            for kind, weight in weights.items():
+                credit[kind] += weight
+            chosen = max(credit, key=credit.__getitem__)
+            credit[chosen] -= total
+            kinds.append(chosen)
+        return kinds
+
+
+def generate_frame(spec: DatasetSpec) -> pd.DataFrame:
+    rng = np.random.default_rng(spec.seed)
+    duplicates = int(spec.rows * spec.duplicate_ratio)
+    unique_rows = spec.rows - duplicates
+    # Duplicates copy whole generated rows, so they stay exact after nulls are applied.
+    order = np.concatenate(
+        [np.arange(unique_rows), rng.integers(0, unique_rows, duplicates)]
+    )
+    order = rng.permutation(order)
+
+    data: Dict[str, object] = {}
+    for index, kind in enumerate(spec.column_kinds()):
+        values = _column_values(rng, kind, unique_rows, spec.cardinality)
+        if spec.null_ratio:
+            values = _with_nulls(values, rng.random(unique_rows) < spec.null_ratio)
+        data[f"{kind}_{index}"] = values.take(order)
+    return pd.DataFrame(data)
+
+
+def write_dataset(frame: pd.DataFrame, path: Path) -> Path:
+    """Write ``frame`` in the format implied by the suffix of ``path``."""
+
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+        except ImportError:
+            frame.to_csv(path, index=False)
+        else:
+            # Much faster than ``to_csv`` for wide frames of nullable columns.
+            pa_csv.write_csv(pa.Table.from_pandas(frame, preserve_index=False), path)
+    elif suffix == ".parquet":
+        frame.to_parquet(path, index=False)
+    elif suffix == ".xlsx":
+        rows, columns = frame.shape
+        if rows > EXCEL_MAX_ROWS or columns > EXCEL_MAX_COLUMNS:
+            raise ValueError(f"{rows}x{columns} does not fit in an Excel worksheet")
+        frame.to_excel(path, index=False)
+    else:
+        raise ValueError(f"Unsupported benchmark format: {suffix}")
+    return path
+
+
+def _column_values(
+    rng: np.random.Generator, kind: str, rows: int, cardinality: int
+) -> pd.api.extensions.ExtensionArray:
+    if kind == "int":
+        return pd.array(rng.integers(0, cardinality, rows), dtype="Int64")
+    if kind == "float":
+        return pd.array(rng.normal(100, 15, rows).round(4), dtype="Float64")
+    if kind == "bool":
+        return pd.array(rng.random(rows) < 0.5, dtype="boolean")
+    if kind == "datetime":
+        offsets = rng.integers(0, cardinality, rows).astype("timedelta64[s]")
+        return pd.array(np.datetime64("2024-01-01T00:00:00") + offsets * 60)
+    size = CATEGORY_CARDINALITY if kind == "category" else cardinality
+    vocabulary = np.array([f"{kind}-{item:06d}" for item in range(min(size, rows))], dtype=object)
+    return pd.array(vocabulary[rng.integers(0, len(vocabulary), rows)], dtype="string")
+
+
+def _with_nulls(values, mask: np.ndarray):
+    values = values.copy()
+    values[mask] = None
+    return values
@@ -1,18 +1,132 @@
-"""Quality Toolkit package providing reusable data quality helpers."""
+"""Quality Toolkit package providing reusable data quality helpers.
 
-from .analysis import ColumnQuality, DatasetQuality, evaluate_data_quality
-from .data_loader import load_dataset
-from .gui import QualityToolkitApp, launch_gui
-from .report import build_markdown_report
+Public names are imported from their modules on first access, so importing the
+package does not load pandas or tkinter until they are needed.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .analysis import (
+        ColumnAccumulator,
+        ColumnQuality,
+        ColumnSummary,
+        DatasetAccumulator,
+        DatasetQuality,
+        SummaryAccumulator,
+        evaluate_data_quality,
+        evaluate_data_quality_chunks,
+    )
+    from .cache import CacheStats, ResultCache
+    from .columnar import ColumnTable, ColumnView
+    from .data_loader import iter_dataset_chunks, load_dataset
+    from .drift import (
+        DatasetDiff,
+        DatasetProfile,
+        ProfileAccumulator,
+        compare_profiles,
+        profile_file,
+    )
+    from .gui import QualityToolkitApp, launch_gui
+    from .pipeline import evaluate_file
+    from .profiling import Profiler, Span
+    from .report import build_markdown_report
+    from .rules import Rule, RuleResult, RuleSet, load_rules
+    from .sketches import FrequentItems, HyperLogLog, KLLSketch
+    from .writers import ReportWriter, open_writer, register_writer, write_report
+
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    "CacheStats": ".cache",
+    "ColumnAccumulator": ".analysis",
+    "ColumnQuality": ".analysis",
+    "ColumnTable": ".columnar",
+    "ColumnView": ".columnar",
+    "ColumnSummary": ".analysis",
+    "DatasetAccumulator": ".analysis",
+    "DatasetDiff": ".drift",
+    "DatasetProfile": ".drift",
+    "DatasetQuality": ".analysis",
+    "SummaryAccumulator": ".analysis",
+    "FrequentItems": ".sketches",
+    "HyperLogLog": ".sketches",
+    "KLLSketch": ".sketches",
+    "ProfileAccumulator": ".drift",
+    "Profiler": ".profiling",
+    "ResultCache": ".cache",
+    "Rule": ".rules",
+    "RuleResult": ".rules",
+    "RuleSet": ".rules",
+    "Span": ".profiling",
+    "compare_profiles": ".drift",
+    "evaluate_data_quality": ".analysis",
+    "evaluate_data_quality_chunks": ".analysis",
+    "evaluate_file": ".pipeline",
+    "iter_dataset_chunks": ".data_loader",
+    "load_dataset": ".data_loader",
+    "load_rules": ".rules",
+    "profile_file": ".drift",
+    "build_markdown_report": ".report",
+    "ReportWriter": ".writers",
+    "open_writer": ".writers",
+    "register_writer": ".writers",
+    "write_report": ".writers",
+    "QualityToolkitApp": ".gui",
+    "launch_gui": ".gui",
+}
 
 __all__ = [
+    "CacheStats",
+    "ColumnAccumulator",
     "ColumnQuality",
+    "ColumnTable",
+    "ColumnView",
+    "ColumnSummary",
+    "DatasetAccumulator",
+    "DatasetDiff",
+    "DatasetProfile",
     "DatasetQuality",
+    "SummaryAccumulator",
+    "FrequentItems",
+    "HyperLogLog",
+    "KLLSketch",
+    "ProfileAccumulator",
+    "Profiler",
+    "ResultCache",
+    "Rule",
+    "RuleResult",
+    "RuleSet",
+    "Span",
+    "compare_profiles",
     "evaluate_data_quality",
+    "evaluate_data_quality_chunks",
+    "evaluate_file",
+    "iter_dataset_chunks",
     "load_dataset",
+    "load_rules",
+    "profile_file",
     "build_markdown_report",
+    "ReportWriter",
+    "open_writer",
+    "register_writer",
+    "write_report",
     "QualityToolkitApp",
     "launch_gui",
 ]
 
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
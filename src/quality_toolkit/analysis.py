@@ -1,10 +1,50 @@
 ﻿from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List
+import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, fields, replace
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
+import numpy as np
 import pandas as pd
 
+from .data_loader import DEFAULT_MEMORY_ATTR
+from .duplicates import (
+    DUPLICATE_MODES,
+    create_duplicate_detector,
+    fold_column_hashes,
+    row_fingerprints,
+)
+from .parallel import map_column_groups, resolve_workers
+from .profiling import Profiler, Span, resolve_profiler
+from .sketches import (
+    HyperLogLog,
+    KLLSketch,
+    StreamingMoments,
+    find_numeric_text,
+    hash_series,
+)
+
+if TYPE_CHECKING:
+    from .columnar import ColumnTable
+    from .rules import RuleAccumulator, RuleResult, RuleSet
+
+MISSING_RATIO_WARNING_THRESHOLD = 0.3
+DEFAULT_QUANTILE_ERROR = 0.01
+SUMMARY_PERCENTILES = (0.25, 0.5, 0.75)
+
 
 @dataclass(frozen=True)
 class ColumnQuality:
@@ -15,6 +55,27 @@ class ColumnQuality:
     missing_ratio: float
     distinct_count: int
     sample_values: List[str]
+    distinct_is_estimate: bool = False
+    distinct_error: float = 0.0
+    memory_bytes: Optional[int] = None
+    default_memory_bytes: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class ColumnSummary:
+    """Numeric summary of a column, one row of :func:`calculate_summary_statistics`.
+
+    ``quantiles`` maps labels such as ``"25%"`` to values; ``quantile_error`` is the
+    normalized rank error of those estimates (``0.0`` when they are exact).
+    """
+
+    count: int
+    mean: float
+    std: float
+    min: float
+    max: float
+    quantiles: Dict[str, float]
+    quantile_error: float = 0.0
 
 
 @dataclass(frozen=True)
@@ -25,56 +86,1028 @@ class DatasetQuality:
     duplicate_rows: int
     columns: Dict[str, ColumnQuality]
     warnings: List[str]
+    duplicates_are_estimate: bool = False
+    duplicate_false_positive_rate: float = 0.0
+    timings: Optional[Tuple[Span, ...]] = field(default=None, compare=False)
+    summary: Optional[Dict[str, ColumnSummary]] = None
+    rule_results: Optional[List[RuleResult]] = None
+
+    def column_table(self) -> ColumnTable:
+        """Return ``columns`` packed into a struct-of-arrays :class:`ColumnTable`."""
+
+        from .columnar import ColumnTable
+
+        return ColumnTable.from_columns(self.columns)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-compatible representation; columns keep their order."""
+
+        data = {
+            item.name: getattr(self, item.name)
+            for item in fields(self)
+            if item.name not in ("columns", "timings", "summary", "rule_results")
+        }
+        data["columns"] = [
+            {"name": name, **asdict(column)} for name, column in self.columns.items()
+        ]
+        if self.timings is not None:
+            data["timings"] = [span.to_dict() for span in self.timings]
+        if self.summary is not None:
+            data["summary"] = [
+                {"name": name, **asdict(summary)} for name, summary in self.summary.items()
+            ]
+        if self.rule_results is not None:
+            data["rule_results"] = [asdict(result) for result in self.rule_results]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> DatasetQuality:
+        """Rebuild a :class:`DatasetQuality` produced by :meth:`to_dict`."""
+
+        values = dict(data)
+        timings = values.pop("timings", None)
+        if timings is not None:
+            values["timings"] = tuple(Span.from_dict(span) for span in timings)
+        summary = values.pop("summary", None)
+        if summary is not None:
+            # Writers emit NaN statistics as null for strict JSON consumers.
+            values["summary"] = {
+                record["name"]: ColumnSummary(
+                    **{
+                        key: math.nan if value is None else value
+                        for key, value in record.items()
+                        if key != "name"
+                    }
+                )
+                for record in summary
+            }
+        rule_results = values.pop("rule_results", None)
+        if rule_results is not None:
+            from .rules import RuleResult
+
+            values["rule_results"] = [RuleResult.from_dict(record) for record in rule_results]
+        columns: Dict[str, ColumnQuality] = {}
+        for record in values.pop("columns"):
+            column = dict(record)
+            name = column.pop("name")
+            columns[name] = ColumnQuality(**column)
+        return cls(columns=columns, **values)
+
+
+def evaluate_data_quality(
+    df: pd.DataFrame,
+    sample_size: int = 5,
+    *,
+    distinct_error: Optional[float] = None,
+    duplicate_mode: str = "exact",
+    workers: Optional[int] = None,
+    executor: str = "auto",
+    on_column: Optional[Callable[[object, ColumnQuality], None]] = None,
+    memory_usage: bool = False,
+    profiler: Optional[Profiler] = None,
+    summary: bool = False,
+    rules: Optional[RuleSet] = None,
+) -> DatasetQuality:
+    """Inspect ``df`` and return core quality indicators.
+
+    Passing ``distinct_error`` replaces exact distinct counting with a
+    :class:`~quality_toolkit.sketches.HyperLogLog` estimate whose relative standard
+    error is at most ``distinct_error``. Duplicate rows are detected from 64-bit row
+    fingerprints; ``duplicate_mode="approximate"`` tracks them in a Bloom filter.
+
+    With ``workers`` greater than one (``0`` means every core) the columns are
+    profiled on a pool picked by ``executor`` (``"thread"``, ``"process"`` or
+    ``"auto"``) while the row fingerprints are computed on the calling thread.
+
+    ``on_column`` is called on the calling thread with each column and its
+    :class:`ColumnQuality` as soon as it is available (right after it is profiled
+    when running serially). An exception raised by the callback aborts the run.
+
+    With ``memory_usage`` each column records its deep memory footprint, plus
+    the footprint with default dtypes when :func:`~quality_toolkit.data_loader.load_dataset`
+    stored it in ``df.attrs`` while optimizing memory.
 
+    A :class:`~quality_toolkit.profiling.Profiler` records an ``evaluate`` span
+    with one ``evaluate.column`` span per column (a single ``evaluate.columns``
+    span when the columns are profiled on a pool) and an ``evaluate.duplicates``
+    span. Its spans so far are attached to the result as ``timings``.
 
-def evaluate_data_quality(df: pd.DataFrame, sample_size: int = 5) -> DatasetQuality:
-    """Inspect ``df`` and return core quality indicators."""
+    With ``summary`` the numeric columns are also summarized by a
+    :class:`SummaryAccumulator` into ``DatasetQuality.summary``.
+
+    ``rules`` evaluates a :class:`~quality_toolkit.rules.RuleSet` (one pass per
+    checked column, on ``workers`` threads) into ``DatasetQuality.rule_results``;
+    every failed rule also adds a warning. When the columns are profiled serially
+    in exact mode, the rules reuse the factorization of each column they check.
+    """
 
     if sample_size <= 0:
         raise ValueError("sample_size must be positive")
 
+    profiler = resolve_profiler(profiler)
+    factorized: Dict[object, Tuple[np.ndarray, Any]] = {}
+    shared = rules.by_column() if rules is not None and distinct_error is None else {}
+    with profiler.span("evaluate", rows=len(df)):
+        quality = _evaluate_frame(
+            df,
+            sample_size,
+            distinct_error=distinct_error,
+            duplicate_mode=duplicate_mode,
+            workers=workers,
+            executor=executor,
+            on_column=on_column,
+            memory_usage=memory_usage,
+            profiler=profiler,
+            shared_columns=shared.keys(),
+            factorized=factorized,
+        )
+        if summary:
+            with profiler.span("evaluate.summary", rows=len(df)):
+                accumulator = SummaryAccumulator()
+                accumulator.update(df)
+                quality = replace(quality, summary=accumulator.result())
+        if rules is not None:
+            from .rules import evaluate_rules
+
+            with profiler.span("evaluate.rules", rows=len(df)):
+                results = evaluate_rules(df, rules, workers=workers, factorized=factorized)
+                quality = with_rule_results(quality, results)
+    return attach_timings(quality, profiler)
+
+
+def attach_timings(quality: DatasetQuality, profiler: Profiler) -> DatasetQuality:
+    """Return ``quality`` with the spans recorded by ``profiler`` as its ``timings``."""
+
+    if not profiler.enabled:
+        return quality
+    return replace(quality, timings=tuple(profiler.spans))
+
+
+def with_rule_results(quality: DatasetQuality, results: List[RuleResult]) -> DatasetQuality:
+    """Return ``quality`` with ``results`` attached and a warning per failed rule."""
+
+    from .rules import rule_warnings
+
+    warnings = quality.warnings + rule_warnings(results)
+    return replace(quality, rule_results=results, warnings=warnings)
+
+
+def _evaluate_frame(
+    df: pd.DataFrame,
+    sample_size: int,
+    *,
+    distinct_error: Optional[float],
+    duplicate_mode: str,
+    workers: Optional[int],
+    executor: str,
+    on_column: Optional[Callable[[object, ColumnQuality], None]],
+    memory_usage: bool,
+    profiler: Profiler,
+    shared_columns: AbstractSet[object] = frozenset(),
+    factorized: Optional[Dict[object, Tuple[np.ndarray, Any]]] = None,
+) -> DatasetQuality:
+    # Serial exact profiles keep the factorization of ``shared_columns`` in
+    # ``factorized`` for the caller to reuse.
     row_count = int(len(df))
-    duplicate_rows = int(df.duplicated().sum()) if row_count else 0
+    detector = create_duplicate_detector(duplicate_mode)
     warnings: List[str] = []
     columns: Dict[str, ColumnQuality] = {}
 
     if row_count == 0:
         warnings.append("Dataset contains no rows.")
 
-    for column in df.columns:
-        series = df[column]
-        missing_count = int(series.isna().sum())
-        missing_ratio = float(missing_count / row_count) if row_count else 0.0
-        distinct_count = int(series.nunique(dropna=True))
-        sample_candidates = series.dropna().unique()[:sample_size]
-        sample_values = [_format_value(value) for value in sample_candidates]
-
-        columns[column] = ColumnQuality(
-            dtype=str(series.dtype),
-            missing_count=missing_count,
-            missing_ratio=round(missing_ratio, 4),
-            distinct_count=distinct_count,
-            sample_values=sample_values,
-        )
+    pool_size = resolve_workers(workers)
+    if pool_size > 1:
+        with ThreadPoolExecutor(max_workers=1) as background:
+            fingerprint_future = background.submit(row_fingerprints, df)
+            with profiler.span("evaluate.columns", rows=row_count):
+                profiles = map_column_groups(
+                    df,
+                    _profile_column_group,
+                    workers=pool_size,
+                    executor=executor,
+                    sample_size=sample_size,
+                    distinct_error=distinct_error,
+                )
+            if on_column is not None:
+                for column, column_quality in profiles:
+                    on_column(column, column_quality)
+            # Fingerprints overlap the column pool; this span is the remaining wait.
+            with profiler.span("evaluate.duplicates", rows=row_count):
+                fingerprints = fingerprint_future.result()
+                duplicate_rows = detector.add(fingerprints) if row_count else 0
+    else:
+        profiles = []
+        for column in df.columns:
+            with profiler.span("evaluate.column", rows=row_count, column=str(column)):
+                pair = None
+                if factorized is not None and column in shared_columns:
+                    pair = factorized[column] = factorize_column(df[column])
+                column_quality = profile_column(
+                    df[column], sample_size, distinct_error, factorized=pair
+                )
+            profiles.append((column, column_quality))
+            if on_column is not None:
+                on_column(column, column_quality)
+        with profiler.span("evaluate.duplicates", rows=row_count):
+            fingerprints = row_fingerprints(df)
+            duplicate_rows = detector.add(fingerprints) if row_count else 0
 
-        if missing_ratio > 0.3:
-            warnings.append(
-                f"Column '{column}' has {missing_ratio:.0%} missing values."
+    default_memory = df.attrs.get(DEFAULT_MEMORY_ATTR, {})
+    for column, profiled in profiles:
+        column_quality = profiled
+        if memory_usage:
+            column_quality = replace(
+                profiled,
+                memory_bytes=int(df[column].memory_usage(deep=True, index=False)),
+                default_memory_bytes=default_memory.get(column),
             )
+        columns[column] = column_quality
+        missing_ratio = float(column_quality.missing_count / row_count) if row_count else 0.0
+        if missing_ratio > MISSING_RATIO_WARNING_THRESHOLD:
+            warnings.append(_missing_warning(column, missing_ratio))
 
     return DatasetQuality(
         row_count=row_count,
         duplicate_rows=duplicate_rows,
         columns=columns,
         warnings=warnings,
+        duplicates_are_estimate=duplicate_mode == "approximate",
+        duplicate_false_positive_rate=detector.false_positive_rate,
+    )
+
+
+def profile_column(
+    series: pd.Series,
+    sample_size: int = 5,
+    distinct_error: Optional[float] = None,
+    *,
+    factorized: Optional[Tuple[np.ndarray, Any]] = None,
+) -> ColumnQuality:
+    """Return the :class:`ColumnQuality` of a single ``series``.
+
+    In exact mode the column is factorized once and the missing count, distinct
+    count and samples are all read from that factorization: codes of ``-1`` mark
+    nulls and the uniques come back in order of first appearance. A
+    :func:`factorize_column` result the caller already holds can be passed as
+    ``factorized``. In approximate mode the values are hashed into a sketch and
+    samples are collected from the head of the column only until ``sample_size``
+    distinct values are found.
+    """
+
+    row_count = int(len(series))
+    if distinct_error is None:
+        codes, uniques = factorize_column(series) if factorized is None else factorized
+        missing_count = int(np.count_nonzero(codes < 0))
+        distinct_count = len(uniques)
+        sample_candidates = uniques[:sample_size]
+        error = 0.0
+    else:
+        sketch = HyperLogLog.from_error(distinct_error)
+        missing_count = sketch.update(series)
+        distinct_count = sketch.count()
+        sample_candidates = collect_samples(series, sample_size)
+        error = sketch.relative_error
+    missing_ratio = float(missing_count / row_count) if row_count else 0.0
+
+    return ColumnQuality(
+        dtype=str(series.dtype),
+        missing_count=missing_count,
+        missing_ratio=round(missing_ratio, 4),
+        distinct_count=distinct_count,
+        sample_values=[format_value(value) for value in sample_candidates],
+        distinct_is_estimate=distinct_error is not None,
+        distinct_error=error,
+    )
+
+
+def collect_samples(series: pd.Series, sample_size: int) -> list:
+    """Return the first ``sample_size`` distinct non-null values of ``series``.
+
+    The column is scanned in geometrically growing windows so that the common case
+    of a few samples touches only the head of the column.
+    """
+
+    window = max(64, sample_size * 16)
+    start = 0
+    samples: list = []
+    while start < len(series) and len(samples) < sample_size:
+        for value in series.iloc[start : start + window].dropna().unique():
+            if value not in samples:
+                samples.append(value)
+                if len(samples) == sample_size:
+                    break
+        start += window
+        window *= 4
+    return samples
+
+
+def factorize_column(series: pd.Series) -> Tuple[np.ndarray, Any]:
+    """Return the codes and uniques of ``series``; codes of ``-1`` mark nulls.
+
+    This is the factorization the exact column profile reads, and callers that
+    already hold it can pass it on instead of factorizing the column again.
+    """
+
+    dtype = series.dtype
+    if isinstance(dtype, pd.ArrowDtype) and dtype.kind == "f":
+        # Arrow's dictionary encoding is slower than pandas' hash table on floats.
+        values = series.to_numpy(dtype=dtype.numpy_dtype, na_value=np.nan)
+        return pd.factorize(values, use_na_sentinel=True)
+    return pd.factorize(series, use_na_sentinel=True)
+
+
+def format_value(value: object) -> str:
+    """Render a sample or example value as it appears in reports."""
+
+    if isinstance(value, float):
+        return f"{value:.6g}"
+    return str(value)
+
+
+def is_summary_numeric(dtype: object) -> bool:
+    """Whether columns of ``dtype`` get a numeric summary (numbers other than booleans)."""
+
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+
+def merge_dtype(left: Optional[object], right: object) -> object:
+    """Return the dtype of a column whose chunks were parsed as ``left`` and ``right``."""
+
+    if left is None or left == right:
+        return right
+    # A file read whole parses a column holding both numbers and text as text.
+    for text, other in ((left, right), (right, left)):
+        numeric = isinstance(other, np.dtype) and other.kind in "biuf"
+        if isinstance(text, pd.StringDtype) and numeric:
+            return text
+    if (
+        isinstance(left, np.dtype)
+        and isinstance(right, np.dtype)
+        and left.kind in "biuf"
+        and right.kind in "biuf"
+    ):
+        return np.result_type(left, right)
+    return np.dtype(object)
+
+
+def resolve_dtype(
+    dtype: Optional[object], null_dtype: Optional[object], missing_count: int
+) -> object:
+    """Return the dtype of a column whose chunks had ``dtype`` (``null_dtype`` when all null)."""
+
+    if dtype is None:
+        return null_dtype if null_dtype is not None else np.dtype(object)
+    # A column with gaps cannot keep an integer or boolean dtype once the chunks
+    # are concatenated, so mirror what pandas infers for the whole table.
+    if missing_count and isinstance(dtype, np.dtype):
+        if dtype.kind in "iu":
+            return np.dtype("float64")
+        if dtype.kind == "b":
+            return np.dtype(object)
+    return dtype
+
+
+def _profile_column_group(
+    df: pd.DataFrame,
+    columns: List[object],
+    *,
+    sample_size: int,
+    distinct_error: Optional[float],
+) -> List[Tuple[object, ColumnQuality]]:
+    return [(column, profile_column(df[column], sample_size, distinct_error)) for column in columns]
+
+
+def evaluate_data_quality_chunks(
+    chunks: Iterable[pd.DataFrame],
+    sample_size: int = 5,
+    *,
+    distinct_error: Optional[float] = None,
+    duplicate_mode: str = "exact",
+    workers: Optional[int] = None,
+    summary: bool = False,
+    rules: Optional[RuleSet] = None,
+) -> DatasetQuality:
+    """Evaluate a stream of DataFrame ``chunks`` as if they were one table.
+
+    Only per-column accumulators and row fingerprints are kept between chunks, so
+    memory is bounded by the chunk size and the number of distinct values rather
+    than by the size of the source. The result matches :func:`evaluate_data_quality`
+    on the concatenated frame. With ``distinct_error`` set, distinct values are
+    tracked in fixed-size cardinality sketches instead of exact sets. ``workers``
+    updates the column accumulators of each chunk on a thread pool. ``summary``
+    adds the mergeable numeric summary of :class:`SummaryAccumulator`, and
+    ``rules`` the rule results of :func:`evaluate_data_quality`.
+    """
+
+    accumulator = DatasetAccumulator(
+        sample_size=sample_size,
+        distinct_error=distinct_error,
+        duplicate_mode=duplicate_mode,
+        workers=workers,
+        summary=summary,
+        rules=rules,
+    )
+    try:
+        for chunk in chunks:
+            accumulator.update(chunk)
+        return accumulator.result()
+    finally:
+        accumulator.close()
+
+
+class ColumnAccumulator:
+    """Mergeable running state for the quality metrics of a single column.
+
+    Distinct values are tracked exactly in a set, or approximately in a
+    :class:`~quality_toolkit.sketches.HyperLogLog` when ``distinct_error`` is given.
+    """
+
+    __slots__ = (
+        "sample_size",
+        "distinct_error",
+        "row_count",
+        "missing_count",
+        "_dtype",
+        "_null_dtype",
+        "_distinct",
+        "_sketch",
+        "_samples",
     )
 
+    def __init__(self, sample_size: int = 5, distinct_error: Optional[float] = None) -> None:
+        if sample_size <= 0:
+            raise ValueError("sample_size must be positive")
+        self.sample_size = sample_size
+        self.distinct_error = distinct_error
+        self.row_count = 0
+        self.missing_count = 0
+        self._dtype: Optional[object] = None
+        self._null_dtype: Optional[object] = None
+        self._distinct: set = set()
+        self._sketch: Optional[HyperLogLog] = (
+            None if distinct_error is None else HyperLogLog.from_error(distinct_error)
+        )
+        self._samples: list = []
+
+    def update(
+        self,
+        series: pd.Series,
+        missing_count: Optional[int] = None,
+        factorized: Optional[Tuple[np.ndarray, Any]] = None,
+    ) -> None:
+        """Fold the values of ``series`` into the running state.
+
+        ``missing_count`` may be supplied when it is already known, for example from
+        Parquet footer statistics. A series known to hold only nulls is then not
+        read at all, and in approximate mode one known to hold none is hashed
+        without scanning for nulls. ``factorized`` is the :func:`factorize_column`
+        result of ``series`` when the caller already has it; exact mode then reads
+        it instead of factorizing again.
+        """
+
+        if missing_count is None or missing_count < len(series):
+            if self._sketch is None:
+                codes, uniques = factorize_column(series) if factorized is None else factorized
+                counted = int(np.count_nonzero(codes < 0))
+            else:
+                counted = self._sketch.update(series, missing_count)
+            if missing_count is None:
+                missing_count = counted
+        self.row_count += int(len(series))
+        self.missing_count += missing_count
+        if missing_count == len(series):
+            self._null_dtype = merge_dtype(self._null_dtype, series.dtype)
+            return
+
+        self._dtype = merge_dtype(self._dtype, series.dtype)
+        if self._sketch is None:
+            self._distinct.update(_numbers_from_text(uniques))
+            self._extend_samples(uniques[: self.sample_size])
+        elif len(self._samples) < self.sample_size:
+            self._extend_samples(collect_samples(series, self.sample_size))
+
+    def merge(self, other: ColumnAccumulator) -> None:
+        """Fold the state of ``other``, which saw rows after this accumulator's rows."""
+
+        self.row_count += other.row_count
+        self.missing_count += other.missing_count
+        if other._dtype is not None:
+            self._dtype = merge_dtype(self._dtype, other._dtype)
+        if other._null_dtype is not None:
+            self._null_dtype = merge_dtype(self._null_dtype, other._null_dtype)
+        if self._sketch is not None and other._sketch is not None:
+            self._sketch.merge(other._sketch)
+        elif self._sketch is None and other._sketch is None:
+            self._distinct.update(other._distinct)
+        else:
+            raise ValueError("Cannot merge exact and approximate distinct counts")
+        self._extend_samples(other._samples)
+
+    @property
+    def missing_ratio(self) -> float:
+        return float(self.missing_count / self.row_count) if self.row_count else 0.0
+
+    def result(self) -> ColumnQuality:
+        """Return the :class:`ColumnQuality` for everything seen so far."""
+
+        return ColumnQuality(
+            dtype=str(self._resolved_dtype()),
+            missing_count=self.missing_count,
+            missing_ratio=round(self.missing_ratio, 4),
+            distinct_count=len(self._distinct) if self._sketch is None else self._sketch.count(),
+            sample_values=[format_value(value) for value in self._samples],
+            distinct_is_estimate=self._sketch is not None,
+            distinct_error=0.0 if self._sketch is None else self._sketch.relative_error,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable form of the running state."""
+
+        distinct: Dict[str, list] = {}
+        for value in self._distinct:
+            kind, item = _encode_value(value)
+            distinct.setdefault(kind, []).append(item)
+        return {
+            "sample_size": self.sample_size,
+            "distinct_error": self.distinct_error,
+            "row_count": self.row_count,
+            "missing_count": self.missing_count,
+            "dtype": _encode_dtype(self._dtype),
+            "null_dtype": _encode_dtype(self._null_dtype),
+            "distinct": distinct,
+            "sketch": None if self._sketch is None else self._sketch.to_dict(),
+            "samples": [_encode_value(value) for value in self._samples],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> ColumnAccumulator:
+        accumulator = cls(int(data["sample_size"]), data["distinct_error"])
+        accumulator.row_count = int(data["row_count"])
+        accumulator.missing_count = int(data["missing_count"])
+        accumulator._dtype = _decode_dtype(data["dtype"])
+        accumulator._null_dtype = _decode_dtype(data["null_dtype"])
+        for kind, items in data["distinct"].items():
+            accumulator._distinct.update(_decode_value(kind, item) for item in items)
+        if data["sketch"] is not None:
+            accumulator._sketch = HyperLogLog.from_dict(data["sketch"])
+        accumulator._samples = [_decode_value(kind, item) for kind, item in data["samples"]]
+        return accumulator
+
+    def _extend_samples(self, values: Iterable[object]) -> None:
+        for value in values:
+            if len(self._samples) >= self.sample_size:
+                return
+            if value not in self._samples:
+                self._samples.append(value)
+
+    def _resolved_dtype(self) -> object:
+        return resolve_dtype(self._dtype, self._null_dtype, self.missing_count)
+
+
+class DatasetAccumulator:
+    """Mergeable running state for :class:`DatasetQuality` across DataFrame chunks.
+
+    With ``workers`` greater than one, the column accumulators and the row
+    fingerprints of each chunk are updated concurrently on a thread pool. Threads
+    are used because the accumulators live in this process and the vectorized
+    kernels behind them release the GIL. With ``summary`` a
+    :class:`SummaryAccumulator` also summarizes the numeric columns, and with
+    ``rules`` a :class:`~quality_toolkit.rules.RuleAccumulator` counts rule
+    violations in the same pass over each chunk.
+    """
+
+    def __init__(
+        self,
+        sample_size: int = 5,
+        distinct_error: Optional[float] = None,
+        duplicate_mode: str = "exact",
+        workers: Optional[int] = None,
+        summary: bool = False,
+        rules: Optional[RuleSet] = None,
+    ) -> None:
+        if sample_size <= 0:
+            raise ValueError("sample_size must be positive")
+        if duplicate_mode not in DUPLICATE_MODES:
+            raise ValueError(f"Unknown duplicate mode: {duplicate_mode}")
+        self.sample_size = sample_size
+        self.distinct_error = distinct_error
+        self.duplicate_mode = duplicate_mode
+        self.row_count = 0
+        self.columns: Dict[str, ColumnAccumulator] = {}
+        self.duplicates = create_duplicate_detector(duplicate_mode)
+        self.summary = SummaryAccumulator() if summary else None
+        self.rules: Optional[RuleAccumulator] = None
+        if rules is not None:
+            from .rules import RuleAccumulator
+
+            self.rules = RuleAccumulator(rules, workers=workers)
+        pool_size = resolve_workers(workers)
+        self._pool = ThreadPoolExecutor(max_workers=pool_size) if pool_size > 1 else None
+
+    @property
+    def duplicate_rows(self) -> int:
+        return self.duplicates.duplicate_rows
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
+    def update(
+        self,
+        chunk: pd.DataFrame,
+        missing_counts: Optional[Dict[str, Optional[int]]] = None,
+        factorized: Optional[Mapping[Any, Tuple[np.ndarray, Any]]] = None,
+    ) -> None:
+        """Fold the rows of ``chunk`` into the running state.
+
+        ``missing_counts`` optionally maps columns to null counts that are already
+        known for this chunk, and ``factorized`` to :func:`factorize_column`
+        results that exact mode then reads instead of factorizing again, so one
+        factorization can also feed a :class:`~quality_toolkit.drift.ProfileAccumulator`.
+        In exact mode the rules reuse the factorization of each column they
+        check from the column profile, so the rules run after the column updates
+        of the chunk.
+        """
+
+        known = missing_counts or {}
+        for column in chunk.columns:
+            if column not in self.columns:
+                self.columns[column] = ColumnAccumulator(self.sample_size, self.distinct_error)
+
+        shared = dict(factorized or {})
+        if self._pool is None:
+            for column in chunk.columns:
+                self._update_column(chunk[column], column, known.get(column), shared)
+            self._add_fingerprints(chunk)
+            if self.summary is not None:
+                self.summary.update(chunk)
+            if self.rules is not None:
+                self.rules.update(chunk, shared)
+        else:
+            futures = [self._pool.submit(self._add_fingerprints, chunk)]
+            if self.summary is not None:
+                futures.append(self._pool.submit(self.summary.update, chunk))
+            columns = [
+                self._pool.submit(
+                    self._update_column, chunk[column], column, known.get(column), shared
+                )
+                for column in chunk.columns
+            ]
+            for future in columns:
+                future.result()
+            if self.rules is not None:
+                self.rules.update(chunk, shared)
+            for future in futures:
+                future.result()
+        self.row_count += int(len(chunk))
+
+    def _update_column(
+        self,
+        series: pd.Series,
+        column: Any,
+        missing_count: Optional[int],
+        factorized: Dict[Any, Tuple[np.ndarray, Any]],
+    ) -> None:
+        pair = factorized.get(column)
+        checked = self.rules is not None and column in self.rules.columns
+        # Exact mode factorizes every column that is not known to be all null.
+        factorizes = self.distinct_error is None and missing_count != len(series)
+        if pair is None and checked and factorizes:
+            pair = factorized[column] = factorize_column(series)
+        self.columns[column].update(series, missing_count, pair)
+
+    def _add_fingerprints(self, chunk: pd.DataFrame) -> None:
+        if len(chunk):
+            self.duplicates.add(row_fingerprints(chunk))
+
+    def merge(self, other: DatasetAccumulator) -> None:
+        """Fold the state of ``other``, which saw rows after this accumulator's rows."""
+
+        for column, column_accumulator in other.columns.items():
+            if column in self.columns:
+                self.columns[column].merge(column_accumulator)
+            else:
+                self.columns[column] = column_accumulator
+        self.duplicates.merge(other.duplicates)
+        if self.summary is not None and other.summary is not None:
+            self.summary.merge(other.summary)
+        if self.rules is not None and other.rules is not None:
+            self.rules.merge(other.rules)
+        self.row_count += other.row_count
+
+    def close(self) -> None:
+        """Release resources such as the worker pool and duplicate-detector spill files."""
+
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self.rules is not None:
+            self.rules.close()
+        close = getattr(self.duplicates, "close", None)
+        if close is not None:
+            close()
+
+    def result(self) -> DatasetQuality:
+        """Return the :class:`DatasetQuality` for everything seen so far."""
+
+        warnings: List[str] = []
+        columns: Dict[str, ColumnQuality] = {}
+        if self.row_count == 0:
+            warnings.append("Dataset contains no rows.")
+
+        for column, column_accumulator in self.columns.items():
+            columns[column] = column_accumulator.result()
+            if column_accumulator.missing_ratio > MISSING_RATIO_WARNING_THRESHOLD:
+                warnings.append(_missing_warning(column, column_accumulator.missing_ratio))
+
+        quality = DatasetQuality(
+            row_count=self.row_count,
+            duplicate_rows=self.duplicate_rows,
+            columns=columns,
+            warnings=warnings,
+            duplicates_are_estimate=self.duplicate_mode == "approximate",
+            duplicate_false_positive_rate=self.duplicates.false_positive_rate,
+            summary=None if self.summary is None else self.summary.result(),
+        )
+        if self.rules is not None:
+            quality = with_rule_results(quality, self.rules.result())
+        return quality
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable form of the running state, for :meth:`from_dict`."""
+
+        return {
+            "sample_size": self.sample_size,
+            "distinct_error": self.distinct_error,
+            "duplicate_mode": self.duplicate_mode,
+            "row_count": self.row_count,
+            "columns": [[column, state.to_dict()] for column, state in self.columns.items()],
+            "duplicates": self.duplicates.to_dict(),
+            "summary": None if self.summary is None else self.summary.to_dict(),
+            "rules": None if self.rules is None else self.rules.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], workers: Optional[int] = None) -> DatasetAccumulator:
+        """Rebuild an accumulator saved with :meth:`to_dict`."""
+
+        accumulator = cls(
+            sample_size=int(data["sample_size"]),
+            distinct_error=data["distinct_error"],
+            duplicate_mode=data["duplicate_mode"],
+            workers=workers,
+        )
+        accumulator.row_count = int(data["row_count"])
+        accumulator.columns = {
+            column: ColumnAccumulator.from_dict(state) for column, state in data["columns"]
+        }
+        detector = type(accumulator.duplicates)
+        accumulator.duplicates = detector.from_dict(data["duplicates"])
+        if data["summary"] is not None:
+            accumulator.summary = SummaryAccumulator.from_dict(data["summary"])
+        if data["rules"] is not None:
+            from .rules import RuleAccumulator
+
+            accumulator.rules = RuleAccumulator.from_dict(data["rules"], workers=workers)
+        return accumulator
+
+
+class SummaryAccumulator:
+    """Mergeable numeric summary of DataFrame chunks or partitions.
+
+    Each numeric column keeps :class:`~quality_toolkit.sketches.StreamingMoments`
+    for count, mean, standard deviation, minimum and maximum, and a
+    :class:`~quality_toolkit.sketches.KLLSketch` for ``percentiles``, so memory
+    does not grow with the number of rows. Count, mean, spread and extremes are
+    exact up to floating-point rounding; quantiles are exact until a column's
+    sketch first compacts and afterwards within ``quantile_error`` in rank. A
+    column stops being summarized once a chunk holds non-numeric values for it.
+    """
+
+    def __init__(
+        self,
+        quantile_error: float = DEFAULT_QUANTILE_ERROR,
+        percentiles: Sequence[float] = SUMMARY_PERCENTILES,
+    ) -> None:
+        KLLSketch.from_error(quantile_error)  # validates the error bound
+        self.quantile_error = quantile_error
+        self.percentiles = tuple(percentiles)
+        self.row_count = 0
+        self._moments: Dict[Any, StreamingMoments] = {}
+        self._sketches: Dict[Any, KLLSketch] = {}
+        self._rejected: set = set()
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        for column in chunk.columns:
+            if column in self._rejected:
+                continue
+            series = chunk[column]
+            if not is_summary_numeric(series.dtype):
+                if series.notna().any():
+                    self._reject(column)
+                continue
+            values = series.to_numpy(dtype="float64", na_value=np.nan)
+            values = values[~np.isnan(values)]
+            if column not in self._moments:
+                self._moments[column] = StreamingMoments()
+                self._sketches[column] = KLLSketch.from_error(self.quantile_error)
+            self._moments[column].update(values)
+            self._sketches[column].update(values)
+        self.row_count += int(len(chunk))
+
+    def merge(self, other: SummaryAccumulator) -> None:
+        """Fold the state of ``other``; both must use the same error and percentiles."""
+
+        if (other.quantile_error, other.percentiles) != (self.quantile_error, self.percentiles):
+            raise ValueError("Cannot merge summaries with different quantile settings")
+        for column in other._rejected:
+            self._reject(column)
+        for column, moments in other._moments.items():
+            if column in self._rejected:
+                continue
+            if column in self._moments:
+                self._moments[column].merge(moments)
+                self._sketches[column].merge(other._sketches[column])
+            else:
+                self._moments[column] = moments
+                self._sketches[column] = other._sketches[column]
+        self.row_count += other.row_count
+
+    def result(self) -> Dict[str, ColumnSummary]:
+        summaries: Dict[str, ColumnSummary] = {}
+        for column, moments in self._moments.items():
+            sketch = self._sketches[column]
+            values = sketch.quantiles(self.percentiles)
+            empty = moments.count == 0
+            summaries[column] = ColumnSummary(
+                count=moments.count,
+                mean=math.nan if empty else moments.mean,
+                std=moments.std,
+                min=math.nan if empty else moments.minimum,
+                max=math.nan if empty else moments.maximum,
+                quantiles={
+                    _percentile_label(percentile): float(value)
+                    for percentile, value in zip(self.percentiles, values)
+                },
+                quantile_error=sketch.rank_error,
+            )
+        return summaries
 
-def calculate_summary_statistics(df: pd.DataFrame) -> pd.DataFrame:
-    """Return numeric summary statistics for ``df``."""
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "quantile_error": self.quantile_error,
+            "percentiles": list(self.percentiles),
+            "row_count": self.row_count,
+            "columns": [
+                [column, moments.to_dict(), self._sketches[column].to_dict()]
+                for column, moments in self._moments.items()
+            ],
+            "rejected": list(self._rejected),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> SummaryAccumulator:
+        summary = cls(float(data["quantile_error"]), data["percentiles"])
+        summary.row_count = int(data["row_count"])
+        for column, moments, sketch in data["columns"]:
+            summary._moments[column] = StreamingMoments.from_dict(moments)
+            summary._sketches[column] = KLLSketch.from_dict(sketch)
+        summary._rejected = set(data["rejected"])
+        return summary
+
+    def _reject(self, column: Any) -> None:
+        self._rejected.add(column)
+        self._moments.pop(column, None)
+        self._sketches.pop(column, None)
+
+
+def summary_frame(summaries: Dict[str, ColumnSummary], row_count: int) -> pd.DataFrame:
+    """Lay ``summaries`` out like :func:`calculate_summary_statistics` does."""
+
+    records = []
+    for summary in summaries.values():
+        record: Dict[str, Any] = {"count": float(summary.count), "mean": summary.mean}
+        record["std"] = summary.std
+        record["min"] = summary.min
+        record.update(summary.quantiles)
+        record["max"] = summary.max
+        record["missing_count"] = row_count - summary.count
+        record["missing_ratio"] = (row_count - summary.count) / row_count if row_count else 0.0
+        records.append(record)
+    return pd.DataFrame.from_records(records, index=list(summaries))
+
+
+class ColumnProfileCache:
+    """Memoized column profiles of one dataset for evaluating many column subsets.
+
+    A column's :class:`ColumnQuality` does not depend on which other columns are
+    evaluated, so each column is profiled the first time a subset includes it and
+    reused afterwards. Only the duplicate count depends on the subset; it is folded
+    from per-column row hashes, which are kept while they fit in ``max_hash_bytes``.
+    Every frame passed to :meth:`evaluate` must hold the same rows, so create a new
+    cache when a different dataset is loaded.
+    """
+
+    def __init__(
+        self,
+        sample_size: int = 5,
+        *,
+        distinct_error: Optional[float] = None,
+        duplicate_mode: str = "exact",
+        max_hash_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        if sample_size <= 0:
+            raise ValueError("sample_size must be positive")
+        if duplicate_mode not in DUPLICATE_MODES:
+            raise ValueError(f"Unknown duplicate mode: {duplicate_mode}")
+        self.sample_size = sample_size
+        self.distinct_error = distinct_error
+        self.duplicate_mode = duplicate_mode
+        self.max_hash_bytes = max_hash_bytes
+        self._profiles: Dict[object, ColumnQuality] = {}
+        self._hashes: Dict[object, np.ndarray] = {}
+        self._duplicates: Dict[frozenset, Tuple[int, float]] = {}
+
+    def __contains__(self, column: object) -> bool:
+        return column in self._profiles
+
+    def evaluate(
+        self,
+        df: pd.DataFrame,
+        columns: Optional[Sequence[object]] = None,
+        *,
+        on_column: Optional[Callable[[object, ColumnQuality], None]] = None,
+    ) -> DatasetQuality:
+        """Return the :class:`DatasetQuality` of ``columns`` of ``df`` (all by default).
+
+        Columns are read from ``df`` one at a time, so no subset of the frame is
+        copied. ``on_column`` behaves as in :func:`evaluate_data_quality`.
+        """
+
+        selected = list(df.columns) if columns is None else list(columns)
+        row_count = int(len(df))
+        warnings: List[str] = []
+        profiles: Dict[object, ColumnQuality] = {}
+        if row_count == 0:
+            warnings.append("Dataset contains no rows.")
+
+        for column in selected:
+            column_quality = self._profiles.get(column)
+            if column_quality is None:
+                column_quality = profile_column(df[column], self.sample_size, self.distinct_error)
+                self._profiles[column] = column_quality
+            profiles[column] = column_quality
+            if on_column is not None:
+                on_column(column, column_quality)
+            missing_ratio = float(column_quality.missing_count / row_count) if row_count else 0.0
+            if missing_ratio > MISSING_RATIO_WARNING_THRESHOLD:
+                warnings.append(_missing_warning(column, missing_ratio))
+
+        key = frozenset(selected)
+        if key not in self._duplicates:
+            detector = create_duplicate_detector(self.duplicate_mode)
+            fingerprints = fold_column_hashes(
+                (self._column_hashes(df, column) for column in selected), row_count
+            )
+            duplicate_rows = detector.add(fingerprints) if row_count else 0
+            self._duplicates[key] = (duplicate_rows, detector.false_positive_rate)
+        duplicate_rows, false_positive_rate = self._duplicates[key]
+
+        return DatasetQuality(
+            row_count=row_count,
+            duplicate_rows=duplicate_rows,
+            columns=profiles,
+            warnings=warnings,
+            duplicates_are_estimate=self.duplicate_mode == "approximate",
+            duplicate_false_positive_rate=false_positive_rate,
+        )
+
+    def _column_hashes(self, df: pd.DataFrame, column: object) -> np.ndarray:
+        hashes = self._hashes.get(column)
+        if hashes is None:
+            hashes = hash_series(df[column])
+            held = sum(array.nbytes for array in self._hashes.values())
+            if held + hashes.nbytes <= self.max_hash_bytes:
+                self._hashes[column] = hashes
+        return hashes
+
+
+def calculate_summary_statistics(
+    df: pd.DataFrame, *, quantile_error: Optional[float] = None
+) -> pd.DataFrame:
+    """Return numeric summary statistics for ``df``.
+
+    By default the percentiles are exact (:meth:`pandas.DataFrame.describe`).
+    With ``quantile_error`` the table is built by a :class:`SummaryAccumulator`
+    instead, whose percentiles come from quantile sketches within that rank error.
+    """
 
     if df.empty:
         raise ValueError("Cannot compute summary statistics on an empty DataFrame")
+    if quantile_error is not None:
+        return calculate_summary_statistics_chunks([df], quantile_error=quantile_error)
 
     numeric_df = df.select_dtypes(include="number")
     if numeric_df.empty:
@@ -86,7 +1119,70 @@ def calculate_summary_statistics(df: pd.DataFrame) -> pd.DataFrame:
     return summary
 
 
-def _format_value(value: object) -> str:
-    if isinstance(value, float):
-        return f"{value:.6g}"
-    return str(value)
+def calculate_summary_statistics_chunks(
+    chunks: Iterable[pd.DataFrame], *, quantile_error: float = DEFAULT_QUANTILE_ERROR
+) -> pd.DataFrame:
+    """Return the :func:`calculate_summary_statistics` table for a stream of ``chunks``.
+
+    Memory is bounded by the chunk size and the sketch size; percentiles are
+    estimated within ``quantile_error`` in rank.
+    """
+
+    accumulator = SummaryAccumulator(quantile_error)
+    for chunk in chunks:
+        accumulator.update(chunk)
+    if accumulator.row_count == 0:
+        raise ValueError("Cannot compute summary statistics on an empty DataFrame")
+    summaries = accumulator.result()
+    if not summaries:
+        raise ValueError("DataFrame does not contain numeric columns")
+    return summary_frame(summaries, accumulator.row_count)
+
+
+def _percentile_label(percentile: float) -> str:
+    return f"{percentile * 100:g}%"
+
+
+def _missing_warning(column: object, missing_ratio: float) -> str:
+    return f"Column '{column}' has {missing_ratio:.0%} missing values."
+
+
+def _numbers_from_text(uniques: Any) -> Any:
+    # Chunks parse a column as numbers or as text depending on their values, so
+    # text that spells a number is stored as that number to compare equal to it.
+    integer_positions, integers, float_positions, floats = find_numeric_text(uniques)
+    if not len(integer_positions) and not len(float_positions):
+        return uniques
+    values = np.asarray(uniques, dtype=object).copy()
+    values[integer_positions] = integers.tolist()
+    values[float_positions] = floats.tolist()
+    return values
+
+
+def _encode_value(value: object) -> Tuple[str, Any]:
+    # Distinct values and samples keep their Python type so that 1, 1.5 and "1.5"
+    # still compare the same way after a round trip through JSON.
+    if isinstance(value, (bool, np.bool_)):
+        return "bool", bool(value)
+    if isinstance(value, (int, np.integer)):
+        return "int", int(value)
+    if isinstance(value, (float, np.floating)):
+        return "float", float(value)
+    if isinstance(value, str):
+        return "str", value
+    raise ValueError(f"Cannot serialize values of type {type(value).__name__}")
+
+
+def _decode_value(kind: str, item: Any) -> object:
+    types = {"bool": bool, "int": int, "float": float, "str": str}
+    if kind not in types:
+        raise ValueError(f"Unknown value kind: {kind}")
+    return types[kind](item)
+
+
+def _encode_dtype(dtype: Optional[object]) -> Optional[str]:
+    return None if dtype is None else str(dtype)
+
+
+def _decode_dtype(name: Optional[str]) -> Optional[object]:
+    return None if name is None else pd.api.types.pandas_dtype(name)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import glob
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from .analysis import DatasetQuality
+from .data_loader import SUPPORTED_EXCEL_SUFFIXES, SUPPORTED_TEXT_SUFFIXES
+from .parallel import process_pool, resolve_workers
+from .pipeline import evaluate_file
+
+SUPPORTED_SUFFIXES = SUPPORTED_TEXT_SUFFIXES | SUPPORTED_EXCEL_SUFFIXES | {".parquet"}
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Outcome of evaluating one file of a batch; ``quality`` is ``None`` on failure."""
+
+    path: Path
+    quality: Optional[DatasetQuality]
+    error: Optional[str]
+    seconds: float
+
+
+@dataclass(frozen=True)
+class BatchProgress:
+    """Running totals reported after each file of a batch completes."""
+
+    completed: int
+    total: int
+    failed: int
+    rows: int
+    elapsed: float
+    latest: BatchResult
+
+    @property
+    def files_per_second(self) -> float:
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def expand_sources(sources: Iterable[str | Path]) -> List[Path]:
+    """Resolve files, directories and glob patterns into a sorted, de-duplicated file list.
+
+    Directories are searched recursively for supported file types. Patterns that
+    match nothing and paths that do not exist raise :class:`FileNotFoundError`.
+    """
+
+    files: Dict[Path, None] = {}
+    for source in sources:
+        candidate = Path(source)
+        if candidate.is_file():
+            files.setdefault(candidate, None)
+        elif candidate.is_dir():
+            for path in sorted(candidate.rglob("*")):
+                if path.is_file() and path.suffix.lower() in SUPPORTED_SUFFIXES:
+                    files.setdefault(path, None)
+        else:
+            matches = sorted(glob.glob(str(source), recursive=True))
+            matched_files = [Path(match) for match in matches if Path(match).is_file()]
+            if not matched_files:
+                raise FileNotFoundError(f"Dataset not found: {source}")
+            for path in matched_files:
+                files.setdefault(path, None)
+    return list(files)
+
+
+def evaluate_batch(
+    paths: Sequence[str | Path],
+    *,
+    workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    progress: Optional[Callable[[BatchProgress], None]] = None,
+    **options: Any,
+) -> List[BatchResult]:
+    """Evaluate many files with :func:`evaluate_file` on a process pool.
+
+    At most ``max_in_flight`` files (twice the pool size by default) are submitted
+    at once, which bounds the memory held by queued work. Each process imports
+    pandas once and then handles many files. A file that fails to load or evaluate
+    is recorded with its error and does not stop the batch. Results are returned in
+    the order of ``paths``; ``progress`` is called after every completed file.
+    """
+
+    targets = [Path(path) for path in paths]
+    pool_size = resolve_workers(workers)
+    limit = max_in_flight or pool_size * 2
+    if limit <= 0:
+        raise ValueError("max_in_flight must be positive")
+
+    results: Dict[int, BatchResult] = {}
+    started = time.perf_counter()
+    rows = 0
+    failed = 0
+
+    def record(index: int, result: BatchResult) -> None:
+        nonlocal rows, failed
+        results[index] = result
+        if result.quality is None:
+            failed += 1
+        else:
+            rows += result.quality.row_count
+        if progress is not None:
+            progress(
+                BatchProgress(
+                    completed=len(results),
+                    total=len(targets),
+                    failed=failed,
+                    rows=rows,
+                    elapsed=time.perf_counter() - started,
+                    latest=result,
+                )
+            )
+
+    if pool_size <= 1:
+        for index, target in enumerate(targets):
+            record(index, _evaluate_one(target, options))
+        return [results[index] for index in range(len(targets))]
+
+    with process_pool(pool_size) as pool:
+        pending: Dict[Future, int] = {}
+        queue = iter(enumerate(targets))
+        for index, target in queue:
+            pending[pool.submit(_evaluate_one, target, options)] = index
+            if len(pending) >= limit:
+                break
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                record(pending.pop(future), future.result())
+                for index, target in queue:
+                    pending[pool.submit(_evaluate_one, target, options)] = index
+                    break
+
+    return [results[index] for index in range(len(targets))]
+
+
+def _evaluate_one(path: Path, options: Dict[str, Any]) -> BatchResult:
+    started = time.perf_counter()
+    try:
+        quality = evaluate_file(path, **options)
+    except Exception as error:  # noqa: BLE001 - one bad file must not abort the batch
+        message = str(error) or type(error).__name__
+        return BatchResult(path, None, message, time.perf_counter() - started)
+    return BatchResult(path, quality, None, time.perf_counter() - started)
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+from .analysis import DatasetQuality
+
+CACHE_DIR_ENVIRONMENT_VARIABLE = "QUALITY_TOOLKIT_CACHE_DIR"
+CACHE_SUFFIX = ".json.gz"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 10_000
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Hit and miss counters of a :class:`ResultCache` plus its on-disk footprint."""
+
+    hits: int
+    misses: int
+    entries: int
+    size_bytes: int
+
+
+def default_cache_dir() -> Path:
+    """Return ``$QUALITY_TOOLKIT_CACHE_DIR`` or the per-user cache directory."""
+
+    configured = os.environ.get(CACHE_DIR_ENVIRONMENT_VARIABLE)
+    if configured:
+        return Path(configured)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "quality-toolkit"
+
+
+class ResultCache:
+    """On-disk cache of :class:`DatasetQuality` results keyed by file fingerprint.
+
+    Entries are gzip-compressed JSON files named after the key. Reading an entry
+    refreshes its modification time, and writing one evicts the least recently
+    used entries until the cache fits ``max_bytes`` and ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        if max_bytes <= 0 or max_entries <= 0:
+            raise ValueError("max_bytes and max_entries must be positive")
+        self.directory = Path(directory) if directory is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._hits = 0
+        self._misses = 0
+
+    def key(
+        self,
+        path: str | Path,
+        parameters: Mapping[str, Any],
+        *,
+        content_hash: bool = False,
+    ) -> str:
+        """Return the cache key for ``path`` evaluated with ``parameters``."""
+
+        from . import __version__
+
+        payload = {
+            "file": file_fingerprint(path, content_hash=content_hash),
+            "parameters": dict(parameters),
+            "version": __version__,
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str) -> Optional[DatasetQuality]:
+        """Return the cached result for ``key``, or ``None`` on a miss.
+
+        Entries that cannot be read back, such as ones written in an older layout,
+        count as misses and are removed.
+        """
+
+        entry = self._entry_path(key)
+        try:
+            with gzip.open(entry, "rt", encoding="utf-8") as handle:
+                quality = DatasetQuality.from_dict(json.load(handle))
+            os.utime(entry)
+        except FileNotFoundError:
+            self._misses += 1
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            entry.unlink(missing_ok=True)
+            self._misses += 1
+            return None
+        self._hits += 1
+        return quality
+
+    def put(self, key: str, quality: DatasetQuality) -> None:
+        """Store ``quality`` under ``key`` and evict old entries if needed."""
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        handle, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as stream:
+                json.dump(quality.to_dict(), stream, separators=(",", ":"), default=str)
+            os.replace(temporary, self._entry_path(key))
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+        self._evict()
+
+    def stats(self) -> CacheStats:
+        """Return hit/miss counters for this instance and the current cache size."""
+
+        entries = self._entries()
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            entries=len(entries),
+            size_bytes=sum(size for _, _, size in entries),
+        )
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+
+        for path, _, _ in self._entries():
+            path.unlink(missing_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}{CACHE_SUFFIX}"
+
+    def _entries(self) -> list[tuple[Path, float, int]]:
+        if not self.directory.is_dir():
+            return []
+        entries = []
+        for path in self.directory.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                status = path.stat()
+            except OSError:
+                continue
+            entries.append((path, status.st_mtime, status.st_size))
+        return entries
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+        while entries and (total > self.max_bytes or len(entries) > self.max_entries):
+            path, _, size = entries.pop(0)
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+def file_fingerprint(path: str | Path, *, content_hash: bool = False) -> Dict[str, Any]:
+    """Describe ``path`` by location, size and modification time, optionally its SHA-256."""
+
+    target = Path(path).resolve()
+    status = target.stat()
+    fingerprint: Dict[str, Any] = {
+        "path": str(target),
+        "size": status.st_size,
+        "mtime_ns": status.st_mtime_ns,
+    }
+    if content_hash:
+        digest = hashlib.sha256()
+        with target.open("rb") as handle:
+            for block in iter(lambda: handle.read(_HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        fingerprint["sha256"] = digest.hexdigest()
+    return fingerprint
@@ -1,15 +1,52 @@
 ﻿from __future__ import annotations
 
+import json
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
 import click
-from pandas.errors import EmptyDataError
 
-from .analysis import evaluate_data_quality
-from .data_loader import load_dataset
-from .report import build_markdown_report
+if TYPE_CHECKING:
+    from .analysis import DatasetQuality
+    from .batch import BatchProgress
+    from .drift import DatasetProfile
+
+# Mirrors the writers registered in ``quality_toolkit.writers``, which is imported
+# lazily so that ``--help`` does not load pandas.
+REPORT_FORMATS = ("markdown", "json", "jsonl", "parquet")
+# Files with this suffix are read as saved profiles by ``diff``; the thresholds
+# mirror the defaults of ``quality_toolkit.drift.compare_profiles``.
+PROFILE_SUFFIX = ".json"
+DEFAULT_SHIFT_THRESHOLD = 0.1
+DEFAULT_MISSING_THRESHOLD = 0.05
+
+
+class _DefaultGroup(click.Group):
+    """Group that runs ``default_command`` when the arguments do not start with a command."""
+
+    def __init__(self, *args: Any, default_command: str, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.default_command = default_command
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        if not args or (args[0] not in self.commands and args[0] not in ctx.help_option_names):
+            args = [self.default_command, *args]
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=_DefaultGroup, default_command="evaluate")
+def main() -> None:
+    """Generate data-quality reports and compare datasets.
+
+    Without a command the arguments go to ``evaluate``, so ``quality-toolkit
+    data.csv`` still reports on ``data.csv``. Prefix a file named like a command
+    with ``./``.
+    """
 
 
-@click.command()
-@click.argument("source", type=click.Path(exists=True, dir_okay=False, path_type=str))
+@main.command("evaluate")
+@click.argument("sources", nargs=-1, required=True)
 @click.option(
     "--sample-size",
     default=5,
@@ -21,11 +58,289 @@ from .report import build_markdown_report
     default=None,
     help="Override the automatically detected delimiter.",
 )
-def main(source: str, sample_size: int, delimiter: str | None) -> None:
-    """Generate a quick data-quality report for ``source``."""
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Stream the file in chunks of this many rows to keep memory bounded.",
+)
+@click.option(
+    "--engine",
+    type=click.Choice(["pandas", "arrow"]),
+    default="pandas",
+    show_default=True,
+    help="CSV parser: pandas, or multi-threaded pyarrow on a memory-mapped file.",
+)
+@click.option(
+    "--optimize-memory",
+    is_flag=True,
+    help="Load with compact dtypes and report each column's memory before and after.",
+)
+@click.option(
+    "--columns",
+    default=None,
+    help="Comma-separated list of columns to evaluate; other columns are not decoded.",
+)
+@click.option(
+    "--sheet",
+    "sheets",
+    multiple=True,
+    help="Excel sheet to evaluate (repeat for several); defaults to the first sheet.",
+)
+@click.option(
+    "--all-sheets",
+    is_flag=True,
+    help="Evaluate every sheet of an Excel workbook, streaming them concurrently with --jobs.",
+)
+@click.option(
+    "--approx-distinct",
+    is_flag=True,
+    help="Estimate distinct counts with a HyperLogLog sketch instead of counting exactly.",
+)
+@click.option(
+    "--distinct-error",
+    type=click.FloatRange(min=0, max=1, min_open=True, max_open=True),
+    default=0.01,
+    show_default=True,
+    help="Relative standard error allowed for --approx-distinct estimates.",
+)
+@click.option(
+    "--duplicates",
+    "duplicate_mode",
+    type=click.Choice(["exact", "approximate"]),
+    default="exact",
+    show_default=True,
+    help="Track duplicate rows in an exact fingerprint set or an approximate Bloom filter.",
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Profile columns on this many workers; 0 uses every core.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Always re-evaluate instead of reusing results cached for unchanged files.",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=str),
+    default=None,
+    help="Directory for cached results (defaults to $QUALITY_TOOLKIT_CACHE_DIR or ~/.cache).",
+)
+@click.option(
+    "--hash-content",
+    is_flag=True,
+    help="Include a SHA-256 of the file contents in the cache key.",
+)
+@click.option(
+    "--incremental",
+    "state_file",
+    type=click.Path(dir_okay=False, path_type=str),
+    default=None,
+    help=(
+        "Keep state in this JSON file and parse only rows appended to a CSV since the last run. "
+        "A last line without a newline is counted once the file is unchanged between runs."
+    ),
+)
+@click.option(
+    "--report-dir",
+    type=click.Path(file_okay=False, path_type=str),
+    default=None,
+    help="In batch mode, write one report per file here and print only the summary table.",
+)
+@click.option(
+    "--format",
+    "format_name",
+    type=click.Choice(REPORT_FORMATS),
+    default="markdown",
+    show_default=True,
+    help="Report format; json, jsonl and parquet carry the metrics as typed fields.",
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, allow_dash=True, path_type=str),
+    default=None,
+    help="Write the report to this file instead of stdout.",
+)
+@click.option(
+    "--summary/--no-summary",
+    default=True,
+    show_default=True,
+    help="Add a numeric summary (mean, spread, sketched percentiles) to the report.",
+)
+@click.option(
+    "--rules",
+    "rules_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=str),
+    default=None,
+    help="Check the quality rules in this TOML or YAML file and report their violations.",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Print the time, rows and peak memory of each stage and column to stderr.",
+)
+@click.option(
+    "--profile-json",
+    type=click.Path(dir_okay=False, path_type=str),
+    default=None,
+    help="Write the profiled stages to this JSON file (implies --profile).",
+)
+def evaluate(
+    sources: tuple[str, ...],
+    sample_size: int,
+    delimiter: str | None,
+    chunk_size: int | None,
+    engine: str,
+    optimize_memory: bool,
+    columns: str | None,
+    sheets: tuple[str, ...],
+    all_sheets: bool,
+    approx_distinct: bool,
+    distinct_error: float,
+    duplicate_mode: str,
+    jobs: int,
+    no_cache: bool,
+    cache_dir: str | None,
+    hash_content: bool,
+    state_file: str | None,
+    report_dir: str | None,
+    format_name: str,
+    output: str | None,
+    summary: bool,
+    rules_path: str | None,
+    profile: bool,
+    profile_json: str | None,
+) -> None:
+    """Generate a quick data-quality report for ``SOURCES``.
+
+    A single file produces one report. Several files, directories or glob patterns
+    are evaluated as a batch on a pool of ``--jobs`` processes.
+    """
 
+    # pandas and the evaluation modules are imported here rather than at module
+    # level so that ``--help`` and usage errors return without loading them.
+    from pandas.errors import EmptyDataError
+
+    from .batch import expand_sources
+    from .cache import ResultCache
+    from .data_loader import DEFAULT_CHUNK_SIZE
+    from .incremental import evaluate_incremental
+    from .pipeline import evaluate_file, evaluate_sheets
+    from .profiling import Profiler
+    from .report import build_profile_table, build_sheets_report
+    from .writers import open_writer
+
+    try:
+        paths = expand_sources(sources)
+    except FileNotFoundError as error:
+        raise click.ClickException(str(error)) from error
+
+    rules = None
+    if rules_path is not None:
+        from .rules import load_rules
+
+        try:
+            rules = load_rules(rules_path)
+        except (ValueError, ImportError) as error:
+            raise click.ClickException(f"Invalid rule file: {error}") from error
+
+    profiling = profile or profile_json is not None
+    if format_name == "parquet" and output in (None, "-") and sys.stdout.isatty():
+        raise click.UsageError("--format parquet writes binary data; pass --output")
+    if len(sources) > 1 or len(paths) != 1 or not Path(sources[0]).is_file():
+        if profiling:
+            raise click.UsageError("--profile requires a single source file")
+        if state_file is not None:
+            raise click.UsageError("--incremental requires a single source file")
+        if all_sheets or len(sheets) > 1:
+            raise click.UsageError("Several sheets can only be evaluated for a single workbook")
+        options = {
+            "sample_size": sample_size,
+            "delimiter": delimiter,
+            "chunk_size": chunk_size,
+            "engine": engine,
+            "optimize_memory": optimize_memory,
+            "sheet_name": sheets[0] if sheets else None,
+            "columns": _parse_columns(columns),
+            "distinct_error": distinct_error if approx_distinct else None,
+            "duplicate_mode": duplicate_mode,
+            "cache": None if no_cache else ResultCache(cache_dir),
+            "content_hash": hash_content,
+            "summary": summary,
+            "rules": rules,
+        }
+        _run_batch(paths, jobs, report_dir, options, format_name, output)
+        return
+
+    source = str(paths[0])
+    if profiling and (state_file is not None or all_sheets or len(sheets) > 1):
+        raise click.UsageError("--profile cannot be combined with --incremental or several sheets")
+    profiler = Profiler() if profiling else None
     try:
-        dataset = load_dataset(source, delimiter=delimiter)
+        if all_sheets or len(sheets) > 1:
+            if state_file is not None:
+                raise click.UsageError("--incremental cannot be combined with several sheets")
+            qualities = evaluate_sheets(
+                source,
+                None if all_sheets else list(sheets),
+                workers=jobs,
+                chunk_size=chunk_size or DEFAULT_CHUNK_SIZE,
+                sample_size=sample_size,
+                columns=_parse_columns(columns),
+                distinct_error=distinct_error if approx_distinct else None,
+                duplicate_mode=duplicate_mode,
+                cache=None if no_cache else ResultCache(cache_dir),
+                content_hash=hash_content,
+                summary=summary,
+                rules=rules,
+            )
+            if format_name == "markdown":
+                _echo(build_sheets_report(source, qualities), output)
+            else:
+                reports = [(f"{source}#{name}", quality) for name, quality in qualities.items()]
+                _write_reports(format_name, output, reports)
+            return
+        if state_file is not None:
+            if columns is not None:
+                raise click.UsageError("--columns cannot be combined with --incremental")
+            if engine != "pandas" or optimize_memory:
+                raise click.UsageError(
+                    "--engine arrow and --optimize-memory cannot be combined with --incremental"
+                )
+            quality = evaluate_incremental(
+                source,
+                state_file,
+                sample_size=sample_size,
+                delimiter=delimiter,
+                distinct_error=distinct_error if approx_distinct else None,
+                duplicate_mode=duplicate_mode,
+                chunk_size=chunk_size or DEFAULT_CHUNK_SIZE,
+                summary=summary,
+                rules=rules,
+            )
+        else:
+            quality = evaluate_file(
+                source,
+                sample_size=sample_size,
+                delimiter=delimiter,
+                chunk_size=chunk_size,
+                engine=engine,
+                optimize_memory=optimize_memory,
+                sheet_name=sheets[0] if sheets else None,
+                columns=_parse_columns(columns),
+                distinct_error=distinct_error if approx_distinct else None,
+                duplicate_mode=duplicate_mode,
+                workers=jobs,
+                cache=None if no_cache else ResultCache(cache_dir),
+                content_hash=hash_content,
+                profiler=profiler,
+                summary=summary,
+                rules=rules,
+            )
     except FileNotFoundError as error:
         raise click.ClickException(str(error)) from error
     except ValueError as error:
@@ -33,12 +348,237 @@ def main(source: str, sample_size: int, delimiter: str | None) -> None:
     except EmptyDataError as error:
         raise click.ClickException("The input file contains no rows.") from error
 
+    if profiler is None:
+        with open_writer(format_name, output) as writer:
+            writer.write(quality, source=source)
+        return
+    with (
+        profiler,
+        profiler.span("report.render", rows=quality.row_count),
+        open_writer(format_name, output) as writer,
+    ):
+        writer.write(quality, source=source)
+    if profile_json is not None:
+        spans = [span.to_dict() for span in profiler.spans]
+        Path(profile_json).write_text(json.dumps(spans, indent=2) + "\n", encoding="utf-8")
+    if profile:
+        click.echo(build_profile_table(profiler.spans), err=True)
+
+
+@main.command("diff")
+@click.argument("old", type=click.Path(exists=True, dir_okay=False, path_type=str))
+@click.argument("new", type=click.Path(exists=True, dir_okay=False, path_type=str))
+@click.option(
+    "--save-profile",
+    type=click.Path(dir_okay=False, path_type=str),
+    default=None,
+    help="Save the profile of NEW to this JSON file, to use as the next baseline.",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Rows per chunk when profiling a data file.",
+)
+@click.option(
+    "--delimiter",
+    default=None,
+    help="Override the automatically detected delimiter.",
+)
+@click.option(
+    "--columns",
+    default=None,
+    help="Comma-separated list of columns to compare.",
+)
+@click.option(
+    "--sheet",
+    default=None,
+    help="Excel sheet to profile; defaults to the first sheet.",
+)
+@click.option(
+    "--shift-threshold",
+    type=click.FloatRange(min=0, max=1),
+    default=DEFAULT_SHIFT_THRESHOLD,
+    show_default=True,
+    help="Flag columns whose distribution distance exceeds this.",
+)
+@click.option(
+    "--missing-threshold",
+    type=click.FloatRange(min=0, max=1),
+    default=DEFAULT_MISSING_THRESHOLD,
+    show_default=True,
+    help="Flag columns whose missing ratio moves by more than this.",
+)
+@click.option(
+    "--format",
+    "format_name",
+    type=click.Choice(["markdown", "json"]),
+    default="markdown",
+    show_default=True,
+    help="Report format.",
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, allow_dash=True, path_type=str),
+    default=None,
+    help="Write the report to this file instead of stdout.",
+)
+@click.option(
+    "--fail-on-drift",
+    is_flag=True,
+    help="Exit with an error when any column is flagged.",
+)
+def diff(
+    old: str,
+    new: str,
+    save_profile: str | None,
+    chunk_size: int | None,
+    delimiter: str | None,
+    columns: str | None,
+    sheet: str | None,
+    shift_threshold: float,
+    missing_threshold: float,
+    format_name: str,
+    output: str | None,
+    fail_on_drift: bool,
+) -> None:
+    """Compare dataset ``OLD`` with ``NEW`` through compact sketch profiles.
+
+    Each side is a data file, profiled in a single streaming pass, or a ``.json``
+    profile written by ``--save-profile``. Comparing against a saved baseline
+    therefore reads only the new file. The report lists per-column changes in
+    dtype, missing ratio, distinct count and value distribution.
+    """
+
+    from pandas.errors import EmptyDataError
+
+    from .data_loader import DEFAULT_CHUNK_SIZE
+    from .drift import compare_profiles
+    from .report import build_diff_report
+
+    options = {
+        "chunk_size": chunk_size or DEFAULT_CHUNK_SIZE,
+        "delimiter": delimiter,
+        "sheet_name": sheet,
+        "columns": _parse_columns(columns),
+    }
     try:
-        quality = evaluate_data_quality(dataset, sample_size=sample_size)
-    except ValueError as error:
+        baseline = _load_profile(old, options)
+        current = _load_profile(new, options)
+    except (FileNotFoundError, ValueError) as error:
         raise click.ClickException(str(error)) from error
+    except EmptyDataError as error:
+        raise click.ClickException("The input file contains no rows.") from error
+    if save_profile is not None:
+        current.save(save_profile)
+
+    result = compare_profiles(
+        baseline,
+        current,
+        shift_threshold=shift_threshold,
+        missing_threshold=missing_threshold,
+    )
+    if format_name == "json":
+        _echo(json.dumps(result.to_dict(), indent=2), output)
+    else:
+        _echo(build_diff_report(result), output)
+    if fail_on_drift and result.drifted:
+        flagged = sum(1 for column in result.columns if column.changes)
+        raise click.ClickException(f"{flagged} of {len(result.columns)} columns drifted.")
+
+
+def _load_profile(path: str, options: dict[str, Any]) -> DatasetProfile:
+    from .drift import DatasetProfile, profile_file
+
+    if Path(path).suffix.lower() != PROFILE_SUFFIX:
+        return profile_file(path, **options)
+    profile = DatasetProfile.load(path)
+    if options["columns"] is not None:
+        profile.columns = {
+            name: column for name, column in profile.columns.items() if name in options["columns"]
+        }
+    return profile
+
+
+def _run_batch(
+    paths: list[Path],
+    jobs: int,
+    report_dir: str | None,
+    options: dict[str, Any],
+    format_name: str,
+    output: str | None,
+) -> None:
+    from .batch import evaluate_batch
+    from .report import build_batch_report, build_batch_summary
+    from .writers import WRITERS, open_writer
+
+    def show_progress(progress: BatchProgress) -> None:
+        latest = progress.latest
+        status = "ok" if latest.error is None else f"error: {latest.error}"
+        click.echo(
+            f"[{progress.completed}/{progress.total}] {latest.path} {status} "
+            f"({progress.files_per_second:.1f} files/s, {progress.rows_per_second:,.0f} rows/s)",
+            err=True,
+        )
+
+    if format_name == "json" and report_dir is None:
+        raise click.UsageError("--format json holds one report; use jsonl or --report-dir")
+    results = evaluate_batch(paths, workers=jobs, progress=show_progress, **options)
+
+    if report_dir is None and format_name == "markdown":
+        _echo(build_batch_report(results), output)
+    elif report_dir is None:
+        reports = [
+            (str(result.path), result.quality) for result in results if result.quality is not None
+        ]
+        _write_reports(format_name, output, reports)
+    else:
+        directory = Path(report_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        used: set[str] = set()
+        suffix = WRITERS[format_name].suffix
+        for result in results:
+            if result.quality is None:
+                continue
+            name = result.path.stem
+            while name in used:
+                name = f"{name}_"
+            used.add(name)
+            with open_writer(format_name, directory / f"{name}{suffix}") as writer:
+                writer.write(result.quality, source=str(result.path), title=str(result.path))
+        _echo(build_batch_summary(results), output)
+
+    failures = sum(1 for result in results if result.error is not None)
+    if failures:
+        raise click.ClickException(f"{failures} of {len(results)} files could not be evaluated.")
+
+
+def _echo(text: str, output: str | None) -> None:
+    if output is None or output == "-":
+        click.echo(text)
+    else:
+        Path(output).write_text(text, encoding="utf-8")
+
+
+def _write_reports(
+    format_name: str, output: str | None, reports: list[tuple[str, DatasetQuality]]
+) -> None:
+    from .writers import open_writer
+
+    if format_name == "json" and len(reports) > 1:
+        raise click.UsageError("--format json holds one report; use jsonl or --report-dir")
+    with open_writer(format_name, output) as writer:
+        for source, quality in reports:
+            writer.write(quality, source=source, title=source)
+
 
-    click.echo(build_markdown_report(quality))
+def _parse_columns(columns: str | None) -> list[str] | None:
+    if columns is None:
+        return None
+    names = [name.strip() for name in columns.split(",") if name.strip()]
+    if not names:
+        raise click.BadParameter("expected at least one column name", param_hint="--columns")
+    return names
 
 
 if __name__ == "__main__":
@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+from dataclasses import fields
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional, Union
+
+import numpy as np
+
+from .analysis import ColumnQuality
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+# Array dtype of every ColumnQuality field except ``dtype`` and ``sample_values``.
+ARRAY_FIELDS: Dict[str, Any] = {
+    "missing_count": np.int64,
+    "missing_ratio": np.float64,
+    "distinct_count": np.int64,
+    "distinct_is_estimate": np.bool_,
+    "distinct_error": np.float64,
+    "memory_bytes": np.int64,
+    "default_memory_bytes": np.int64,
+}
+_OPTIONAL_FIELDS = ("memory_bytes", "default_memory_bytes")
+_MISSING = -1
+
+
+class StringArray:
+    """Strings packed as UTF-8 bytes plus ``n + 1`` offsets, the Arrow layout.
+
+    A few large buffers instead of one object per string, which is what makes
+    :class:`ColumnTable` cheap to pickle and to hand to Arrow.
+    """
+
+    __slots__ = ("data", "offsets")
+
+    def __init__(self, data: np.ndarray, offsets: np.ndarray) -> None:
+        self.data = data
+        self.offsets = offsets
+
+    @classmethod
+    def from_list(cls, values: List[str]) -> StringArray:
+        encoded = [value.encode("utf-8") for value in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, encoded), np.int64, len(encoded)), out=offsets[1:])
+        return cls(np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.data[start:end].tobytes().decode("utf-8")
+
+    def to_list(self) -> List[str]:
+        return self.slice_list(0, len(self))
+
+    def slice_list(self, start: int, stop: int) -> List[str]:
+        offsets = self.offsets[start : stop + 1] - self.offsets[start]
+        text = self.data[self.offsets[start] : self.offsets[stop]].tobytes()
+        return [text[offsets[i] : offsets[i + 1]].decode("utf-8") for i in range(stop - start)]
+
+    def filter(self, mask: np.ndarray) -> StringArray:
+        lengths = np.diff(self.offsets)
+        return StringArray(self.data[np.repeat(mask, lengths)], _offsets(lengths[mask]))
+
+    def take(self, indices: np.ndarray) -> StringArray:
+        starts = self.offsets[:-1][indices]
+        lengths = self.offsets[1:][indices] - starts
+        offsets = _offsets(lengths)
+        return StringArray(self.data[_ranges(starts, lengths)], offsets)
+
+    def to_arrow(self) -> pa.Array:
+        import pyarrow as pa
+
+        offsets = pa.py_buffer(self.offsets)
+        return pa.LargeStringArray.from_buffers(len(self), offsets, pa.py_buffer(self.data))
+
+
+class ColumnTable(Mapping[str, "ColumnView"]):
+    """Per-column metrics stored as one array per :class:`ColumnQuality` field.
+
+    The struct-of-arrays counterpart of ``DatasetQuality.columns`` for very wide
+    tables: a handful of NumPy arrays instead of one dataclass and one list of
+    samples per column. It is a read-only mapping from column name to
+    :class:`ColumnView`, which has the attributes of :class:`ColumnQuality`.
+    The field arrays are public for vectorized queries, for example
+    ``table.filter(table.missing_ratio > 0.1)``.
+
+    Names are stored as strings. ``memory_bytes`` and ``default_memory_bytes``
+    use ``-1`` for "not measured"; views translate it back to ``None``.
+    """
+
+    __slots__ = (
+        "names",
+        "dtype",
+        "missing_count",
+        "missing_ratio",
+        "distinct_count",
+        "distinct_is_estimate",
+        "distinct_error",
+        "memory_bytes",
+        "default_memory_bytes",
+        "sample_offsets",
+        "sample_values",
+        "_positions",
+    )
+
+    def __init__(
+        self,
+        names: StringArray,
+        dtype: StringArray,
+        arrays: Mapping[str, np.ndarray],
+        sample_offsets: np.ndarray,
+        sample_values: StringArray,
+    ) -> None:
+        self.names = names
+        self.dtype = dtype
+        for name in ARRAY_FIELDS:
+            setattr(self, name, arrays[name])
+        self.sample_offsets = sample_offsets
+        self.sample_values = sample_values
+        self._positions: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[Any, ColumnQuality]) -> ColumnTable:
+        """Pack ``columns`` (e.g. ``DatasetQuality.columns``) into arrays."""
+
+        qualities = list(columns.values())
+        count = len(qualities)
+
+        arrays = {}
+        for name, dtype in ARRAY_FIELDS.items():
+            values = (getattr(quality, name) for quality in qualities)
+            if name in _OPTIONAL_FIELDS:
+                values = (_MISSING if value is None else value for value in values)
+            arrays[name] = np.fromiter(values, dtype, count)
+        samples = [q.sample_values for q in qualities]
+        return cls(
+            StringArray.from_list([str(name) for name in columns]),
+            StringArray.from_list([q.dtype for q in qualities]),
+            arrays,
+            _offsets(np.fromiter(map(len, samples), np.int64, count)),
+            StringArray.from_list([value for values in samples for value in values]),
+        )
+
+    def to_columns(self) -> Dict[str, ColumnQuality]:
+        """Unpack into the ``Dict[str, ColumnQuality]`` form of ``DatasetQuality``."""
+
+        bounds = self.sample_offsets.tolist()
+        samples = self.sample_values.to_list()
+        values = [getattr(self, name).tolist() for name in ARRAY_FIELDS]
+        for name in _OPTIONAL_FIELDS:
+            position = list(ARRAY_FIELDS).index(name)
+            values[position] = [None if item == _MISSING else item for item in values[position]]
+        columns = {}
+        rows = zip(self.names.to_list(), self.dtype.to_list(), *values)
+        for index, (name, dtype, *metrics) in enumerate(rows):
+            # ARRAY_FIELDS is in ColumnQuality order, where the samples come fourth.
+            sample = samples[bounds[index] : bounds[index + 1]]
+            columns[name] = ColumnQuality(dtype, *metrics[:3], sample, *metrics[3:])
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names.to_list())
+
+    def __getitem__(self, key: Union[str, int]) -> ColumnView:
+        """Return the view of column ``key``, looked up by name or by position."""
+
+        if isinstance(key, (int, np.integer)):
+            if not -len(self) <= key < len(self):
+                raise IndexError(key)
+            return ColumnView(self, int(key) % len(self))
+        if self._positions is None:
+            self._positions = {name: index for index, name in enumerate(self)}
+        return ColumnView(self, self._positions[key])
+
+    def values(self) -> Iterator[ColumnView]:  # type: ignore[override]
+        return (ColumnView(self, index) for index in range(len(self)))
+
+    def filter(self, mask: np.ndarray) -> ColumnTable:
+        """Return the columns where the boolean ``mask`` is true, in table order."""
+
+        # Boolean masks over the byte buffers beat gathering them byte by byte.
+        mask = np.asarray(mask, dtype=np.bool_)
+        sample_counts = np.diff(self.sample_offsets)
+        arrays = {name: getattr(self, name)[mask] for name in ARRAY_FIELDS}
+        return ColumnTable(
+            self.names.filter(mask),
+            self.dtype.filter(mask),
+            arrays,
+            _offsets(sample_counts[mask]),
+            self.sample_values.filter(np.repeat(mask, sample_counts)),
+        )
+
+    def take(self, indices: np.ndarray) -> ColumnTable:
+        """Return the columns at ``indices``, e.g. from ``np.argsort`` of a field."""
+
+        indices = np.asarray(indices, dtype=np.int64)
+        starts = self.sample_offsets[:-1][indices]
+        lengths = self.sample_offsets[1:][indices] - starts
+        arrays = {name: getattr(self, name)[indices] for name in ARRAY_FIELDS}
+        return ColumnTable(
+            self.names.take(indices),
+            self.dtype.take(indices),
+            arrays,
+            _offsets(lengths),
+            self.sample_values.take(_ranges(starts, lengths)),
+        )
+
+    def to_arrow(self) -> pa.Table:
+        """Return an Arrow table with one row per column.
+
+        The string buffers and the integer and float arrays are wrapped rather
+        than copied; only ``distinct_is_estimate`` (bit-packed in Arrow) and the
+        validity bitmaps of the ``memory_bytes`` fields are built.
+        """
+
+        import pyarrow as pa
+
+        data: Dict[str, Any] = {"name": self.names.to_arrow(), "dtype": self.dtype.to_arrow()}
+        for name in ARRAY_FIELDS:
+            values = getattr(self, name)
+            mask = values == _MISSING if name in _OPTIONAL_FIELDS else None
+            data[name] = pa.array(values, mask=mask)
+        data["sample_values"] = pa.LargeListArray.from_arrays(
+            pa.array(self.sample_offsets), self.sample_values.to_arrow()
+        )
+        return pa.table(data)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return a DataFrame indexed by column name, without the sample values.
+
+        Numeric fields keep their NumPy arrays; the ``memory_bytes`` fields
+        become nullable ``Int64`` columns.
+        """
+
+        import pandas as pd
+
+        data: Dict[str, Any] = {"dtype": self.dtype.to_list()}
+        for name in ARRAY_FIELDS:
+            values = getattr(self, name)
+            if name in _OPTIONAL_FIELDS:
+                values = pd.arrays.IntegerArray(values, values == _MISSING)
+            data[name] = values
+        return pd.DataFrame(data, index=pd.Index(self.names.to_list(), name="name"), copy=False)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ColumnTable):
+            return NotImplemented
+        return self.to_columns() == other.to_columns()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__ if name != "_positions"}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._positions = None
+
+    def __repr__(self) -> str:
+        return f"ColumnTable({len(self)} columns)"
+
+
+def _field(name: str, convert: Any) -> property:
+    def get(view: ColumnView) -> Any:
+        return convert(getattr(view._table, name)[view._index])
+
+    return property(get)
+
+
+def _optional_field(name: str) -> property:
+    def get(view: ColumnView) -> Optional[int]:
+        value = int(getattr(view._table, name)[view._index])
+        return None if value == _MISSING else value
+
+    return property(get)
+
+
+class ColumnView:
+    """One column of a :class:`ColumnTable`, read like a :class:`ColumnQuality`.
+
+    Attributes are read from the table's arrays on access; a view compares equal
+    to the :class:`ColumnQuality` holding the same values.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    missing_count = _field("missing_count", int)
+    missing_ratio = _field("missing_ratio", float)
+    distinct_count = _field("distinct_count", int)
+    distinct_is_estimate = _field("distinct_is_estimate", bool)
+    distinct_error = _field("distinct_error", float)
+    memory_bytes = _optional_field("memory_bytes")
+    default_memory_bytes = _optional_field("default_memory_bytes")
+
+    def __init__(self, table: ColumnTable, index: int) -> None:
+        self._table = table
+        self._index = index
+
+    @property
+    def name(self) -> str:
+        return self._table.names[self._index]
+
+    @property
+    def dtype(self) -> str:
+        return self._table.dtype[self._index]
+
+    @property
+    def sample_values(self) -> List[str]:
+        offsets = self._table.sample_offsets
+        return self._table.sample_values.slice_list(
+            int(offsets[self._index]), int(offsets[self._index + 1])
+        )
+
+    def to_quality(self) -> ColumnQuality:
+        values = {item.name: getattr(self, item.name) for item in fields(ColumnQuality)}
+        return ColumnQuality(**values)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ColumnView):
+            other = other.to_quality()
+        if not isinstance(other, ColumnQuality):
+            return NotImplemented
+        return self.to_quality() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ColumnView({self.name!r}, {self.to_quality()!r})"
+
+
+def _offsets(lengths: np.ndarray) -> np.ndarray:
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def _ranges(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Concatenate ``range(start, start + length)`` for each pair, without a loop."""
+
+    total = int(lengths.sum())
+    if not total:
+        return np.zeros(0, dtype=np.int64)
+    shifts = np.repeat(starts - _offsets(lengths)[:-1], lengths)
+    return shifts + np.arange(total, dtype=np.int64)
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
 import csv
+import io
+import itertools
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
+from .profiling import Profiler, resolve_profiler
 
 SUPPORTED_EXCEL_SUFFIXES = {".xls", ".xlsx", ".xlsm"}
+STREAMING_EXCEL_SUFFIXES = {".xlsx", ".xlsm"}
+SUPPORTED_TEXT_SUFFIXES = {".csv", ".txt", ".tsv"}
+DEFAULT_CHUNK_SIZE = 100_000
+CSV_ENGINES = ("pandas", "arrow")
+COMPACT_SAMPLE_ROWS = 10_000
+CATEGORY_MAX_RATIO = 0.5
+DEFAULT_MEMORY_ATTR = "default_memory_bytes"
+_SNIFF_BYTES = 8192
 
 
 def load_dataset(
@@ -17,32 +30,594 @@ def load_dataset(
     encoding: str = "utf-8",
     delimiter: Optional[str] = None,
     sheet_name: str | int | None = None,
+    columns: Optional[Sequence[str]] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+    engine: str = "pandas",
+    optimize_memory: bool = False,
+    profiler: Optional[Profiler] = None,
 ) -> pd.DataFrame:
-    """Load a tabular file into a :class:`pandas.DataFrame`."""
+    """Load a tabular file into a :class:`pandas.DataFrame`.
 
+    ``columns`` restricts the load to those columns; Parquet files then decode
+    only the projected column chunks. ``progress`` is called with the bytes read
+    so far and the file size: repeatedly while a text file is parsed with the
+    pandas engine, and once when other loads finish. An exception raised by it
+    aborts the load.
+
+    ``engine="arrow"`` parses text files with the multi-threaded pyarrow CSV
+    reader from a memory-mapped file and returns Arrow-backed columns
+    (:class:`pandas.ArrowDtype`), which the analysis consumes without
+    converting them to ``object``.
+
+    With ``optimize_memory`` string columns become ``category`` when they have
+    few distinct values and Arrow strings otherwise, integers are downcast to the
+    smallest type that holds their range and floats to ``float32`` when that is
+    lossless. For CSV files the string dtypes are inferred from the first
+    ``COMPACT_SAMPLE_ROWS`` rows and applied while parsing, and numbers are
+    downcast chunk by chunk as the file is parsed. The per-column
+    footprint with default dtypes is stored in ``frame.attrs["default_memory_bytes"]``;
+    for CSV files it is extrapolated from the sample.
+
+    A :class:`~quality_toolkit.profiling.Profiler` records a ``load`` span with
+    ``load.sniff``, ``load.parse`` and ``load.compact`` sub-stages.
+    """
+
+    if engine not in CSV_ENGINES:
+        raise ValueError(f"Unknown CSV engine: {engine}")
     target = Path(path)
     if not target.exists():
         raise FileNotFoundError(f"Dataset not found: {target}")
 
+    profiler = resolve_profiler(profiler)
+    with profiler.span("load") as span:
+        frame = _load_frame(
+            target,
+            dtype=dtype,
+            encoding=encoding,
+            delimiter=delimiter,
+            sheet_name=sheet_name,
+            selected=None if columns is None else list(columns),
+            progress=progress,
+            engine=engine,
+            optimize_memory=optimize_memory,
+            profiler=profiler,
+        )
+        span.rows = len(frame)
+    return frame
+
+
+def _load_frame(
+    target: Path,
+    *,
+    dtype: Optional[Dict[str, str]],
+    encoding: str,
+    delimiter: Optional[str],
+    sheet_name: str | int | None,
+    selected: Optional[List[str]],
+    progress: Optional[Callable[[int, int], None]],
+    engine: str,
+    optimize_memory: bool,
+    profiler: Profiler,
+) -> pd.DataFrame:
     suffix = target.suffix.lower()
-    if suffix in {".csv", ".txt", ".tsv"}:
+    if suffix in SUPPORTED_TEXT_SUFFIXES and engine == "arrow":
+        with profiler.span("load.parse") as span:
+            frame = _read_csv_arrow(
+                target, dtype=dtype, encoding=encoding, delimiter=delimiter, columns=selected
+            )
+            span.rows = len(frame)
+    elif suffix in SUPPORTED_TEXT_SUFFIXES:
+        resolved_delimiter = delimiter
+        if resolved_delimiter is None:
+            with profiler.span("load.sniff"):
+                resolved_delimiter = _detect_delimiter(target)
+        options: Dict[str, Any] = {
+            "encoding": encoding,
+            "delimiter": resolved_delimiter,
+            "usecols": selected,
+        }
+        parse_dtype = dtype
+        sample = None
+        if optimize_memory:
+            with profiler.span("load.compact") as span:
+                sample = pd.read_csv(target, dtype=dtype, nrows=COMPACT_SAMPLE_ROWS, **options)
+                parse_dtype = {**infer_compact_dtypes(sample), **(dtype or {})}
+                span.rows = len(sample)
+        with profiler.span("load.parse") as span, target.open("rb") as handle:
+            source: Any = handle
+            if progress is not None:
+                size = target.stat().st_size
+                source = io.BufferedReader(_ProgressReader(handle, size, progress))
+            if sample is None:
+                frame = pd.read_csv(source, dtype=parse_dtype, **options)
+            else:
+                # Numbers are downcast chunk by chunk, so only one chunk is ever held
+                # at the default widths.
+                reader = pd.read_csv(
+                    source, dtype=parse_dtype, chunksize=DEFAULT_CHUNK_SIZE, **options
+                )
+                with reader:
+                    frame = _concat_chunks([downcast_numeric(chunk) for chunk in reader])
+            span.rows = len(frame)
+        frame = frame if selected is None else frame[selected]
+        if sample is None:
+            return frame
+        with profiler.span("load.compact", rows=len(frame)):
+            baseline = _memory_by_column(sample)
+            scale = len(frame) / len(sample) if len(sample) else 0.0
+            # Chunks may have settled on different widths; narrow the combined columns.
+            frame = downcast_numeric(frame)
+            frame.attrs[DEFAULT_MEMORY_ATTR] = {
+                column: round(bytes_used * scale) for column, bytes_used in baseline.items()
+            }
+        return frame
+    elif suffix == ".parquet":
+        if selected is not None:
+            _check_parquet_columns(target, selected)
+        with profiler.span("load.parse") as span:
+            frame = pd.read_parquet(target, columns=selected)
+            span.rows = len(frame)
+    elif suffix in SUPPORTED_EXCEL_SUFFIXES:
+        sheet = 0 if sheet_name is None else sheet_name
+        with profiler.span("load.parse") as span:
+            frame = pd.read_excel(target, dtype=dtype, sheet_name=sheet, usecols=selected)
+            span.rows = len(frame)
+        frame = frame if selected is None else frame[selected]
+    else:
+        raise ValueError(f"Unsupported file type: {suffix}")
+
+    if optimize_memory:
+        with profiler.span("load.compact", rows=len(frame)):
+            baseline = _memory_by_column(frame)
+            compact = infer_compact_dtypes(frame.head(COMPACT_SAMPLE_ROWS))
+            frame = downcast_numeric(frame.astype(compact))
+            frame.attrs[DEFAULT_MEMORY_ATTR] = baseline
+    if progress is not None:
+        size = target.stat().st_size
+        progress(size, size)
+    return frame
+
+
+def infer_compact_dtypes(sample: pd.DataFrame) -> Dict[str, str]:
+    """Return compact dtypes for the string columns of ``sample``.
+
+    Columns whose distinct values make up at most ``CATEGORY_MAX_RATIO`` of their
+    non-null values become ``category``; other ``object`` string columns become
+    Arrow strings when pyarrow is available. Columns that already use a string
+    dtype are not converted to another one, and columns with no values in the
+    sample are left as they are.
+    """
+
+    arrow_strings = _has_pyarrow()
+    dtypes: Dict[str, str] = {}
+    for column in sample.columns:
+        series = sample[column]
+        present = int(series.count())
+        if not present or not _is_string_column(series):
+            continue
+        if series.nunique(dropna=True) <= present * CATEGORY_MAX_RATIO:
+            dtypes[column] = "category"
+        elif arrow_strings and pd.api.types.is_object_dtype(series.dtype):
+            dtypes[column] = "string[pyarrow]"
+    return dtypes
+
+
+def downcast_numeric(frame: pd.DataFrame) -> pd.DataFrame:
+    """Downcast integer columns to their smallest type and floats to ``float32`` if lossless."""
+
+    converted: Dict[str, pd.Series] = {}
+    for column in frame.columns:
+        series = frame[column]
+        if not isinstance(series.dtype, np.dtype):
+            continue
+        if series.dtype.kind in "iu":
+            signed = series.dtype.kind == "i" and bool(len(series)) and series.min() < 0
+            converted[column] = pd.to_numeric(
+                series, downcast="integer" if signed else "unsigned"
+            )
+        elif series.dtype == np.float64:
+            narrow = series.astype(np.float32)
+            if (narrow.astype(np.float64) == series).sum() == series.count():
+                converted[column] = narrow
+    if not converted:
+        return frame
+    result = frame.copy(deep=False)
+    for column, series in converted.items():
+        result[column] = series
+    return result
+
+
+def _concat_chunks(chunks: List[pd.DataFrame]) -> pd.DataFrame:
+    # Each chunk infers its own categories, and categoricals with different
+    # categories concatenate to plain values, so align the categories first.
+    columns: Dict[Any, pd.Series] = {}
+    for column in chunks[0].columns:
+        parts = [chunk[column] for chunk in chunks]
+        if len(parts) > 1 and isinstance(parts[0].dtype, pd.CategoricalDtype):
+            known = [part.cat.categories for part in parts if len(part.cat.categories)]
+            if known:
+                categories = known[0].append(known[1:]).unique()
+                parts = [part.cat.set_categories(categories) for part in parts]
+        columns[column] = pd.concat(parts, ignore_index=True)
+    return pd.DataFrame(columns)
+
+
+def _is_string_column(series: pd.Series) -> bool:
+    if series.dtype == object:
+        return bool(series.dropna().map(type).eq(str).all())
+    return pd.api.types.is_string_dtype(series.dtype) and not isinstance(
+        series.dtype, pd.CategoricalDtype
+    )
+
+
+def _memory_by_column(frame: pd.DataFrame) -> Dict[str, int]:
+    usage = frame.memory_usage(deep=True, index=False)
+    return {column: int(usage[column]) for column in frame.columns}
+
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@dataclass(frozen=True)
+class ParquetStatistics:
+    """Metrics answered by a Parquet footer without decoding any column data.
+
+    Counts are ``None`` for columns whose row groups do not all carry statistics.
+    """
+
+    row_count: int
+    dtypes: Dict[str, str]
+    null_counts: Dict[str, Optional[int]]
+    distinct_counts: Dict[str, Optional[int]]
+    row_group_null_counts: List[Dict[str, Optional[int]]]
+    row_group_row_counts: List[int]
+
+
+def read_parquet_statistics(
+    path: str | Path, columns: Optional[Sequence[str]] = None
+) -> ParquetStatistics:
+    """Read row counts and per-column null/distinct statistics from a Parquet footer."""
+
+    import pyarrow.parquet as pq
+
+    target = Path(path)
+    if not target.exists():
+        raise FileNotFoundError(f"Dataset not found: {target}")
+
+    parquet_file = pq.ParquetFile(target)
+    schema = parquet_file.schema_arrow
+    selected = list(schema.names) if columns is None else list(columns)
+    _check_parquet_columns(target, selected, schema.names)
+    empty = schema.empty_table().select(selected).to_pandas()
+    metadata = parquet_file.metadata
+
+    row_group_null_counts: List[Dict[str, Optional[int]]] = []
+    distinct_counts: Dict[str, Optional[int]] = {}
+    for group_index in range(metadata.num_row_groups):
+        row_group = metadata.row_group(group_index)
+        statistics = {
+            row_group.column(index).path_in_schema: row_group.column(index).statistics
+            for index in range(row_group.num_columns)
+        }
+        group_nulls: Dict[str, Optional[int]] = {}
+        for name in selected:
+            stats = statistics.get(name)
+            has_nulls = stats is not None and stats.has_null_count
+            group_nulls[name] = stats.null_count if has_nulls else None
+            # Distinct counts of separate row groups cannot be added up.
+            if metadata.num_row_groups == 1 and stats is not None and stats.has_distinct_count:
+                distinct_counts[name] = stats.distinct_count
+        row_group_null_counts.append(group_nulls)
+
+    null_counts: Dict[str, Optional[int]] = {}
+    for name in selected:
+        counts = [group[name] for group in row_group_null_counts]
+        known = [count for count in counts if count is not None]
+        null_counts[name] = sum(known) if len(known) == len(counts) else None
+
+    return ParquetStatistics(
+        row_count=metadata.num_rows,
+        dtypes={name: str(dtype) for name, dtype in empty.dtypes.items()},
+        null_counts=null_counts,
+        distinct_counts={name: distinct_counts.get(name) for name in selected},
+        row_group_null_counts=row_group_null_counts,
+        row_group_row_counts=[
+            metadata.row_group(index).num_rows for index in range(metadata.num_row_groups)
+        ],
+    )
+
+
+def iter_parquet_row_groups(
+    path: str | Path,
+    columns: Optional[Sequence[str]] = None,
+    *,
+    batch_size: Optional[int] = None,
+) -> Iterator[Tuple[int, pd.DataFrame]]:
+    """Yield ``(row_group_index, frame)`` pairs of a Parquet file, decoding only ``columns``.
+
+    Each row group is read whole, or in batches of at most ``batch_size`` rows
+    that never span two row groups.
+    """
+
+    import pyarrow.parquet as pq
+
+    target = Path(path)
+    parquet_file = pq.ParquetFile(target)
+    selected = None if columns is None else list(columns)
+    if selected is not None:
+        _check_parquet_columns(target, selected, parquet_file.schema_arrow.names)
+    for group_index in range(parquet_file.metadata.num_row_groups):
+        if batch_size is None:
+            table = parquet_file.read_row_group(group_index, columns=selected)
+            yield group_index, table.to_pandas()
+            continue
+        batches = parquet_file.iter_batches(
+            batch_size=batch_size, row_groups=[group_index], columns=selected
+        )
+        for batch in batches:
+            yield group_index, batch.to_pandas()
+
+
+def iter_dataset_chunks(
+    path: str | Path,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dtype: Optional[Dict[str, str]] = None,
+    encoding: str = "utf-8",
+    delimiter: Optional[str] = None,
+    sheet_name: str | int | None = None,
+    columns: Optional[Sequence[str]] = None,
+) -> Iterator[pd.DataFrame]:
+    """Yield a tabular file as :class:`pandas.DataFrame` chunks of ``chunk_size`` rows.
+
+    CSV files are parsed incrementally, Parquet files are decoded batch by batch
+    from their row groups and ``.xlsx``/``.xlsm`` sheets are streamed with
+    :func:`iter_excel_chunks`, so only one chunk is held in memory at a time.
+    Legacy ``.xls`` workbooks cannot be read incrementally and are sliced after a
+    full load.
+    """
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    target = Path(path)
+    if not target.exists():
+        raise FileNotFoundError(f"Dataset not found: {target}")
+
+    selected = None if columns is None else list(columns)
+    suffix = target.suffix.lower()
+    if suffix in SUPPORTED_TEXT_SUFFIXES:
         resolved_delimiter = delimiter or _detect_delimiter(target)
-        return pd.read_csv(target, dtype=dtype, encoding=encoding, delimiter=resolved_delimiter)
+        with pd.read_csv(
+            target,
+            dtype=dtype,
+            encoding=encoding,
+            delimiter=resolved_delimiter,
+            chunksize=chunk_size,
+            usecols=selected,
+        ) as reader:
+            for chunk in reader:
+                yield chunk if selected is None else chunk[selected]
+        return
     if suffix == ".parquet":
-        return pd.read_parquet(target)
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(target)
+        if selected is not None:
+            _check_parquet_columns(target, selected, parquet_file.schema_arrow.names)
+        if parquet_file.metadata.num_rows == 0:
+            empty = parquet_file.schema_arrow.empty_table()
+            yield (empty if selected is None else empty.select(selected)).to_pandas()
+            return
+        for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=selected):
+            yield batch.to_pandas()
+        return
+    if suffix in STREAMING_EXCEL_SUFFIXES:
+        yield from iter_excel_chunks(
+            target, sheet_name=sheet_name, chunk_size=chunk_size, dtype=dtype, columns=selected
+        )
+        return
     if suffix in SUPPORTED_EXCEL_SUFFIXES:
-        sheet = 0 if sheet_name is None else sheet_name
-        return pd.read_excel(target, dtype=dtype, sheet_name=sheet)
+        frame = load_dataset(target, dtype=dtype, sheet_name=sheet_name, columns=selected)
+        if frame.empty:
+            yield frame
+            return
+        for start in range(0, len(frame), chunk_size):
+            yield frame.iloc[start : start + chunk_size]
+        return
 
     raise ValueError(f"Unsupported file type: {suffix}")
 
 
-def _detect_delimiter(path: Path, sample_bytes: int = 8192) -> str:
+def list_excel_sheets(path: str | Path) -> List[str]:
+    """Return the sheet names of an Excel workbook without parsing any sheet."""
+
+    target = Path(path)
+    if not target.exists():
+        raise FileNotFoundError(f"Dataset not found: {target}")
+    suffix = target.suffix.lower()
+    if suffix not in SUPPORTED_EXCEL_SUFFIXES:
+        raise ValueError(f"Not an Excel workbook: {target}")
+    if suffix not in STREAMING_EXCEL_SUFFIXES:
+        with pd.ExcelFile(target) as workbook:
+            return [str(name) for name in workbook.sheet_names]
+
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(target, read_only=True)
+    try:
+        return list(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+
+def iter_excel_chunks(
+    path: str | Path,
+    *,
+    sheet_name: str | int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dtype: Optional[Dict[str, str]] = None,
+    columns: Optional[Sequence[str]] = None,
+) -> Iterator[pd.DataFrame]:
+    """Stream one sheet of an ``.xlsx``/``.xlsm`` workbook in ``chunk_size``-row frames.
+
+    The sheet is read with openpyxl in read-only mode, which parses the XML as it
+    iterates instead of building every cell object first. The first row is the
+    header and, as with :func:`pandas.read_excel`, fully empty rows are kept
+    between data rows and dropped after the last one. Column types are inferred
+    per chunk, as with chunked CSV reads.
+    """
+
+    import openpyxl
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    target = Path(path)
+    if not target.exists():
+        raise FileNotFoundError(f"Dataset not found: {target}")
+
+    workbook = openpyxl.load_workbook(target, read_only=True, data_only=True)
+    try:
+        if sheet_name is None or isinstance(sheet_name, int):
+            worksheet = workbook.worksheets[sheet_name or 0]
+        elif sheet_name in workbook.sheetnames:
+            worksheet = workbook[sheet_name]
+        else:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found")
+
+        rows = worksheet.iter_rows(values_only=True)
+        header = _excel_header(next(rows, ()))
+        positions = list(range(len(header)))
+        if columns is not None:
+            unknown = [name for name in columns if name not in header]
+            if unknown:
+                raise ValueError(f"Unknown columns: {', '.join(map(str, unknown))}")
+            positions = [header.index(name) for name in columns]
+        names = [header[position] for position in positions]
+
+        empty = tuple(None for _ in positions)
+        batch: List[tuple] = []
+        blank_rows = 0
+        produced = False
+        for row in rows:
+            # Empty rows are held back until a data row follows, so trailing ones drop.
+            if all(value is None for value in row):
+                blank_rows += 1
+                continue
+            values = tuple(row[index] if index < len(row) else None for index in positions)
+            pending = itertools.chain(itertools.repeat(empty, blank_rows), [values])
+            blank_rows = 0
+            for cells in pending:
+                batch.append(cells)
+                if len(batch) == chunk_size:
+                    yield _excel_frame(batch, names, dtype)
+                    produced = True
+                    batch = []
+        if batch or not produced:
+            yield _excel_frame(batch, names, dtype)
+    finally:
+        workbook.close()
+
+
+def _excel_header(cells: Sequence[object]) -> List[object]:
+    # Name blank and repeated headers the way pandas.read_excel does.
+    header: List[object] = []
+    seen: Dict[object, int] = {}
+    for index, cell in enumerate(cells):
+        name = f"Unnamed: {index}" if cell is None else cell
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        header.append(name)
+    return header
+
+
+def _excel_frame(
+    rows: List[tuple], names: List[object], dtype: Optional[Dict[str, str]]
+) -> pd.DataFrame:
+    frame = pd.DataFrame(rows, columns=names)
+    if rows:
+        frame = frame.infer_objects()
+    return frame if dtype is None else frame.astype(dtype)
+
+
+def _check_parquet_columns(
+    path: Path, columns: Sequence[str], available: Optional[Sequence[str]] = None
+) -> None:
+    if available is None:
+        import pyarrow.parquet as pq
+
+        available = pq.read_schema(path).names
+    unknown = [name for name in columns if name not in available]
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+
+
+def _read_csv_arrow(
+    target: Path,
+    *,
+    dtype: Optional[Dict[str, str]],
+    encoding: str,
+    delimiter: Optional[str],
+    columns: Optional[List[str]],
+) -> pd.DataFrame:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    try:
+        with pa.memory_map(str(target)) as source:
+            # Sniff from the mapped pages instead of opening the file a second time.
+            sample = source.read_at(_SNIFF_BYTES, 0).decode("utf-8", errors="ignore")
+            table = pa_csv.read_csv(
+                source,
+                read_options=pa_csv.ReadOptions(use_threads=True, encoding=encoding),
+                parse_options=pa_csv.ParseOptions(delimiter=delimiter or _sniff_delimiter(sample)),
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=columns, strings_can_be_null=True
+                ),
+            )
+    except pa.ArrowException as error:
+        raise ValueError(f"Could not parse {target.name}: {error}") from error
+    frame = table.to_pandas(types_mapper=pd.ArrowDtype)
+    return frame if dtype is None else frame.astype(dtype)
+
+
+def _detect_delimiter(path: Path, sample_bytes: int = _SNIFF_BYTES) -> str:
     with path.open("r", encoding="utf-8", errors="ignore") as handle:
-        sample = handle.read(sample_bytes)
+        return _sniff_delimiter(handle.read(sample_bytes))
+
 
+def _sniff_delimiter(sample: str) -> str:
     try:
         dialect = csv.Sniffer().sniff(sample, delimiters=",;\t|")
         return dialect.delimiter
     except csv.Error:
         return ","
+
+
+class _ProgressReader(io.RawIOBase):
+    """Binary reader over ``handle`` that reports every read to ``progress``."""
+
+    def __init__(
+        self, handle: io.BufferedReader, size: int, progress: Callable[[int, int], None]
+    ) -> None:
+        self._handle = handle
+        self._size = size
+        self._progress = progress
+        self._read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        count = self._handle.readinto(buffer)
+        self._read += count
+        self._progress(self._read, self._size)
+        return count
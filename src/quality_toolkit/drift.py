@@ -0,0 +1,465 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .analysis import (
+    DEFAULT_QUANTILE_ERROR,
+    factorize_column,
+    is_summary_numeric,
+    merge_dtype,
+    resolve_dtype,
+)
+from .data_loader import DEFAULT_CHUNK_SIZE, iter_dataset_chunks
+from .sketches import FrequentItems, HyperLogLog, KLLSketch, hash_distinct
+
+PROFILE_FORMAT_VERSION = 1
+DEFAULT_PROFILE_DISTINCT_ERROR = 0.02
+DEFAULT_TOP_K = 100
+SHIFT_THRESHOLD = 0.1
+MISSING_CHANGE_THRESHOLD = 0.05
+DISTINCT_CHANGE_THRESHOLD = 0.2
+
+
+@dataclass
+class ColumnProfile:
+    """Compact, persistable sketches of one column.
+
+    ``distinct`` estimates the cardinality, ``frequent`` keeps the most frequent
+    values and, for numeric columns, ``quantiles`` approximates the distribution.
+    """
+
+    dtype: str
+    row_count: int
+    missing_count: int
+    distinct: HyperLogLog
+    frequent: FrequentItems
+    quantiles: Optional[KLLSketch] = None
+
+    @property
+    def missing_ratio(self) -> float:
+        return self.missing_count / self.row_count if self.row_count else 0.0
+
+    @property
+    def distinct_count(self) -> int:
+        return self.distinct.count()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "dtype": self.dtype,
+            "row_count": self.row_count,
+            "missing_count": self.missing_count,
+            "distinct": self.distinct.to_dict(),
+            "frequent": self.frequent.to_dict(),
+            "quantiles": None if self.quantiles is None else self.quantiles.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> ColumnProfile:
+        quantiles = data.get("quantiles")
+        return cls(
+            dtype=str(data["dtype"]),
+            row_count=int(data["row_count"]),
+            missing_count=int(data["missing_count"]),
+            distinct=HyperLogLog.from_dict(data["distinct"]),
+            frequent=FrequentItems.from_dict(data["frequent"]),
+            quantiles=None if quantiles is None else KLLSketch.from_dict(quantiles),
+        )
+
+
+@dataclass
+class DatasetProfile:
+    """Column profiles of a dataset, saved as a baseline for :func:`compare_profiles`.
+
+    A profile holds sketches whose size does not grow with the number of rows, so
+    it can be stored as JSON and compared later without reading the data again.
+    """
+
+    row_count: int
+    columns: Dict[str, ColumnProfile]
+    source: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": PROFILE_FORMAT_VERSION,
+            "source": self.source,
+            "row_count": self.row_count,
+            "columns": {name: column.to_dict() for name, column in self.columns.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> DatasetProfile:
+        if data.get("version") != PROFILE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported profile version: {data.get('version')}")
+        return cls(
+            row_count=int(data["row_count"]),
+            columns={
+                str(name): ColumnProfile.from_dict(column)
+                for name, column in data["columns"].items()
+            },
+            source=data.get("source"),
+        )
+
+    def save(self, path: str | Path) -> None:
+        """Write the profile to ``path`` as JSON, replacing it atomically."""
+
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        handle, temporary = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as stream:
+                json.dump(self.to_dict(), stream, separators=(",", ":"))
+            os.replace(temporary, target)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(cls, path: str | Path) -> DatasetProfile:
+        """Read a profile written by :meth:`save`."""
+
+        target = Path(path)
+        if not target.exists():
+            raise FileNotFoundError(f"Profile not found: {target}")
+        try:
+            data = json.loads(target.read_text(encoding="utf-8"))
+            return cls.from_dict(data)
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as error:
+            raise ValueError(f"Invalid profile file {target}: {error}") from error
+
+
+class _ColumnState:
+    __slots__ = (
+        "row_count",
+        "missing_count",
+        "dtype",
+        "null_dtype",
+        "distinct",
+        "frequent",
+        "quantiles",
+    )
+
+    def __init__(self, distinct_error: float, quantile_error: float, top_k: int) -> None:
+        self.row_count = 0
+        self.missing_count = 0
+        self.dtype: Optional[object] = None
+        self.null_dtype: Optional[object] = None
+        self.distinct = HyperLogLog.from_error(distinct_error)
+        self.frequent = FrequentItems(top_k)
+        self.quantiles: Optional[KLLSketch] = KLLSketch.from_error(quantile_error)
+
+    def update(
+        self, series: pd.Series, factorized: Optional[Tuple[np.ndarray, Any]] = None
+    ) -> None:
+        # One factorization feeds the null count, the frequencies and the
+        # cardinality sketch, which only needs each distinct value once.
+        codes, uniques = factorize_column(series) if factorized is None else factorized
+        present = codes[codes >= 0]
+        missing = len(codes) - len(present)
+        self.row_count += len(codes)
+        self.missing_count += missing
+        if not len(present):
+            self.null_dtype = merge_dtype(self.null_dtype, series.dtype)
+            return
+
+        self.dtype = merge_dtype(self.dtype, series.dtype)
+        self.frequent.add_counts(uniques, np.bincount(present, minlength=len(uniques)))
+        self.distinct.add_hashes(hash_distinct(uniques))
+        if self.quantiles is None:
+            return
+        if not is_summary_numeric(series.dtype):
+            self.quantiles = None
+            return
+        values = series.to_numpy(dtype="float64", na_value=np.nan)
+        self.quantiles.update(values[~np.isnan(values)])
+
+    def merge(self, other: _ColumnState) -> None:
+        self.row_count += other.row_count
+        self.missing_count += other.missing_count
+        if other.dtype is not None:
+            self.dtype = merge_dtype(self.dtype, other.dtype)
+        if other.null_dtype is not None:
+            self.null_dtype = merge_dtype(self.null_dtype, other.null_dtype)
+        self.distinct.merge(other.distinct)
+        self.frequent.merge(other.frequent)
+        if self.quantiles is not None and other.quantiles is not None:
+            self.quantiles.merge(other.quantiles)
+        else:
+            self.quantiles = None
+
+    def result(self) -> ColumnProfile:
+        quantiles = self.quantiles if self.quantiles is not None and self.quantiles.count else None
+        return ColumnProfile(
+            dtype=str(resolve_dtype(self.dtype, self.null_dtype, self.missing_count)),
+            row_count=self.row_count,
+            missing_count=self.missing_count,
+            distinct=self.distinct,
+            frequent=self.frequent,
+            quantiles=quantiles,
+        )
+
+
+class ProfileAccumulator:
+    """Mergeable builder of a :class:`DatasetProfile` from DataFrame chunks.
+
+    Every column gets a :class:`~quality_toolkit.sketches.HyperLogLog` within
+    ``distinct_error`` and a :class:`~quality_toolkit.sketches.FrequentItems`
+    summary of ``top_k`` values; numeric columns also get a
+    :class:`~quality_toolkit.sketches.KLLSketch` within ``quantile_error`` in rank.
+    Columns are keyed by their string name.
+    """
+
+    def __init__(
+        self,
+        distinct_error: float = DEFAULT_PROFILE_DISTINCT_ERROR,
+        quantile_error: float = DEFAULT_QUANTILE_ERROR,
+        top_k: int = DEFAULT_TOP_K,
+    ) -> None:
+        _ColumnState(distinct_error, quantile_error, top_k)  # validates the settings
+        self.distinct_error = distinct_error
+        self.quantile_error = quantile_error
+        self.top_k = top_k
+        self.row_count = 0
+        self._columns: Dict[str, _ColumnState] = {}
+
+    def update(
+        self,
+        chunk: pd.DataFrame,
+        factorized: Optional[Mapping[Any, Tuple[np.ndarray, Any]]] = None,
+    ) -> None:
+        """Fold the rows of ``chunk`` into the profile.
+
+        ``factorized`` optionally maps columns to their
+        :func:`~quality_toolkit.analysis.factorize_column` result for this chunk,
+        for example from a quality evaluation of the same chunk, which is then
+        reused instead of factorizing the column again.
+        """
+
+        shared = factorized or {}
+        for column in chunk.columns:
+            state = self._columns.get(str(column))
+            if state is None:
+                state = _ColumnState(self.distinct_error, self.quantile_error, self.top_k)
+                self._columns[str(column)] = state
+            state.update(chunk[column], shared.get(column))
+        self.row_count += int(len(chunk))
+
+    def merge(self, other: ProfileAccumulator) -> None:
+        """Fold the state of ``other``, which must use the same settings."""
+
+        settings = (self.distinct_error, self.quantile_error, self.top_k)
+        if (other.distinct_error, other.quantile_error, other.top_k) != settings:
+            raise ValueError("Cannot merge profiles with different sketch settings")
+        for name, state in other._columns.items():
+            if name in self._columns:
+                self._columns[name].merge(state)
+            else:
+                self._columns[name] = state
+        self.row_count += other.row_count
+
+    def result(self, source: Optional[str] = None) -> DatasetProfile:
+        return DatasetProfile(
+            row_count=self.row_count,
+            columns={name: state.result() for name, state in self._columns.items()},
+            source=source,
+        )
+
+
+def profile_chunks(chunks: Iterable[pd.DataFrame], **options: Any) -> DatasetProfile:
+    """Build a :class:`DatasetProfile` in a single pass over ``chunks``.
+
+    Keyword arguments are passed to :class:`ProfileAccumulator`.
+    """
+
+    accumulator = ProfileAccumulator(**options)
+    for chunk in chunks:
+        accumulator.update(chunk)
+    return accumulator.result()
+
+
+def profile_file(
+    path: str | Path,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    delimiter: Optional[str] = None,
+    encoding: str = "utf-8",
+    sheet_name: str | int | None = None,
+    columns: Optional[Sequence[str]] = None,
+    distinct_error: float = DEFAULT_PROFILE_DISTINCT_ERROR,
+    quantile_error: float = DEFAULT_QUANTILE_ERROR,
+    top_k: int = DEFAULT_TOP_K,
+) -> DatasetProfile:
+    """Stream ``path`` once in chunks of ``chunk_size`` rows and return its profile."""
+
+    chunks = iter_dataset_chunks(
+        path,
+        chunk_size=chunk_size,
+        encoding=encoding,
+        delimiter=delimiter,
+        sheet_name=sheet_name,
+        columns=columns,
+    )
+    profile = profile_chunks(
+        chunks, distinct_error=distinct_error, quantile_error=quantile_error, top_k=top_k
+    )
+    profile.source = str(path)
+    return profile
+
+
+@dataclass
+class ColumnDiff:
+    """How one column changed between two profiles.
+
+    The ``old_*`` fields are ``None`` for an added column and the ``new_*`` fields
+    for a removed one. ``shift`` is the estimated distance between the two value
+    distributions, in ``[0, 1]``: the Kolmogorov-Smirnov distance (``"ks"``) when
+    both sides are numeric, otherwise the total variation distance of the frequent
+    values (``"tvd"``) with the remaining values pooled. ``changes`` names what
+    exceeded the thresholds of :func:`compare_profiles`.
+    """
+
+    name: str
+    old_dtype: Optional[str] = None
+    new_dtype: Optional[str] = None
+    old_missing_ratio: Optional[float] = None
+    new_missing_ratio: Optional[float] = None
+    old_distinct: Optional[int] = None
+    new_distinct: Optional[int] = None
+    shift: Optional[float] = None
+    shift_metric: Optional[str] = None
+    changes: List[str] = field(default_factory=list)
+
+
+@dataclass
+class DatasetDiff:
+    """Per-column changes between an old and a new :class:`DatasetProfile`."""
+
+    old_row_count: int
+    new_row_count: int
+    columns: List[ColumnDiff]
+    warnings: List[str] = field(default_factory=list)
+    old_source: Optional[str] = None
+    new_source: Optional[str] = None
+
+    @property
+    def drifted(self) -> bool:
+        return any(column.changes for column in self.columns)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def compare_profiles(
+    old: DatasetProfile,
+    new: DatasetProfile,
+    *,
+    shift_threshold: float = SHIFT_THRESHOLD,
+    missing_threshold: float = MISSING_CHANGE_THRESHOLD,
+    distinct_threshold: float = DISTINCT_CHANGE_THRESHOLD,
+) -> DatasetDiff:
+    """Compare two profiles column by column without touching the underlying data.
+
+    A column is flagged when it was added or removed, when its dtype changed, when
+    its missing ratio moved by more than ``missing_threshold``, when its distinct
+    count changed by more than ``distinct_threshold`` relative to the old count, or
+    when its distribution ``shift`` exceeds ``shift_threshold``. Columns follow the
+    order of ``new``, with removed columns last.
+    """
+
+    diffs: List[ColumnDiff] = []
+    warnings: List[str] = []
+    names = list(new.columns) + [name for name in old.columns if name not in new.columns]
+    for name in names:
+        before = old.columns.get(name)
+        after = new.columns.get(name)
+        diff = ColumnDiff(name=name)
+        if before is not None:
+            diff.old_dtype = before.dtype
+            diff.old_missing_ratio = round(before.missing_ratio, 4)
+            diff.old_distinct = before.distinct_count
+        if after is not None:
+            diff.new_dtype = after.dtype
+            diff.new_missing_ratio = round(after.missing_ratio, 4)
+            diff.new_distinct = after.distinct_count
+
+        if before is None:
+            diff.changes.append("added")
+            warnings.append(f"Column '{name}' was added.")
+        elif after is None:
+            diff.changes.append("removed")
+            warnings.append(f"Column '{name}' was removed.")
+        else:
+            diff.shift, diff.shift_metric = _distribution_shift(before, after)
+            warnings.extend(
+                _flag_changes(diff, shift_threshold, missing_threshold, distinct_threshold)
+            )
+        diffs.append(diff)
+
+    return DatasetDiff(
+        old_row_count=old.row_count,
+        new_row_count=new.row_count,
+        columns=diffs,
+        warnings=warnings,
+        old_source=old.source,
+        new_source=new.source,
+    )
+
+
+def _flag_changes(
+    diff: ColumnDiff, shift_threshold: float, missing_threshold: float, distinct_threshold: float
+) -> List[str]:
+    warnings: List[str] = []
+    name = diff.name
+    if diff.old_dtype != diff.new_dtype:
+        diff.changes.append("dtype")
+        warnings.append(f"Column '{name}' changed dtype from {diff.old_dtype} to {diff.new_dtype}.")
+    old_missing = diff.old_missing_ratio or 0.0
+    new_missing = diff.new_missing_ratio or 0.0
+    if abs(new_missing - old_missing) > missing_threshold:
+        diff.changes.append("missing")
+        warnings.append(
+            f"Column '{name}' missing ratio changed from {old_missing:.1%} to {new_missing:.1%}."
+        )
+    old_distinct = diff.old_distinct or 0
+    new_distinct = diff.new_distinct or 0
+    if abs(new_distinct - old_distinct) > distinct_threshold * max(old_distinct, 1):
+        diff.changes.append("distinct")
+        warnings.append(
+            f"Column '{name}' distinct count changed from ~{old_distinct} to ~{new_distinct}."
+        )
+    if diff.shift is not None and diff.shift > shift_threshold:
+        diff.changes.append("distribution")
+        warnings.append(
+            f"Column '{name}' distribution shifted ({diff.shift_metric} distance "
+            f"{diff.shift:.2f})."
+        )
+    return warnings
+
+
+def _distribution_shift(
+    before: ColumnProfile, after: ColumnProfile
+) -> tuple[Optional[float], Optional[str]]:
+    if before.quantiles is not None and after.quantiles is not None:
+        return round(before.quantiles.ks_distance(after.quantiles), 4), "ks"
+    distance = _total_variation(before.frequent, after.frequent)
+    return (None, None) if math.isnan(distance) else (round(distance, 4), "tvd")
+
+
+def _total_variation(left: FrequentItems, right: FrequentItems) -> float:
+    if not left.total or not right.total:
+        return math.nan
+    gap = 0.0
+    for key in left.counts.keys() | right.counts.keys():
+        gap += abs(left.counts.get(key, 0) / left.total - right.counts.get(key, 0) / right.total)
+    # Values outside the summaries are pooled into a single remainder bucket.
+    left_rest = 1 - sum(left.counts.values()) / left.total
+    right_rest = 1 - sum(right.counts.values()) / right.total
+    return (gap + abs(left_rest - right_rest)) / 2
@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+import base64
+import math
+import tempfile
+import weakref
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .sketches import hash_series
+
+DUPLICATE_MODES = ("exact", "approximate")
+DEFAULT_SPILL_THRESHOLD = 50_000_000
+
+_HASH_MULTIPLIER = np.uint64(0x100000001B3)
+
+
+def row_fingerprints(df: pd.DataFrame, columns: Optional[Sequence[object]] = None) -> np.ndarray:
+    """Return a 64-bit fingerprint per row of ``df`` that is stable across chunk dtypes.
+
+    Each column is hashed once as a vector and the column hashes are folded
+    together, so the cost grows with the number of cells rather than with the
+    number of Python objects built per row.
+    """
+
+    selected = df.columns if columns is None else columns
+    return fold_column_hashes((hash_series(df[column]) for column in selected), len(df))
+
+
+def fold_column_hashes(hashes: Iterable[np.ndarray], row_count: int) -> np.ndarray:
+    """Fold per-column :func:`~quality_toolkit.sketches.hash_series` arrays into row hashes."""
+
+    fingerprints = np.zeros(row_count, dtype=np.uint64)
+    for column_hashes in hashes:
+        fingerprints ^= column_hashes
+        fingerprints *= _HASH_MULTIPLIER
+    return fingerprints
+
+
+class ExactDuplicateDetector:
+    """Counts repeated fingerprints exactly, spilling sorted runs to disk when large.
+
+    Fingerprints seen so far are kept as sorted, disjoint runs. Small runs are
+    merged as they accumulate, and once more than ``spill_threshold`` fingerprints
+    are held in memory the runs are merged and written to a temporary ``.npy`` file
+    that is memory-mapped for later lookups.
+    """
+
+    def __init__(
+        self,
+        spill_threshold: int = DEFAULT_SPILL_THRESHOLD,
+        spill_dir: str | Path | None = None,
+    ) -> None:
+        if spill_threshold <= 0:
+            raise ValueError("spill_threshold must be positive")
+        self.spill_threshold = spill_threshold
+        self.spill_dir = spill_dir
+        self.duplicate_rows = 0
+        self.unique_count = 0
+        self._runs: List[np.ndarray] = []
+        self._spilled: List[np.ndarray] = []
+        self._spill_directory: Optional[tempfile.TemporaryDirectory] = None
+
+    @property
+    def false_positive_rate(self) -> float:
+        """Chance that a new unique row collides with a stored 64-bit fingerprint."""
+
+        return self.unique_count / 2.0**64
+
+    def add(self, fingerprints: np.ndarray) -> int:
+        """Record ``fingerprints`` and return how many of them repeat an earlier row."""
+
+        if not len(fingerprints):
+            return 0
+        uniques = _sorted_unique(fingerprints)
+        fresh = uniques[~self._contains(uniques)]
+        duplicates = len(fingerprints) - len(fresh)
+        self.duplicate_rows += duplicates
+        self._insert(fresh)
+        return duplicates
+
+    def contains(self, fingerprints: np.ndarray) -> np.ndarray:
+        """Return a mask of the ``fingerprints`` that were already recorded."""
+
+        return self._contains(np.asarray(fingerprints, dtype=np.uint64))
+
+    def merge(self, other: ExactDuplicateDetector) -> None:
+        """Fold ``other``, which saw rows after this detector's rows."""
+
+        self.duplicate_rows += other.duplicate_rows
+        for run in [*other._spilled, *other._runs]:
+            fresh = run[~self._contains(run)]
+            self.duplicate_rows += len(run) - len(fresh)
+            self._insert(np.asarray(fresh))
+
+    def close(self) -> None:
+        """Remove any spill files written by this detector."""
+
+        self._spilled = []
+        if self._spill_directory is not None:
+            self._spill_directory.cleanup()
+            self._spill_directory = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable form; the fingerprints are base64-encoded bytes."""
+
+        runs = [*self._spilled, *self._runs]
+        fingerprints = np.sort(np.concatenate(runs)) if runs else np.empty(0, dtype=np.uint64)
+        return {
+            "spill_threshold": self.spill_threshold,
+            "duplicate_rows": self.duplicate_rows,
+            "fingerprints": _encode_array(fingerprints),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> ExactDuplicateDetector:
+        detector = cls(int(data["spill_threshold"]))
+        detector._insert(_decode_array(data["fingerprints"], np.uint64))
+        detector.duplicate_rows = int(data["duplicate_rows"])
+        return detector
+
+    def __getstate__(self) -> dict:
+        # Spill files are private to this process, so pickled state carries the
+        # fingerprints themselves.
+        state = self.__dict__.copy()
+        state["_runs"] = [np.asarray(run) for run in [*self._spilled, *self._runs]]
+        state["_spilled"] = []
+        state["_spill_directory"] = None
+        return state
+
+    def _contains(self, values: np.ndarray) -> np.ndarray:
+        found = np.zeros(len(values), dtype=bool)
+        for run in [*self._spilled, *self._runs]:
+            positions = np.searchsorted(run, values)
+            positions[positions == len(run)] = len(run) - 1
+            found |= run[positions] == values
+        return found
+
+    def _insert(self, fresh: np.ndarray) -> None:
+        if not len(fresh):
+            return
+        self.unique_count += len(fresh)
+        self._runs.append(fresh)
+        while len(self._runs) > 1 and len(self._runs[-2]) <= 2 * len(self._runs[-1]):
+            newest = self._runs.pop()
+            self._runs[-1] = np.sort(np.concatenate([self._runs[-1], newest]), kind="mergesort")
+        if sum(len(run) for run in self._runs) > self.spill_threshold:
+            self._spill()
+
+    def _spill(self) -> None:
+        merged = np.sort(np.concatenate(self._runs), kind="mergesort")
+        if self._spill_directory is None:
+            self._spill_directory = tempfile.TemporaryDirectory(
+                prefix="quality-toolkit-", dir=self.spill_dir
+            )
+            weakref.finalize(self, self._spill_directory.cleanup)
+        path = Path(self._spill_directory.name) / f"run-{len(self._spilled)}.npy"
+        np.save(path, merged)
+        self._spilled.append(np.load(path, mmap_mode="r"))
+        self._runs = []
+
+
+class BloomDuplicateDetector:
+    """Counts repeated fingerprints approximately with a scalable Bloom filter.
+
+    Memory is fixed by ``capacity`` and ``error_rate``. When more than ``capacity``
+    unique rows arrive, a new filter with twice the capacity and half the error rate
+    is stacked on top so the overall false-positive rate stays bounded.
+    """
+
+    def __init__(self, capacity: int = 10_000_000, error_rate: float = 0.001) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.duplicate_rows = 0
+        self._filters: List[_BloomFilter] = [_BloomFilter(capacity, error_rate)]
+
+    @property
+    def unique_count(self) -> int:
+        return sum(bloom.count for bloom in self._filters)
+
+    @property
+    def false_positive_rate(self) -> float:
+        """Chance that a new unique row is reported as a duplicate."""
+
+        survival = 1.0
+        for bloom in self._filters:
+            survival *= 1.0 - bloom.false_positive_rate
+        return 1.0 - survival
+
+    def add(self, fingerprints: np.ndarray) -> int:
+        """Record ``fingerprints`` and return how many of them appear to repeat earlier rows."""
+
+        if not len(fingerprints):
+            return 0
+        uniques = _sorted_unique(fingerprints)
+        seen = np.zeros(len(uniques), dtype=bool)
+        for bloom in self._filters:
+            seen |= bloom.contains(uniques)
+        fresh = uniques[~seen]
+        duplicates = len(fingerprints) - len(fresh)
+        self.duplicate_rows += duplicates
+
+        while len(fresh):
+            current = self._filters[-1]
+            room = current.capacity - current.count
+            if room <= 0:
+                self._filters.append(_BloomFilter(current.capacity * 2, current.error_rate / 2))
+                continue
+            current.add(fresh[:room])
+            fresh = fresh[room:]
+        return duplicates
+
+    def merge(self, other: BloomDuplicateDetector) -> None:
+        """Fold ``other``, estimating the rows both detectors have seen from filter fill."""
+
+        if (other.capacity, other.error_rate) != (self.capacity, self.error_rate):
+            raise ValueError("Cannot merge Bloom detectors with different settings")
+        before = sum(bloom.estimated_count() for bloom in [*self._filters, *other._filters])
+        for index, bloom in enumerate(other._filters):
+            if index < len(self._filters):
+                self._filters[index].union(bloom)
+            else:
+                self._filters.append(bloom.copy())
+        after = sum(bloom.estimated_count() for bloom in self._filters)
+        self.duplicate_rows += other.duplicate_rows + max(before - after, 0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable form; the filter bits are base64-encoded bytes."""
+
+        return {
+            "capacity": self.capacity,
+            "error_rate": self.error_rate,
+            "duplicate_rows": self.duplicate_rows,
+            "filters": [
+                {
+                    "capacity": bloom.capacity,
+                    "error_rate": bloom.error_rate,
+                    "count": bloom.count,
+                    "bits": _encode_array(bloom.bits),
+                }
+                for bloom in self._filters
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> BloomDuplicateDetector:
+        detector = cls(int(data["capacity"]), float(data["error_rate"]))
+        detector.duplicate_rows = int(data["duplicate_rows"])
+        detector._filters = []
+        for item in data["filters"]:
+            bloom = _BloomFilter(int(item["capacity"]), float(item["error_rate"]))
+            bits = _decode_array(item["bits"], np.uint8)
+            if len(bits) != len(bloom.bits):
+                raise ValueError("Bloom filter bits do not match its capacity")
+            bloom.bits = bits
+            bloom.count = int(item["count"])
+            detector._filters.append(bloom)
+        return detector
+
+
+class _BloomFilter:
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(64, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = np.zeros((self.size + 7) // 8, dtype=np.uint8)
+        self.count = 0
+
+    @property
+    def false_positive_rate(self) -> float:
+        return (1.0 - math.exp(-self.hash_count * self.count / self.size)) ** self.hash_count
+
+    def contains(self, values: np.ndarray) -> np.ndarray:
+        found = np.ones(len(values), dtype=bool)
+        for positions in self._positions(values):
+            found &= ((self.bits[positions >> 3] >> (positions & 7).astype(np.uint8)) & 1) == 1
+        return found
+
+    def add(self, values: np.ndarray) -> None:
+        for positions in self._positions(values):
+            masks = np.left_shift(1, positions & 7).astype(np.uint8)
+            np.bitwise_or.at(self.bits, positions >> 3, masks)
+        self.count += len(values)
+
+    def union(self, other: _BloomFilter) -> None:
+        np.bitwise_or(self.bits, other.bits, out=self.bits)
+        self.count = self.estimated_count()
+
+    def copy(self) -> _BloomFilter:
+        clone = _BloomFilter(self.capacity, self.error_rate)
+        clone.bits = self.bits.copy()
+        clone.count = self.count
+        return clone
+
+    def estimated_count(self) -> int:
+        set_bits = int(np.unpackbits(self.bits).sum())
+        if set_bits >= self.size:
+            return self.capacity
+        return round(-self.size / self.hash_count * math.log(1 - set_bits / self.size))
+
+    def _positions(self, values: np.ndarray) -> Iterator[np.ndarray]:
+        # Kirsch-Mitzenmacher double hashing derived from the 64-bit fingerprint.
+        first = values
+        second = (values * np.uint64(0x9E3779B97F4A7C15)) ^ (values >> np.uint64(29))
+        second |= np.uint64(1)
+        size = np.uint64(self.size)
+        for index in range(self.hash_count):
+            yield ((first + np.uint64(index) * second) % size).astype(np.int64)
+
+
+DuplicateDetector = Union[ExactDuplicateDetector, BloomDuplicateDetector]
+
+
+def create_duplicate_detector(mode: str = "exact") -> DuplicateDetector:
+    """Return a duplicate detector for ``mode`` (``"exact"`` or ``"approximate"``)."""
+
+    if mode == "exact":
+        return ExactDuplicateDetector()
+    if mode == "approximate":
+        return BloomDuplicateDetector()
+    raise ValueError(f"Unknown duplicate mode: {mode}")
+
+
+def _sorted_unique(fingerprints: np.ndarray) -> np.ndarray:
+    # np.unique hashes integer input before sorting in recent NumPy releases, which
+    # is several times slower than sorting and dropping repeats.
+    ordered = np.sort(np.asarray(fingerprints, dtype=np.uint64))
+    if len(ordered) < 2:
+        return ordered
+    return ordered[np.concatenate(([True], ordered[1:] != ordered[:-1]))]
+
+
+def _encode_array(values: np.ndarray) -> str:
+    return base64.b64encode(np.ascontiguousarray(values).tobytes()).decode("ascii")
+
+
+def _decode_array(text: str, dtype: type) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(text), dtype=dtype).copy()
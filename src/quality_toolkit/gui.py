@@ -1,16 +1,27 @@
 from __future__ import annotations
 
 from pathlib import Path
-from tkinter import END, StringVar, Tk, filedialog, messagebox
-from tkinter import ttk
+from tkinter import END, StringVar, Tk, filedialog, messagebox, ttk
 from tkinter.scrolledtext import ScrolledText
-from typing import Iterable
+from typing import Any, Callable, Dict, Hashable, Iterable
 
 import pandas as pd
 
-from .analysis import DatasetQuality, evaluate_data_quality
-from .data_loader import load_dataset
-from .report import build_markdown_report
+from .analysis import ColumnProfileCache, ColumnQuality, DatasetQuality
+from .data_loader import load_dataset, read_parquet_statistics
+from .report import build_markdown_report, format_distinct_count
+from .widgets import RowDescription, VirtualTable
+from .worker import BackgroundTask
+
+POLL_INTERVAL_MS = 50
+
+# Sort keys for the result headings, computed from the cached column profiles.
+SORT_KEYS: Dict[str, Callable[[Hashable, ColumnQuality], Any]] = {
+    "name": lambda name, _: str(name).casefold(),
+    "dtype": lambda _, column: column.dtype,
+    "missing": lambda _, column: column.missing_ratio,
+    "distinct": lambda _, column: column.distinct_count,
+}
 
 
 class QualityToolkitApp(Tk):
@@ -31,6 +42,19 @@ class QualityToolkitApp(Tk):
         self._path_var = StringVar(value="No dataset loaded")
         self._status_var = StringVar(value="Load a CSV, Excel, or Parquet file to get started.")
         self._dataset: pd.DataFrame | None = None
+        self._dataset_path: Path | None = None
+        self._column_names: list[str] = []
+        # Column profiles of the open dataset, reused whenever the selection changes.
+        self._profiles = ColumnProfileCache()
+        self._results: Dict[Hashable, ColumnQuality] = {}
+        self._warnings: list[str] = []
+        self._sort_column: str | None = None
+        self._sort_reverse = False
+        self._column_filter_var = StringVar()
+        self._result_filter_var = StringVar()
+        self._task: BackgroundTask | None = None
+        self._on_task_result: Callable[[Any], None] | None = None
+        self._task_error_title = ""
 
         self._build_header()
         self._build_main_panes()
@@ -43,15 +67,24 @@ class QualityToolkitApp(Tk):
         header.grid(row=0, column=0, sticky="ew")
         header.columnconfigure(1, weight=1)
 
-        open_button = ttk.Button(header, text="Open Dataset?", command=self._handle_open)
-        open_button.grid(row=0, column=0, padx=(0, 12))
+        self._open_button = ttk.Button(header, text="Open Dataset?", command=self._handle_open)
+        self._open_button.grid(row=0, column=0, padx=(0, 12))
 
         path_label = ttk.Label(header, textvariable=self._path_var, anchor="w")
-        path_label.grid(row=0, column=1, sticky="ew")
+        path_label.grid(row=0, column=1, columnspan=3, sticky="ew")
 
         status_label = ttk.Label(header, textvariable=self._status_var, anchor="w", foreground="#555")
         status_label.grid(row=1, column=0, columnspan=2, pady=(8, 0), sticky="w")
 
+        # Progress of the background load or analysis; Cancel abandons it.
+        self._progress = ttk.Progressbar(header, length=240, mode="determinate")
+        self._progress.grid(row=1, column=2, pady=(8, 0), padx=(12, 8), sticky="e")
+
+        self._cancel_button = ttk.Button(
+            header, text="Cancel", command=self._handle_cancel, state="disabled"
+        )
+        self._cancel_button.grid(row=1, column=3, pady=(8, 0), sticky="e")
+
     def _build_main_panes(self) -> None:
         container = ttk.Frame(self, padding=(16, 0, 16, 16))
         container.grid(row=1, column=0, sticky="nsew")
@@ -62,7 +95,7 @@ class QualityToolkitApp(Tk):
         chooser = ttk.Labelframe(container, text="Columns", padding=12)
         chooser.grid(row=0, column=0, sticky="nsw", padx=(0, 16))
         chooser.columnconfigure(0, weight=1)
-        chooser.rowconfigure(1, weight=1)
+        chooser.rowconfigure(2, weight=1)
 
         help_label = ttk.Label(
             chooser,
@@ -72,17 +105,26 @@ class QualityToolkitApp(Tk):
         )
         help_label.grid(row=0, column=0, sticky="w")
 
-        self._column_list = ttk.Treeview(chooser, show="tree", selectmode="extended")
-        self._column_list.grid(row=1, column=0, sticky="nsew", pady=(8, 8))
-        self._column_list.bind(
-            "<<TreeviewSelect>>", lambda _: self._update_status("Columns selected.")
+        column_filter = ttk.Entry(chooser, textvariable=self._column_filter_var)
+        column_filter.grid(row=1, column=0, sticky="ew", pady=(8, 0))
+        self._column_filter_var.trace_add("write", lambda *_: self._apply_column_filter())
+
+        # Virtualized lists keep only the visible rows as Tk items, however wide the dataset.
+        self._column_list = VirtualTable(
+            chooser,
+            lambda name: (str(name), ()),
+            selectable=True,
+            on_select=lambda: self._update_status("Columns selected."),
         )
+        self._column_list.grid(row=2, column=0, sticky="nsew", pady=(8, 8))
 
         button_row = ttk.Frame(chooser)
-        button_row.grid(row=2, column=0, sticky="ew")
+        button_row.grid(row=3, column=0, sticky="ew")
 
-        run_button = ttk.Button(button_row, text="Generate Report", command=self._handle_generate)
-        run_button.pack(side="left")
+        self._run_button = ttk.Button(
+            button_row, text="Generate Report", command=self._handle_generate
+        )
+        self._run_button.pack(side="left")
 
         clear_button = ttk.Button(button_row, text="Clear Selection", command=self._clear_selection)
         clear_button.pack(side="left", padx=(8, 0))
@@ -98,7 +140,7 @@ class QualityToolkitApp(Tk):
 
         columns_frame = ttk.Frame(report_panel, padding=12)
         columns_frame.columnconfigure(0, weight=1)
-        columns_frame.rowconfigure(0, weight=1)
+        columns_frame.rowconfigure(1, weight=1)
         report_panel.add(columns_frame, text="Columns")
 
         markdown_frame = ttk.Frame(report_panel, padding=12)
@@ -116,23 +158,29 @@ class QualityToolkitApp(Tk):
         warning_label = ttk.Label(overview_frame, text="Warnings:")
         warning_label.grid(row=1, column=0, sticky="w", pady=(12, 0))
 
-        self._warning_list = ttk.Treeview(overview_frame, show="tree")
+        self._warning_list = VirtualTable(overview_frame, lambda index: (self._warnings[index], ()))
         self._warning_list.grid(row=2, column=0, sticky="nsew", pady=(4, 0))
 
-        self._column_tree = ttk.Treeview(
+        result_filter = ttk.Entry(columns_frame, textvariable=self._result_filter_var)
+        result_filter.grid(row=0, column=0, sticky="ew", pady=(0, 8))
+        self._result_filter_var.trace_add("write", lambda *_: self._apply_result_filter())
+
+        self._column_tree = VirtualTable(
             columns_frame,
-            columns=("dtype", "missing", "distinct", "samples"),
-            show="headings",
+            self._describe_column,
+            columns=(
+                ("name", "Column", 180),
+                ("dtype", "Type", 140),
+                ("missing", "Missing", 160),
+                ("distinct", "Distinct", 120),
+                ("samples", "Samples", 360),
+            ),
         )
-        for column_id, heading, width in (
-            ("dtype", "Type", 140),
-            ("missing", "Missing", 160),
-            ("distinct", "Distinct", 120),
-            ("samples", "Samples", 360),
-        ):
-            self._column_tree.heading(column_id, text=heading)
-            self._column_tree.column(column_id, width=width, anchor="w", stretch=True)
-        self._column_tree.grid(row=0, column=0, sticky="nsew")
+        for column_id in SORT_KEYS:
+            self._column_tree.tree.heading(
+                column_id, command=lambda column_id=column_id: self._sort_results(column_id)
+            )
+        self._column_tree.grid(row=1, column=0, sticky="nsew")
 
         self._report_text = ScrolledText(markdown_frame, wrap="word")
         self._report_text.configure(state="disabled")
@@ -154,82 +202,180 @@ class QualityToolkitApp(Tk):
         if not path:
             return
 
-        try:
-            dataset = load_dataset(path)
-        except ValueError as error:
-            messagebox.showerror("Unsupported file", str(error))
-            return
-        except FileNotFoundError as error:
-            messagebox.showerror("File not found", str(error))
-            return
-        except Exception as error:  # pragma: no cover - unexpected errors
-            messagebox.showerror("Error loading file", str(error))
-            return
-
-        self._dataset = dataset
-        self._path_var.set(str(Path(path)))
-        self._populate_columns(dataset.columns)
-        self._clear_report()
-        self._update_status("Dataset loaded. Select columns and generate a report.")
+        def load(task: BackgroundTask) -> tuple[pd.DataFrame | None, list[str]]:
+            if self._is_parquet(Path(path)):
+                # Only the schema is read here; the selected columns are decoded on demand.
+                return None, list(read_parquet_statistics(path).dtypes)
+            dataset = load_dataset(path, progress=task.progress)
+            return dataset, list(dataset.columns)
+
+        def loaded(result: tuple[pd.DataFrame | None, list[str]]) -> None:
+            dataset, column_names = result
+            self._dataset = dataset
+            self._dataset_path = Path(path)
+            self._column_names = column_names
+            self._profiles = ColumnProfileCache()
+            self._path_var.set(str(Path(path)))
+            self._populate_columns(column_names)
+            self._clear_report()
+            self._update_status("Dataset loaded. Select columns and generate a report.")
+
+        self._start_task(load, loaded, f"Loading {Path(path).name}...", "Error loading file")
 
     def _handle_generate(self) -> None:
-        if self._dataset is None:
+        if self._dataset_path is None:
             messagebox.showinfo("No dataset", "Load a dataset before generating a report.")
             return
 
-        selected_columns = self._get_selected_columns()
-        if selected_columns:
-            data = self._dataset[selected_columns]
-        else:
-            data = self._dataset
+        dataset = self._dataset
+        dataset_path = self._dataset_path
+        profiles = self._profiles
+        selected_columns = self._get_selected_columns() or list(self._column_names)
+
+        def evaluate(task: BackgroundTask) -> tuple[DatasetQuality, pd.DataFrame | None]:
+            data = dataset
+            # Parquet columns are decoded on first use and kept alongside the earlier ones.
+            loaded = [] if data is None else list(data.columns)
+            missing = [column for column in selected_columns if column not in loaded]
+            if self._is_parquet(dataset_path) and missing:
+                decoded = load_dataset(dataset_path, columns=missing, progress=task.progress)
+                data = decoded if data is None else pd.concat([data, decoded], axis=1)
+
+            task.post("status", "Profiling columns...")
+            total = len(selected_columns) + 1
+            profiled = 0
+
+            def column_ready(column: object, column_quality: ColumnQuality) -> None:
+                nonlocal profiled
+                profiled += 1
+                task.post("column", (column, column_quality))
+                task.progress(profiled, total)
+
+            if data is None:
+                data = pd.DataFrame()
+            quality = profiles.evaluate(data, selected_columns, on_column=column_ready)
+            return quality, data
+
+        def evaluated(result: tuple[DatasetQuality, pd.DataFrame | None]) -> None:
+            quality, data = result
+            if profiles is self._profiles:
+                self._dataset = data
+            self._render_quality(quality)
+            self._update_status("Report generated")
+
+        self._clear_report()
+        self._start_task(evaluate, evaluated, "Generating report...", "Quality error")
 
-        try:
-            quality = evaluate_data_quality(data)
-        except ValueError as error:
-            messagebox.showerror("Quality error", str(error))
+    def _handle_cancel(self) -> None:
+        if self._task is None:
             return
+        # The worker stops at its next progress report; its remaining messages are ignored.
+        self._task.cancel()
+        self._finish_task()
+        self._update_status("Cancelled.")
 
-        self._render_quality(quality)
-        self._update_status("Report generated")
+    # ------------------------------------------------------------------
+    # Background work
+    def _start_task(
+        self,
+        target: Callable[[BackgroundTask], Any],
+        on_result: Callable[[Any], None],
+        message: str,
+        error_title: str,
+    ) -> None:
+        if self._task is not None:
+            return
+        self._task = BackgroundTask(target).start()
+        self._on_task_result = on_result
+        self._task_error_title = error_title
+        self._open_button.configure(state="disabled")
+        self._run_button.configure(state="disabled")
+        self._cancel_button.configure(state="normal")
+        self._progress.configure(value=0, maximum=1)
+        self._update_status(message)
+        self.after(POLL_INTERVAL_MS, self._poll_task, self._task)
+
+    def _poll_task(self, task: BackgroundTask) -> None:
+        if task is not self._task:
+            return
+        for kind, payload in task.drain():
+            if kind == "progress":
+                done, total = payload
+                self._progress.configure(value=done, maximum=max(total, 1))
+            elif kind == "status":
+                self._update_status(payload)
+            elif kind == "column":
+                self._render_column(*payload)
+            elif kind == "result":
+                on_result = self._on_task_result
+                self._finish_task()
+                if on_result is not None:
+                    on_result(payload)
+                return
+            elif kind == "error":
+                self._finish_task()
+                title = "File not found" if isinstance(payload, FileNotFoundError) else None
+                messagebox.showerror(title or self._task_error_title, str(payload))
+                self._update_status("Ready")
+                return
+            else:
+                self._finish_task()
+                return
+        self.after(POLL_INTERVAL_MS, self._poll_task, task)
+
+    def _finish_task(self) -> None:
+        self._task = None
+        self._on_task_result = None
+        self._open_button.configure(state="normal")
+        self._run_button.configure(state="normal")
+        self._cancel_button.configure(state="disabled")
+        self._progress.configure(value=0)
 
     # ------------------------------------------------------------------
     # Rendering helpers
     def _populate_columns(self, column_names: Iterable[str]) -> None:
-        self._column_list.delete(*self._column_list.get_children())
-        for name in column_names:
-            self._column_list.insert("", END, iid=name, text=name)
+        self._column_filter_var.set("")
+        self._column_list.set_rows(list(column_names))
+
+    def _get_selected_columns(self) -> list[Hashable]:
+        return self._column_list.selection()
 
-    def _get_selected_columns(self) -> list[str]:
-        selection = self._column_list.selection()
-        return list(selection)
+    @staticmethod
+    def _is_parquet(path: Path) -> bool:
+        return path.suffix.lower() == ".parquet"
 
     def _clear_selection(self) -> None:
-        self._column_list.selection_remove(self._column_list.selection())
+        self._column_list.clear_selection()
         self._update_status("Column selection cleared")
 
+    def _apply_column_filter(self) -> None:
+        self._column_list.set_filter(_name_filter(self._column_filter_var.get()))
+
+    def _apply_result_filter(self) -> None:
+        self._column_tree.set_filter(_name_filter(self._result_filter_var.get()))
+
+    def _sort_results(self, column_id: str) -> None:
+        # Clicking the sorted heading again flips the order; rows are only reordered.
+        if self._sort_column == column_id:
+            self._sort_reverse = not self._sort_reverse
+        else:
+            self._sort_column = column_id
+            self._sort_reverse = False
+        metric = SORT_KEYS[column_id]
+        self._column_tree.sort_by(
+            lambda name: metric(name, self._results[name]), reverse=self._sort_reverse
+        )
+
     def _render_quality(self, dataset_quality: DatasetQuality) -> None:
         self._metric_tree.delete(*self._metric_tree.get_children())
         self._metric_tree.insert("", END, values=("Rows", dataset_quality.row_count))
         self._metric_tree.insert("", END, values=("Duplicate rows", dataset_quality.duplicate_rows))
 
-        self._warning_list.delete(*self._warning_list.get_children())
-        if dataset_quality.warnings:
-            for warning in dataset_quality.warnings:
-                self._warning_list.insert("", END, text=warning)
-        else:
-            self._warning_list.insert("", END, text="No warnings")
-
-        self._column_tree.delete(*self._column_tree.get_children())
-        for column_name, column_quality in dataset_quality.columns.items():
-            missing_display = f"{column_quality.missing_count} ({column_quality.missing_ratio:.1%})"
-            sample_display = ", ".join(column_quality.sample_values[:5]) or "?"
-            self._column_tree.insert(
-                "",
-                END,
-                iid=column_name,
-                values=(column_quality.dtype, missing_display, column_quality.distinct_count, sample_display),
-                text=column_name,
-            )
+        self._warnings = list(dataset_quality.warnings) or ["No warnings"]
+        self._warning_list.set_rows(range(len(self._warnings)))
+
+        self._results = dict(dataset_quality.columns)
+        self._column_tree.set_rows(list(self._results))
 
         report = build_markdown_report(dataset_quality)
         self._report_text.configure(state="normal")
@@ -237,11 +383,28 @@ class QualityToolkitApp(Tk):
         self._report_text.insert("1.0", report)
         self._report_text.configure(state="disabled")
 
+    def _render_column(self, column_name: Hashable, column_quality: ColumnQuality) -> None:
+        self._results[column_name] = column_quality
+        self._column_tree.append_row(column_name)
+
+    def _describe_column(self, column_name: Hashable) -> RowDescription:
+        column_quality = self._results[column_name]
+        missing_display = f"{column_quality.missing_count} ({column_quality.missing_ratio:.1%})"
+        sample_display = ", ".join(column_quality.sample_values[:5]) or "?"
+        return str(column_name), (
+            column_name,
+            column_quality.dtype,
+            missing_display,
+            format_distinct_count(column_quality),
+            sample_display,
+        )
+
     def _clear_report(self) -> None:
         self._metric_tree.delete(*self._metric_tree.get_children())
-        self._warning_list.delete(*self._warning_list.get_children())
-        self._warning_list.insert("", END, text="No report generated")
-        self._column_tree.delete(*self._column_tree.get_children())
+        self._warnings = ["No report generated"]
+        self._warning_list.set_rows([0])
+        self._results = {}
+        self._column_tree.set_rows([])
         self._report_text.configure(state="normal")
         self._report_text.delete("1.0", END)
         self._report_text.configure(state="disabled")
@@ -250,6 +413,13 @@ class QualityToolkitApp(Tk):
         self._status_var.set(message)
 
 
+def _name_filter(text: str) -> Callable[[Hashable], bool] | None:
+    needle = text.strip().casefold()
+    if not needle:
+        return None
+    return lambda name: needle in str(name).casefold()
+
+
 def launch_gui() -> None:
     app = QualityToolkitApp()
     app.mainloop()
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import pandas as pd
+
+from .analysis import DatasetAccumulator, DatasetQuality
+from .data_loader import DEFAULT_CHUNK_SIZE, SUPPORTED_TEXT_SUFFIXES, _detect_delimiter
+
+if TYPE_CHECKING:
+    from .rules import RuleSet
+
+STATE_FORMAT_VERSION = 4
+CHECKSUM_BYTES = 64 * 1024
+_SCAN_BLOCK_SIZE = 64 * 1024
+
+
+@dataclass
+class IncrementalState:
+    """What :func:`evaluate_incremental` persists between runs of an append-only CSV.
+
+    It is saved as JSON, with the accumulator in its
+    :meth:`~quality_toolkit.analysis.DatasetAccumulator.to_dict` form.
+    """
+
+    path: str
+    options: Dict[str, Any]
+    delimiter: str
+    columns: List[str]
+    offset: int
+    head_checksum: str
+    tail_checksum: str
+    accumulator: DatasetAccumulator
+    size: int = 0
+    mtime_ns: int = 0
+    version: int = STATE_FORMAT_VERSION
+
+
+def evaluate_incremental(
+    path: str | Path,
+    state_path: str | Path,
+    *,
+    sample_size: int = 5,
+    delimiter: Optional[str] = None,
+    encoding: str = "utf-8",
+    distinct_error: Optional[float] = None,
+    duplicate_mode: str = "exact",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    summary: bool = False,
+    rules: Optional[RuleSet] = None,
+) -> DatasetQuality:
+    """Evaluate an append-only CSV file, parsing only the bytes added since the last run.
+
+    The byte offset, header and mergeable accumulator state are saved to
+    ``state_path`` after each run. The next run checks that the head of the file
+    and the last processed block are unchanged and then folds only the new
+    complete lines into the saved state. A last line without a trailing newline
+    may still be being written and is left for a later run, unless the file's size
+    and modification time are unchanged since the previous run, in which case the
+    line is taken as finished. If the prefix changed, the file shrank or the
+    options differ, the whole file is rescanned. A state file that cannot be read,
+    or that was written by a different version of the format, is also ignored.
+    """
+
+    target = Path(path)
+    if not target.exists():
+        raise FileNotFoundError(f"Dataset not found: {target}")
+    if target.suffix.lower() not in SUPPORTED_TEXT_SUFFIXES:
+        raise ValueError(f"Unsupported file type for incremental evaluation: {target.suffix}")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    options = {
+        "sample_size": sample_size,
+        "delimiter": delimiter,
+        "encoding": encoding,
+        "distinct_error": distinct_error,
+        "duplicate_mode": duplicate_mode,
+        "summary": summary,
+        "rules": None if rules is None else rules.to_dict(),
+    }
+    state = _load_state(Path(state_path))
+    if state is None or not _is_resumable(state, target, options):
+        state = _start_state(target, options, delimiter, encoding, rules)
+
+    stat = target.stat()
+    end = _last_complete_line_end(target)
+    if end < stat.st_size and (stat.st_size, stat.st_mtime_ns) == (state.size, state.mtime_ns):
+        end = stat.st_size
+    if end > state.offset:
+        with target.open("rb") as handle:
+            handle.seek(state.offset)
+            reader = pd.read_csv(
+                io.BufferedReader(_BoundedReader(handle, end - state.offset)),
+                header=None,
+                names=state.columns,
+                delimiter=state.delimiter,
+                encoding=encoding,
+                chunksize=chunk_size,
+            )
+            with reader:
+                for chunk in reader:
+                    state.accumulator.update(chunk)
+        state.offset = end
+        state.head_checksum = _checksum(target, 0, min(end, CHECKSUM_BYTES))
+        state.tail_checksum = _checksum(target, max(0, end - CHECKSUM_BYTES), end)
+    state.size = stat.st_size
+    state.mtime_ns = stat.st_mtime_ns
+
+    _save_state(Path(state_path), state)
+    return state.accumulator.result()
+
+
+def _start_state(
+    target: Path,
+    options: Dict[str, Any],
+    delimiter: Optional[str],
+    encoding: str,
+    rules: Optional[RuleSet],
+) -> IncrementalState:
+    resolved_delimiter = delimiter or _detect_delimiter(target)
+    header_end = _first_line_end(target)
+    with target.open("rb") as handle:
+        header = handle.read(header_end)
+    header_frame = pd.read_csv(
+        io.BytesIO(header), delimiter=resolved_delimiter, encoding=encoding, nrows=0
+    )
+    columns = list(header_frame.columns)
+    accumulator = DatasetAccumulator(
+        sample_size=options["sample_size"],
+        distinct_error=options["distinct_error"],
+        duplicate_mode=options["duplicate_mode"],
+        summary=options["summary"],
+        rules=rules,
+    )
+    accumulator.update(header_frame)
+    return IncrementalState(
+        path=str(target.resolve()),
+        options=options,
+        delimiter=resolved_delimiter,
+        columns=columns,
+        offset=header_end,
+        head_checksum=_checksum(target, 0, min(header_end, CHECKSUM_BYTES)),
+        tail_checksum=_checksum(target, max(0, header_end - CHECKSUM_BYTES), header_end),
+        accumulator=accumulator,
+    )
+
+
+def _is_resumable(state: IncrementalState, target: Path, options: Dict[str, Any]) -> bool:
+    if state.path != str(target.resolve()) or state.options != options:
+        return False
+    if target.stat().st_size < state.offset:
+        return False
+    head = _checksum(target, 0, min(state.offset, CHECKSUM_BYTES))
+    tail = _checksum(target, max(0, state.offset - CHECKSUM_BYTES), state.offset)
+    return head == state.head_checksum and tail == state.tail_checksum
+
+
+def _load_state(state_path: Path) -> Optional[IncrementalState]:
+    try:
+        with state_path.open(encoding="utf-8") as handle:
+            data = json.load(handle)
+        if not isinstance(data, dict) or data.get("version") != STATE_FORMAT_VERSION:
+            return None
+        values = {item.name: data[item.name] for item in fields(IncrementalState)}
+        values["accumulator"] = DatasetAccumulator.from_dict(data["accumulator"])
+        return IncrementalState(**values)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_state(state_path: Path, state: IncrementalState) -> None:
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    handle, temporary = tempfile.mkstemp(dir=state_path.parent, suffix=".tmp")
+    try:
+        data = {item.name: getattr(state, item.name) for item in fields(state)}
+        data["accumulator"] = state.accumulator.to_dict()
+        with os.fdopen(handle, "w", encoding="utf-8") as stream:
+            json.dump(data, stream)
+        os.replace(temporary, state_path)
+    except BaseException:
+        Path(temporary).unlink(missing_ok=True)
+        raise
+
+
+def _checksum(target: Path, start: int, end: int) -> str:
+    with target.open("rb") as handle:
+        handle.seek(start)
+        return hashlib.sha256(handle.read(end - start)).hexdigest()
+
+
+def _first_line_end(target: Path) -> int:
+    with target.open("rb") as handle:
+        line = handle.readline()
+    return len(line)
+
+
+def _last_complete_line_end(target: Path) -> int:
+    """Return the offset just past the last newline, ignoring a partially written line."""
+
+    size = target.stat().st_size
+    with target.open("rb") as handle:
+        position = size
+        while position > 0:
+            start = max(0, position - _SCAN_BLOCK_SIZE)
+            handle.seek(start)
+            block = handle.read(position - start)
+            newline = block.rfind(b"\n")
+            if newline >= 0:
+                return start + newline + 1
+            position = start
+    return 0
+
+
+class _BoundedReader(io.RawIOBase):
+    """Binary reader exposing at most ``limit`` bytes of ``handle`` from its position."""
+
+    def __init__(self, handle: io.BufferedReader, limit: int) -> None:
+        self._handle = handle
+        self._remaining = limit
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        if self._remaining <= 0:
+            return 0
+        view = memoryview(buffer)[: self._remaining]
+        count = self._handle.readinto(view)
+        self._remaining -= count
+        return count
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+EXECUTOR_KINDS = ("auto", "thread", "process")
+TASKS_PER_WORKER = 4
+
+# Forking copies the parent's locks as they are, including ones held by background
+# threads such as the fingerprint worker, so process pools start from a clean
+# interpreter instead.
+PROCESS_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+ColumnTask = Callable[..., List[Tuple[object, Any]]]
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """Return the pool size for ``workers``; ``None`` is serial and ``0`` uses every core."""
+
+    if workers is None:
+        return 1
+    if workers < 0:
+        raise ValueError("workers must not be negative")
+    if workers == 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Return a process pool whose workers start with :data:`PROCESS_START_METHOD`."""
+
+    context = multiprocessing.get_context(PROCESS_START_METHOD)
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+
+
+def choose_executor(df: pd.DataFrame) -> str:
+    """Pick ``"thread"`` or ``"process"`` for profiling the columns of ``df``.
+
+    Vectorized NumPy and Arrow kernels release the GIL, so threads scale on typed
+    columns without copying anything. Object columns are processed value by value
+    under the GIL and only scale across processes.
+    """
+
+    if any(pd.api.types.is_object_dtype(dtype) for dtype in df.dtypes):
+        return "process"
+    return "thread"
+
+
+def map_column_groups(
+    df: pd.DataFrame,
+    task: ColumnTask,
+    *,
+    workers: int,
+    executor: str = "auto",
+    **kwargs: Any,
+) -> List[Tuple[object, Any]]:
+    """Run ``task`` over groups of columns of ``df`` and return results in column order.
+
+    ``task`` is called as ``task(frame, columns, **kwargs)`` and returns
+    ``(column, result)`` pairs. Threads share ``df`` directly; processes receive only
+    the slice of ``df`` holding their own columns, so the frame is pickled once in
+    total rather than once per task.
+    """
+
+    if executor not in EXECUTOR_KINDS:
+        raise ValueError(f"Unknown executor: {executor}")
+    columns = list(df.columns)
+    if workers <= 1 or len(columns) <= 1:
+        return task(df, columns, **kwargs)
+
+    kind = choose_executor(df) if executor == "auto" else executor
+    groups = split_columns(columns, workers * TASKS_PER_WORKER)
+    pool: Executor = (
+        process_pool(workers) if kind == "process" else ThreadPoolExecutor(max_workers=workers)
+    )
+
+    with pool:
+        if kind == "process":
+            futures = [pool.submit(task, df[group], group, **kwargs) for group in groups]
+        else:
+            futures = [pool.submit(task, df, group, **kwargs) for group in groups]
+        results: Dict[object, Any] = {}
+        for future in futures:
+            results.update(future.result())
+
+    return [(column, results[column]) for column in columns]
+
+
+def split_columns(columns: Sequence[object], groups: int) -> List[List[object]]:
+    """Deal ``columns`` round-robin into at most ``groups`` non-empty groups."""
+
+    count = max(1, min(groups, len(columns)))
+    return [list(columns[index::count]) for index in range(count)]
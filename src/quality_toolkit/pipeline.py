@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence
+
+from .analysis import (
+    DatasetAccumulator,
+    DatasetQuality,
+    attach_timings,
+    evaluate_data_quality,
+    evaluate_data_quality_chunks,
+)
+from .cache import ResultCache
+from .data_loader import (
+    DEFAULT_CHUNK_SIZE,
+    iter_dataset_chunks,
+    iter_parquet_row_groups,
+    list_excel_sheets,
+    load_dataset,
+    read_parquet_statistics,
+)
+from .parallel import process_pool, resolve_workers
+from .profiling import Profiler, resolve_profiler
+
+if TYPE_CHECKING:
+    from .rules import RuleSet
+
+
+def evaluate_file(
+    path: str | Path,
+    *,
+    sample_size: int = 5,
+    delimiter: Optional[str] = None,
+    chunk_size: Optional[int] = None,
+    encoding: str = "utf-8",
+    sheet_name: str | int | None = None,
+    columns: Optional[Sequence[str]] = None,
+    distinct_error: Optional[float] = None,
+    duplicate_mode: str = "exact",
+    workers: Optional[int] = None,
+    cache: Optional[ResultCache] = None,
+    content_hash: bool = False,
+    engine: str = "pandas",
+    optimize_memory: bool = False,
+    profiler: Optional[Profiler] = None,
+    summary: bool = False,
+    rules: Optional[RuleSet] = None,
+) -> DatasetQuality:
+    """Load ``path`` and return its quality metrics.
+
+    When ``chunk_size`` is given the file is streamed through
+    :func:`evaluate_data_quality_chunks` instead of being loaded in one piece.
+    Streamed Parquet files are read in batches of ``chunk_size`` rows that stay
+    within one row group, and null counts are seeded from the footer statistics
+    when every row group has them, so batches known to hold no nulls or only
+    nulls skip that work.
+    ``columns`` restricts the evaluation to those columns. ``engine`` selects the
+    CSV parser of :func:`~quality_toolkit.data_loader.load_dataset`; the ``"arrow"``
+    engine reads whole files only and cannot be combined with ``chunk_size``.
+    ``optimize_memory`` loads the file with compact dtypes and records each
+    column's memory footprint before and after; it also requires a whole-file load.
+    ``summary`` adds the sketch-based numeric summary of
+    :class:`~quality_toolkit.analysis.SummaryAccumulator`, in the same pass as the
+    other metrics when the file is streamed. ``rules`` evaluates a
+    :class:`~quality_toolkit.rules.RuleSet` in that pass too.
+
+    With a :class:`~quality_toolkit.cache.ResultCache`, results are looked up by
+    the file's path, size and modification time (plus its SHA-256 when
+    ``content_hash`` is set) and the parameters that affect the result.
+
+    A :class:`~quality_toolkit.profiling.Profiler` records the load and evaluation
+    stages (an ``evaluate.stream`` span for chunked reads and a ``cache.lookup``
+    span when a cache is used); the result carries them as ``timings``. Cached
+    results are stored without timings.
+    """
+
+    options: Dict[str, Any] = {
+        "sample_size": sample_size,
+        "delimiter": delimiter,
+        "encoding": encoding,
+        "sheet_name": sheet_name,
+        "columns": None if columns is None else list(columns),
+        "distinct_error": distinct_error,
+        "duplicate_mode": duplicate_mode,
+        "engine": engine,
+        "optimize_memory": optimize_memory,
+        "summary": summary,
+        "rules": rules,
+    }
+    if engine == "arrow" and chunk_size is not None:
+        raise ValueError("The arrow CSV engine does not support chunked reading")
+    if optimize_memory and chunk_size is not None:
+        raise ValueError("Memory optimization applies to whole-file loads, not chunked reading")
+    profiler = resolve_profiler(profiler)
+    if cache is None:
+        quality = _evaluate_file(
+            path, chunk_size=chunk_size, workers=workers, profiler=profiler, **options
+        )
+        return attach_timings(quality, profiler)
+
+    with profiler.span("cache.lookup") as span:
+        key = cache.key(path, options, content_hash=content_hash)
+        cached = cache.get(key)
+        span.rows = None if cached is None else cached.row_count
+    if cached is not None:
+        return attach_timings(cached, profiler)
+    quality = _evaluate_file(
+        path, chunk_size=chunk_size, workers=workers, profiler=profiler, **options
+    )
+    cache.put(key, replace(quality, timings=None))
+    return attach_timings(quality, profiler)
+
+
+def evaluate_sheets(
+    path: str | Path,
+    sheet_names: Optional[Sequence[str]] = None,
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **options: Any,
+) -> Dict[str, DatasetQuality]:
+    """Evaluate several sheets of an Excel workbook, each streamed in chunks.
+
+    ``sheet_names`` defaults to every sheet, listed without parsing any of them.
+    Sheet parsing is pure Python and holds the GIL, so with ``workers`` greater
+    than one the sheets are evaluated concurrently in separate processes. Other
+    keyword arguments are passed to :func:`evaluate_file`. Results keep the
+    order of ``sheet_names``.
+    """
+
+    names = list_excel_sheets(path) if sheet_names is None else list(sheet_names)
+    pool_size = min(resolve_workers(workers), len(names))
+    if pool_size <= 1:
+        return {
+            name: evaluate_file(path, sheet_name=name, chunk_size=chunk_size, **options)
+            for name in names
+        }
+
+    with process_pool(pool_size) as pool:
+        futures = {
+            name: pool.submit(
+                evaluate_file, path, sheet_name=name, chunk_size=chunk_size, **options
+            )
+            for name in names
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _evaluate_file(
+    path: str | Path,
+    *,
+    sample_size: int,
+    delimiter: Optional[str],
+    chunk_size: Optional[int],
+    encoding: str,
+    sheet_name: str | int | None,
+    columns: Optional[Sequence[str]],
+    distinct_error: Optional[float],
+    duplicate_mode: str,
+    workers: Optional[int],
+    engine: str,
+    optimize_memory: bool,
+    profiler: Profiler,
+    summary: bool,
+    rules: Optional[RuleSet],
+) -> DatasetQuality:
+    if chunk_size is None:
+        dataset = load_dataset(
+            path,
+            encoding=encoding,
+            delimiter=delimiter,
+            sheet_name=sheet_name,
+            columns=columns,
+            engine=engine,
+            optimize_memory=optimize_memory,
+            profiler=profiler,
+        )
+        return evaluate_data_quality(
+            dataset,
+            sample_size=sample_size,
+            distinct_error=distinct_error,
+            duplicate_mode=duplicate_mode,
+            workers=workers,
+            memory_usage=optimize_memory,
+            profiler=profiler,
+            summary=summary,
+            rules=rules,
+        )
+
+    with profiler.span("evaluate.stream") as span:
+        quality = _evaluate_chunked(
+            path,
+            chunk_size=chunk_size,
+            sample_size=sample_size,
+            delimiter=delimiter,
+            encoding=encoding,
+            sheet_name=sheet_name,
+            columns=columns,
+            distinct_error=distinct_error,
+            duplicate_mode=duplicate_mode,
+            workers=workers,
+            summary=summary,
+            rules=rules,
+        )
+        span.rows = quality.row_count
+    return quality
+
+
+def _evaluate_chunked(
+    path: str | Path,
+    *,
+    chunk_size: int,
+    sample_size: int,
+    delimiter: Optional[str],
+    encoding: str,
+    sheet_name: str | int | None,
+    columns: Optional[Sequence[str]],
+    distinct_error: Optional[float],
+    duplicate_mode: str,
+    workers: Optional[int],
+    summary: bool,
+    rules: Optional[RuleSet],
+) -> DatasetQuality:
+    if Path(path).suffix.lower() == ".parquet":
+        quality = _evaluate_parquet_with_statistics(
+            path,
+            chunk_size=chunk_size,
+            columns=columns,
+            sample_size=sample_size,
+            distinct_error=distinct_error,
+            duplicate_mode=duplicate_mode,
+            workers=workers,
+            summary=summary,
+            rules=rules,
+        )
+        if quality is not None:
+            return quality
+
+    chunks = iter_dataset_chunks(
+        path,
+        chunk_size=chunk_size,
+        encoding=encoding,
+        delimiter=delimiter,
+        sheet_name=sheet_name,
+        columns=columns,
+    )
+    return evaluate_data_quality_chunks(
+        chunks,
+        sample_size=sample_size,
+        distinct_error=distinct_error,
+        duplicate_mode=duplicate_mode,
+        workers=workers,
+        summary=summary,
+        rules=rules,
+    )
+
+
+def _evaluate_parquet_with_statistics(
+    path: str | Path,
+    *,
+    chunk_size: int,
+    columns: Optional[Sequence[str]],
+    sample_size: int,
+    distinct_error: Optional[float],
+    duplicate_mode: str,
+    workers: Optional[int],
+    summary: bool,
+    rules: Optional[RuleSet],
+) -> Optional[DatasetQuality]:
+    statistics = read_parquet_statistics(path, columns)
+    if statistics.row_count == 0 or None in statistics.null_counts.values():
+        return None
+
+    accumulator = DatasetAccumulator(
+        sample_size=sample_size,
+        distinct_error=distinct_error,
+        duplicate_mode=duplicate_mode,
+        workers=workers,
+        summary=summary,
+        rules=rules,
+    )
+    # Parquet does not count NaN as null, so float columns still count gaps themselves.
+    float_columns = {name for name, dtype in statistics.dtypes.items() if dtype.startswith("float")}
+    try:
+        for group_index, chunk in iter_parquet_row_groups(path, columns, batch_size=chunk_size):
+            group_rows = statistics.row_group_row_counts[group_index]
+            known: Dict[str, Optional[int]] = {}
+            for name, count in statistics.row_group_null_counts[group_index].items():
+                if name in float_columns:
+                    continue
+                # A batch's count follows from its row group's when the batch is the whole
+                # group or the group holds no nulls or nothing but nulls.
+                if len(chunk) == group_rows or count == 0:
+                    known[name] = count
+                elif count == group_rows:
+                    known[name] = len(chunk)
+            accumulator.update(chunk, missing_counts=known)
+        return accumulator.result()
+    finally:
+        accumulator.close()
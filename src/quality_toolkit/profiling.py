@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+SpanHook = Callable[["Span"], None]
+
+
+@dataclass(frozen=True)
+class Span:
+    """Wall time, rows and peak traced memory of one instrumented stage.
+
+    ``name`` is dotted by stage, e.g. ``"load.parse"`` or ``"evaluate.column"``;
+    per-column spans also carry the ``column`` name. ``depth`` is the nesting level
+    and ``peak_memory_bytes`` the traced high-water mark above the memory in use
+    when the span started (``None`` when memory is not traced).
+    """
+
+    name: str
+    seconds: float
+    rows: Optional[int] = None
+    peak_memory_bytes: Optional[int] = None
+    column: Optional[str] = None
+    depth: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Span:
+        return cls(**data)
+
+
+class _OpenSpan:
+    __slots__ = ("name", "column", "rows", "depth", "index", "base", "peak", "start")
+
+    def __init__(self, name: str, column: Optional[str], rows: Optional[int], depth: int) -> None:
+        self.name = name
+        self.column = column
+        self.rows = rows
+        self.depth = depth
+        self.index = 0
+        self.base = 0
+        self.peak = 0
+        self.start = 0.0
+
+
+class _SpanContext:
+    __slots__ = ("_profiler", "_span")
+
+    def __init__(self, profiler: Profiler, span: _OpenSpan) -> None:
+        self._profiler = profiler
+        self._span = span
+
+    def __enter__(self) -> _OpenSpan:
+        self._profiler._enter(self._span)
+        return self._span
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._profiler._exit(self._span)
+
+
+class Profiler:
+    """Record :class:`Span` objects for the stages run inside :meth:`span` blocks.
+
+    Spans are listed in the order they started, so a stage precedes its
+    sub-stages. Each finished span is passed to every hook, which is how spans
+    are forwarded to an external metrics system. With ``trace_memory`` the
+    profiler starts :mod:`tracemalloc` (and stops it in :meth:`close` if it
+    started it), which slows allocation-heavy code down noticeably.
+
+    Spans are recorded from the thread that owns the profiler; work fanned out to
+    worker pools is measured as one span around the whole pool.
+    """
+
+    enabled = True
+
+    def __init__(self, hooks: Sequence[SpanHook] = (), *, trace_memory: bool = True) -> None:
+        self._hooks: List[SpanHook] = list(hooks)
+        self._trace_memory = trace_memory
+        self._started_tracing = False
+        self._records: List[Optional[Span]] = []
+        self._stack: List[_OpenSpan] = []
+
+    @property
+    def spans(self) -> List[Span]:
+        """Finished spans in start order."""
+
+        return [span for span in self._records if span is not None]
+
+    def add_hook(self, hook: SpanHook) -> None:
+        self._hooks.append(hook)
+
+    def span(
+        self, name: str, *, rows: Optional[int] = None, column: Optional[str] = None
+    ) -> _SpanContext:
+        """Return a context manager timing ``name``; set ``.rows`` on it once known."""
+
+        return _SpanContext(self, _OpenSpan(name, column, rows, len(self._stack)))
+
+    def close(self) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def __enter__(self) -> Profiler:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _enter(self, span: _OpenSpan) -> None:
+        span.index = len(self._records)
+        self._records.append(None)
+        if self._trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                # The peak is reset for the new span, so hand the old one to the parent.
+                self._stack[-1].peak = max(self._stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+            span.base = span.peak = current
+        self._stack.append(span)
+        span.start = time.perf_counter()
+
+    def _exit(self, span: _OpenSpan) -> None:
+        seconds = time.perf_counter() - span.start
+        self._stack.pop()
+        peak_memory = None
+        if self._trace_memory and tracemalloc.is_tracing():
+            span.peak = max(span.peak, tracemalloc.get_traced_memory()[1])
+            peak_memory = span.peak - span.base
+            if self._stack:
+                self._stack[-1].peak = max(self._stack[-1].peak, span.peak)
+        record = Span(
+            name=span.name,
+            seconds=seconds,
+            rows=span.rows,
+            peak_memory_bytes=peak_memory,
+            column=span.column,
+            depth=span.depth,
+        )
+        self._records[span.index] = record
+        for hook in self._hooks:
+            hook(record)
+
+
+class _NullSpan:
+    """Shared do-nothing span; assigning ``rows`` on it is harmless."""
+
+    rows: Optional[int] = None
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+class _NullProfiler:
+    enabled = False
+    spans: List[Span] = []
+
+    def span(self, name: str, *, rows: Optional[int] = None, column: Optional[str] = None) -> Any:
+        return _NULL_SPAN
+
+
+_NULL_SPAN = _NullSpan()
+NULL_PROFILER: Any = _NullProfiler()
+
+
+def resolve_profiler(profiler: Optional[Profiler]) -> Profiler:
+    """Return ``profiler``, or a shared profiler that records nothing at almost no cost."""
+
+    return NULL_PROFILER if profiler is None else profiler
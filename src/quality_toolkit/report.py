@@ -1,50 +1,299 @@
 ﻿from __future__ import annotations
 
-from .analysis import DatasetQuality
+import math
+from typing import TYPE_CHECKING, Iterator, Mapping, Sequence
 
+from .analysis import ColumnQuality, DatasetQuality
+from .profiling import Span
 
-def build_markdown_report(dataset_quality: DatasetQuality) -> str:
-    """Return a markdown representation of ``dataset_quality``."""
+if TYPE_CHECKING:
+    from .batch import BatchResult
+    from .drift import ColumnDiff, DatasetDiff
 
-    lines: list[str] = ["# Data Quality Report", ""]
-    lines.extend(_build_overview(dataset_quality))
-    lines.append("")
-    lines.extend(_build_column_section(dataset_quality))
+
+def build_markdown_report(
+    dataset_quality: DatasetQuality, *, title: str = "Data Quality Report", level: int = 1
+) -> str:
+    """Return a markdown representation of ``dataset_quality``.
+
+    ``level`` sets the heading depth of ``title``; sections are nested one level below.
+    """
+
+    lines = iter_markdown_report(dataset_quality, title=title, level=level)
+    return "\n".join(lines).strip() + "\n"
+
+
+def iter_markdown_report(
+    dataset_quality: DatasetQuality, *, title: str = "Data Quality Report", level: int = 1
+) -> Iterator[str]:
+    """Yield the lines of :func:`build_markdown_report` one at a time.
+
+    The column table is produced row by row, so a writer can stream reports of
+    very wide tables without holding the whole document.
+    """
+
+    yield f"{'#' * level} {title}"
+    yield ""
+    yield from _build_overview(dataset_quality)
+    yield ""
+    yield from _iter_column_section(dataset_quality, level + 1)
+    if dataset_quality.summary:
+        yield ""
+        yield from _iter_summary_section(dataset_quality, level + 1)
+    if dataset_quality.rule_results:
+        yield ""
+        yield from _iter_rule_section(dataset_quality, level + 1)
 
     if dataset_quality.warnings:
-        lines.append("")
-        lines.append("## Warnings")
+        yield ""
+        yield f"{'#' * (level + 1)} Warnings"
         for warning in dataset_quality.warnings:
-            lines.append(f"- {warning}")
+            yield f"- {warning}"
 
-    return "\n".join(lines).strip() + "\n"
+
+def build_batch_summary(results: Sequence[BatchResult]) -> str:
+    """Return a markdown table with one row per file of a batch."""
+
+    lines = [
+        "| File | Status | Rows | Duplicate rows | Columns | Warnings | Seconds |",
+        "| --- | --- | --- | --- | --- | --- | --- |",
+    ]
+    for result in results:
+        quality = result.quality
+        if quality is None:
+            lines.append(
+                f"| {result.path} | error: {result.error} | — | — | — | — "
+                f"| {result.seconds:.2f} |"
+            )
+            continue
+        lines.append(
+            f"| {result.path} | ok | {quality.row_count} | {quality.duplicate_rows} "
+            f"| {len(quality.columns)} | {len(quality.warnings)} | {result.seconds:.2f} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def build_batch_report(results: Sequence[BatchResult]) -> str:
+    """Return one markdown document with a batch summary followed by every file's report."""
+
+    sections = ["# Batch Data Quality Report", "", build_batch_summary(results)]
+    for result in results:
+        if result.quality is not None:
+            sections.append(build_markdown_report(result.quality, title=str(result.path), level=2))
+    return "\n".join(sections).strip() + "\n"
+
+
+def build_sheets_report(path: object, sheets: Mapping[str, DatasetQuality]) -> str:
+    """Return one markdown document with a section per evaluated workbook sheet."""
+
+    sections = [f"# Data Quality Report: {path}", ""]
+    for name, quality in sheets.items():
+        sections.append(build_markdown_report(quality, title=f"Sheet: {name}", level=2))
+    return "\n".join(sections).strip() + "\n"
+
+
+def build_profile_table(spans: Sequence[Span], *, max_columns: int = 10) -> str:
+    """Return a markdown breakdown of profiled stages.
+
+    Only the ``max_columns`` slowest per-column spans are listed; the rest are
+    folded into one row. Shares are relative to the time of the top-level spans.
+    """
+
+    total = sum(span.seconds for span in spans if span.depth == 0)
+    column_spans = [span for span in spans if span.column is not None]
+    slowest = sorted(column_spans, key=lambda span: span.seconds, reverse=True)[:max_columns]
+    shown = {id(span) for span in slowest}
+    lines = [
+        "| Stage | Column | Rows | Time | Share | Peak memory |",
+        "| --- | --- | --- | --- | --- | --- |",
+    ]
+    for span in spans:
+        if span.column is not None and id(span) not in shown:
+            continue
+        lines.append(_profile_row(span, span.column or "", total))
+    hidden = [span for span in column_spans if id(span) not in shown]
+    if hidden:
+        folded = Span(
+            name=hidden[0].name,
+            seconds=sum(span.seconds for span in hidden),
+            rows=hidden[0].rows,
+            depth=hidden[0].depth,
+        )
+        lines.append(_profile_row(folded, f"{len(hidden)} more columns", total))
+    return "\n".join(lines) + "\n"
+
+
+def _profile_row(span: Span, column: str, total: float) -> str:
+    indent = "&nbsp;&nbsp;" * span.depth
+    rows = "—" if span.rows is None else f"{span.rows:,}"
+    share = f"{span.seconds / total:.1%}" if total else "—"
+    memory = "—" if span.peak_memory_bytes is None else format_bytes(span.peak_memory_bytes)
+    return (
+        f"| {indent}{span.name} | {column} | {rows} | {span.seconds * 1000:.1f} ms "
+        f"| {share} | {memory} |"
+    )
+
+
+def build_diff_report(diff: DatasetDiff, *, title: str = "Data Drift Report") -> str:
+    """Return a markdown comparison of two dataset profiles."""
+
+    old_source = diff.old_source or "—"
+    new_source = diff.new_source or "—"
+    lines = [
+        f"# {title}",
+        "",
+        "| Metric | Old | New |",
+        "| --- | --- | --- |",
+        f"| Source | {_escape_cell(old_source)} | {_escape_cell(new_source)} |",
+        f"| Rows | {diff.old_row_count} | {diff.new_row_count} |",
+        f"| Columns | {sum(column.old_dtype is not None for column in diff.columns)} "
+        f"| {sum(column.new_dtype is not None for column in diff.columns)} |",
+        "",
+        "## Columns",
+        "",
+    ]
+    if not diff.columns:
+        lines.append("_No columns detected._")
+    else:
+        lines.append("| Name | Dtype | Missing | Distinct | Shift | Changes |")
+        lines.append("| --- | --- | --- | --- | --- | --- |")
+        lines.extend(_diff_row(column) for column in diff.columns)
+
+    if diff.warnings:
+        lines.extend(["", "## Warnings"])
+        lines.extend(f"- {warning}" for warning in diff.warnings)
+    return "\n".join(lines) + "\n"
+
+
+def _diff_row(column: ColumnDiff) -> str:
+    def change(old: object, new: object) -> str:
+        if old == new:
+            return str(old)
+        return f"{'—' if old is None else old} → {'—' if new is None else new}"
+
+    def ratio(value: float | None) -> str | None:
+        return None if value is None else f"{value:.1%}"
+
+    def distinct(value: int | None) -> str | None:
+        return None if value is None else f"~{value}"
+
+    shift = "—" if column.shift is None else f"{column.shift:.3f} ({column.shift_metric})"
+    return (
+        f"| {column.name} | {change(column.old_dtype, column.new_dtype)} "
+        f"| {change(ratio(column.old_missing_ratio), ratio(column.new_missing_ratio))} "
+        f"| {change(distinct(column.old_distinct), distinct(column.new_distinct))} "
+        f"| {shift} | {', '.join(column.changes) or '—'} |"
+    )
 
 
 def _build_overview(dataset_quality: DatasetQuality) -> list[str]:
-    return [
+    lines = [
         "| Metric | Value |",
         "| --- | --- |",
         f"| Rows | {dataset_quality.row_count} |",
         f"| Duplicate rows | {dataset_quality.duplicate_rows} |",
     ]
+    if dataset_quality.duplicates_are_estimate:
+        false_positive_rate = dataset_quality.duplicate_false_positive_rate
+        lines.append(f"| Duplicate false-positive rate | {false_positive_rate:.2e} |")
+    columns = list(dataset_quality.columns.values())
+    if columns and all(column.memory_bytes is not None for column in columns):
+        memory = sum(column.memory_bytes or 0 for column in columns)
+        defaults = [column.default_memory_bytes for column in columns]
+        default = None if None in defaults else sum(d or 0 for d in defaults)
+        lines.append(f"| Memory | {_format_memory(memory, default)} |")
+    return lines
 
 
-def _build_column_section(dataset_quality: DatasetQuality) -> list[str]:
+def _iter_column_section(dataset_quality: DatasetQuality, level: int = 2) -> Iterator[str]:
+    yield f"{'#' * level} Columns"
+    yield ""
     if not dataset_quality.columns:
-        return ["## Columns", "", "_No columns detected._"]
+        yield "_No columns detected._"
+        return
 
-    lines = [
-        "## Columns",
-        "",
-        "| Name | Dtype | Missing | Distinct | Samples |",
-        "| --- | --- | --- | --- | --- |",
-    ]
+    columns = dataset_quality.columns.values()
+    show_memory = any(column.memory_bytes is not None for column in columns)
+    header = "| Name | Dtype | Missing | Distinct | Samples |"
+    rule = "| --- | --- | --- | --- | --- |"
+    if show_memory:
+        header += " Memory |"
+        rule += " --- |"
+    yield header
+    yield rule
 
     for name, column in dataset_quality.columns.items():
         missing_display = f"{column.missing_count} ({column.missing_ratio:.1%})"
         sample_display = ", ".join(column.sample_values[:5]) if column.sample_values else "—"
-        lines.append(
-            f"| {name} | {column.dtype} | {missing_display} | {column.distinct_count} | {sample_display} |"
+        line = (
+            f"| {name} | {column.dtype} | {missing_display} | {format_distinct_count(column)} "
+            f"| {sample_display} |"
         )
+        if show_memory:
+            memory = column.memory_bytes
+            display = "—" if memory is None else _format_memory(memory, column.default_memory_bytes)
+            line += f" {display} |"
+        yield line
 
-    return lines
+
+def _iter_summary_section(dataset_quality: DatasetQuality, level: int = 2) -> Iterator[str]:
+    summaries = dataset_quality.summary or {}
+    labels = list(next(iter(summaries.values())).quantiles)
+    yield f"{'#' * level} Numeric Summary"
+    yield ""
+    yield "| Name | Count | Mean | Std | Min | " + " | ".join(labels) + " | Max |"
+    yield "| --- " * (6 + len(labels)) + "|"
+    for name, summary in summaries.items():
+        values = [summary.mean, summary.std, summary.min, *summary.quantiles.values(), summary.max]
+        cells = " | ".join(_format_number(value) for value in values)
+        yield f"| {name} | {summary.count} | {cells} |"
+    error = max(summary.quantile_error for summary in summaries.values())
+    if error:
+        yield ""
+        yield f"_Percentiles are estimates within ±{error:.2%} in rank._"
+
+
+def _iter_rule_section(dataset_quality: DatasetQuality, level: int = 2) -> Iterator[str]:
+    yield f"{'#' * level} Rules"
+    yield ""
+    yield "| Rule | Columns | Status | Violations | Ratio | Examples |"
+    yield "| --- | --- | --- | --- | --- | --- |"
+    for result in dataset_quality.rule_results or []:
+        status = "pass" if result.passed else "fail"
+        examples = "; ".join(f"row {row}: {value}" for row, value in result.examples) or "—"
+        yield (
+            f"| {_escape_cell(result.name)} | {', '.join(result.columns)} | {status} "
+            f"| {result.violations:,} | {result.violation_ratio:.1%} | {_escape_cell(examples)} |"
+        )
+
+
+def _escape_cell(text: str) -> str:
+    return text.replace("|", "\\|")
+
+
+def _format_number(value: float) -> str:
+    return "—" if math.isnan(value) else f"{value:.6g}"
+
+
+def format_distinct_count(column: ColumnQuality) -> str:
+    """Return the distinct count of ``column``, marking sketch estimates with their error."""
+
+    if column.distinct_is_estimate:
+        return f"~{column.distinct_count} (±{column.distinct_error:.1%})"
+    return str(column.distinct_count)
+
+
+def format_bytes(size: float) -> str:
+    """Return ``size`` in bytes with a binary unit, e.g. ``"1.5 MiB"``."""
+
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(size) < 1024 or unit == "GiB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def _format_memory(memory: int, default: int | None) -> str:
+    if default is None:
+        return format_bytes(memory)
+    return f"{format_bytes(memory)} (default {format_bytes(default)})"
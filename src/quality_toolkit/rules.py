@@ -0,0 +1,550 @@
+from __future__ import annotations
+
+import operator
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .analysis import factorize_column, format_value
+from .duplicates import ExactDuplicateDetector
+from .parallel import resolve_workers
+from .sketches import hash_series
+
+CHECKS = ("not_null", "range", "regex", "allowed", "unique", "compare")
+COMPARISONS: Dict[str, Callable[[Any, Any], Any]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+DEFAULT_EXAMPLE_LIMIT = 5
+
+
+@dataclass(frozen=True)
+class Rule:
+    """One declarative check on ``column``.
+
+    ``check`` is one of :data:`CHECKS`:
+
+    - ``not_null``: the value is present;
+    - ``range``: the value is a number within ``min`` and ``max`` (inclusive, either
+      may be omitted);
+    - ``regex``: the value, as text, matches ``pattern`` in full;
+    - ``allowed``: the value is one of ``values``;
+    - ``unique``: the value does not occur in an earlier row (compared by 64-bit hash);
+    - ``compare``: ``column <op> other`` holds, with ``op`` one of :data:`COMPARISONS`.
+
+    Missing values only violate ``not_null``; ``compare`` skips rows where either
+    side is missing. The rule fails when more than ``max_ratio`` of the rows
+    violate it.
+    """
+
+    check: str
+    column: str
+    name: str = ""
+    min: Optional[float] = None
+    max: Optional[float] = None
+    pattern: Optional[str] = None
+    values: Optional[Tuple[Any, ...]] = None
+    other: Optional[str] = None
+    op: Optional[str] = None
+    max_ratio: float = 0.0
+
+    def __post_init__(self) -> None:
+        label = self.name or f"{self.column} {self.check}"
+        if self.check not in CHECKS:
+            raise ValueError(f"Rule '{label}': unknown check '{self.check}'")
+        if self.check == "range" and self.min is None and self.max is None:
+            raise ValueError(f"Rule '{label}': range needs min or max")
+        if self.check == "regex":
+            if self.pattern is None:
+                raise ValueError(f"Rule '{label}': regex needs a pattern")
+            try:
+                re.compile(self.pattern)
+            except re.error as error:
+                raise ValueError(f"Rule '{label}': invalid pattern: {error}") from error
+        if self.check == "allowed" and not self.values:
+            raise ValueError(f"Rule '{label}': allowed needs values")
+        if self.check == "compare" and (self.other is None or self.op not in COMPARISONS):
+            operators = ", ".join(COMPARISONS)
+            raise ValueError(f"Rule '{label}': compare needs other and op ({operators})")
+        if not 0 <= self.max_ratio < 1:
+            raise ValueError(f"Rule '{label}': max_ratio must be in [0, 1)")
+        if self.values is not None:
+            object.__setattr__(self, "values", tuple(self.values))
+        object.__setattr__(self, "name", label)
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        """The columns the rule reads."""
+
+        return (self.column,) if self.other is None else (self.column, self.other)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> Rule:
+        known = {item.name for item in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"Unknown rule keys: {', '.join(sorted(unknown))}")
+        for key in ("check", "column"):
+            if key not in data:
+                raise ValueError(f"Rule is missing '{key}': {dict(data)}")
+        return cls(**data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the keys that differ from their defaults, as :meth:`from_dict` reads them."""
+
+        data: Dict[str, Any] = {}
+        for item in fields(self):
+            value = getattr(self, item.name)
+            if value != item.default:
+                data[item.name] = list(value) if isinstance(value, tuple) else value
+        return data
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    """The rules to evaluate and how many example rows to keep per rule."""
+
+    rules: Tuple[Rule, ...]
+    example_limit: int = DEFAULT_EXAMPLE_LIMIT
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "rules", tuple(self.rules))
+        names = [rule.name for rule in self.rules]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate rule names: {', '.join(duplicates)}")
+        if self.example_limit < 0:
+            raise ValueError("example_limit must not be negative")
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> RuleSet:
+        """Build a rule set from ``{"rules": [...], "example_limit": n}``."""
+
+        unknown = set(data) - {"rules", "example_limit"}
+        if unknown:
+            raise ValueError(f"Unknown rule file keys: {', '.join(sorted(unknown))}")
+        rules = data.get("rules") or []
+        if not isinstance(rules, list):
+            raise ValueError("'rules' must be a list of tables")
+        return cls(
+            tuple(Rule.from_dict(rule) for rule in rules),
+            data.get("example_limit", DEFAULT_EXAMPLE_LIMIT),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "rules": [rule.to_dict() for rule in self.rules],
+            "example_limit": self.example_limit,
+        }
+
+    def by_column(self) -> Dict[str, List[Rule]]:
+        """Group the rules by the column they check, in order of first appearance."""
+
+        groups: Dict[str, List[Rule]] = {}
+        for rule in self.rules:
+            groups.setdefault(rule.column, []).append(rule)
+        return groups
+
+
+@dataclass(frozen=True)
+class RuleResult:
+    """Outcome of one :class:`Rule`: how many rows violate it and a few of them.
+
+    ``examples`` holds ``(row, value)`` pairs for the first violating rows, where
+    ``row`` is the 0-based position in the dataset.
+    """
+
+    name: str
+    check: str
+    columns: List[str]
+    rows_checked: int
+    violations: int
+    examples: List[Tuple[int, str]]
+    max_ratio: float = 0.0
+
+    @property
+    def violation_ratio(self) -> float:
+        return self.violations / self.rows_checked if self.rows_checked else 0.0
+
+    @property
+    def passed(self) -> bool:
+        return self.violation_ratio <= self.max_ratio
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> RuleResult:
+        values = dict(data)
+        values["examples"] = [(int(row), str(value)) for row, value in values["examples"]]
+        return cls(**values)
+
+
+def load_rules(path: str | Path) -> RuleSet:
+    """Read a :class:`RuleSet` from a TOML or YAML file.
+
+    Both formats hold a ``rules`` list of tables whose keys are the fields of
+    :class:`Rule`, and optionally ``example_limit``. YAML needs PyYAML, and TOML
+    on Python 3.10 needs tomli.
+    """
+
+    target = Path(path)
+    if not target.exists():
+        raise FileNotFoundError(f"Rule file not found: {target}")
+    suffix = target.suffix.lower()
+    if suffix == ".toml":
+        try:
+            import tomllib
+        except ImportError:  # Python 3.10
+            import tomli as tomllib
+        with target.open("rb") as handle:
+            try:
+                data = tomllib.load(handle)
+            except tomllib.TOMLDecodeError as error:
+                raise ValueError(f"Invalid TOML in {target}: {error}") from error
+    elif suffix in (".yaml", ".yml"):
+        import yaml
+
+        with target.open(encoding="utf-8") as handle:
+            try:
+                data = yaml.safe_load(handle) or {}
+            except yaml.YAMLError as error:
+                raise ValueError(f"Invalid YAML in {target}: {error}") from error
+    else:
+        raise ValueError(f"Unsupported rule file type: {target.suffix}")
+    if not isinstance(data, dict):
+        raise ValueError(f"{target} must hold a table with a 'rules' list")
+    return RuleSet.from_dict(data)
+
+
+def rule_warnings(results: Sequence[RuleResult]) -> List[str]:
+    """One warning per rule whose violations exceed its ``max_ratio``."""
+
+    return [
+        f"Rule '{result.name}' failed: {result.violations:,} of {result.rows_checked:,} rows "
+        f"({result.violation_ratio:.1%}) violate it."
+        for result in results
+        if not result.passed
+    ]
+
+
+def evaluate_rules(
+    df: pd.DataFrame,
+    rules: RuleSet,
+    *,
+    workers: Optional[int] = None,
+    factorized: Optional[Mapping[Any, Tuple[np.ndarray, Any]]] = None,
+) -> List[RuleResult]:
+    """Evaluate ``rules`` on ``df`` in one pass per checked column.
+
+    ``factorized`` is passed on to :meth:`RuleAccumulator.update`.
+    """
+
+    accumulator = RuleAccumulator(rules, workers=workers)
+    try:
+        accumulator.update(df, factorized)
+        return accumulator.result()
+    finally:
+        accumulator.close()
+
+
+class _ColumnViews:
+    """Lazily derived forms of one column, shared by every rule on that column.
+
+    Each form (null mask, numbers, factorization, hashes) is computed at most
+    once per chunk however many rules use it, which is what keeps extra rules
+    cheap. Text checks run on the distinct values of the factorization and are
+    broadcast back to the rows through its codes.
+    """
+
+    __slots__ = ("series", "_missing", "_numbers", "_codes", "_uniques", "_hashes")
+
+    def __init__(
+        self, series: pd.Series, factorized: Optional[Tuple[np.ndarray, Any]] = None
+    ) -> None:
+        self.series = series
+        self._missing: Optional[np.ndarray] = None
+        self._numbers: Optional[np.ndarray] = None
+        self._codes: Optional[np.ndarray] = None
+        self._uniques: Optional[pd.Series] = None
+        self._hashes: Optional[np.ndarray] = None
+        if factorized is not None:
+            self._codes = factorized[0]
+            self._uniques = pd.Series(factorized[1])
+
+    @property
+    def missing(self) -> np.ndarray:
+        if self._missing is None:
+            self._missing = self.series.isna().to_numpy(dtype=bool)
+        return self._missing
+
+    @property
+    def numbers(self) -> np.ndarray:
+        """The values as floats; text that is not a number becomes NaN."""
+
+        if self._numbers is None:
+            series = self.series
+            if pd.api.types.is_bool_dtype(series.dtype) or not pd.api.types.is_numeric_dtype(
+                series.dtype
+            ):
+                series = pd.to_numeric(series, errors="coerce")
+            self._numbers = series.to_numpy(dtype="float64", na_value=np.nan)
+        return self._numbers
+
+    @property
+    def codes(self) -> np.ndarray:
+        """Position of each row's value in :attr:`uniques`; ``-1`` for missing values."""
+
+        self._factorize()
+        return self._codes
+
+    @property
+    def uniques(self) -> pd.Series:
+        self._factorize()
+        return self._uniques
+
+    def _factorize(self) -> None:
+        if self._codes is None:
+            codes, uniques = factorize_column(self.series)
+            self._codes = codes
+            self._uniques = pd.Series(uniques)
+
+    def broadcast(self, valid: np.ndarray) -> np.ndarray:
+        """Map a verdict per distinct value to a violation mask per row."""
+
+        # Code -1 (missing) picks the appended True: missing values never violate.
+        return ~np.append(valid, True)[self.codes]
+
+    @property
+    def hashes(self) -> np.ndarray:
+        if self._hashes is None:
+            self._hashes = hash_series(self.series)
+        return self._hashes
+
+
+class _RuleState:
+    __slots__ = ("rule", "rows_checked", "violations", "examples", "seen")
+
+    def __init__(self, rule: Rule) -> None:
+        self.rule = rule
+        self.rows_checked = 0
+        self.violations = 0
+        self.examples: List[Tuple[int, str]] = []
+        # Hashes of the values seen so far, kept as sorted runs, for ``unique`` rules only.
+        self.seen = ExactDuplicateDetector() if rule.check == "unique" else None
+
+
+class RuleAccumulator:
+    """Mergeable violation counts of a :class:`RuleSet` across DataFrame chunks.
+
+    Rules are grouped by column and each group is evaluated in one pass over its
+    column per chunk: the column's null mask, numeric and text forms are derived
+    once and every rule of the group is a vectorized mask over them. With
+    ``workers`` greater than one the groups of a chunk are evaluated
+    concurrently on a thread pool; groups only read the chunk and update their
+    own rules' state.
+    """
+
+    def __init__(self, rules: RuleSet, workers: Optional[int] = None) -> None:
+        self.rules = rules
+        self.row_count = 0
+        self._states = {rule.name: _RuleState(rule) for rule in rules.rules}
+        self._groups = rules.by_column()
+        pool_size = min(resolve_workers(workers), len(self._groups))
+        self._pool = ThreadPoolExecutor(max_workers=pool_size) if pool_size > 1 else None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
+    @property
+    def columns(self) -> List[str]:
+        """The columns the rules are grouped by, in order of first appearance."""
+
+        return list(self._groups)
+
+    def update(
+        self,
+        chunk: pd.DataFrame,
+        factorized: Optional[Mapping[Any, Tuple[np.ndarray, Any]]] = None,
+    ) -> None:
+        """Fold the rule violations of ``chunk`` into the running counts.
+
+        ``factorized`` optionally maps columns to their
+        :func:`~quality_toolkit.analysis.factorize_column` result for this chunk,
+        which the text checks then reuse instead of factorizing again.
+        """
+
+        shared = factorized or {}
+        for rule in self.rules.rules:
+            for column in rule.columns:
+                if column not in chunk.columns:
+                    raise ValueError(f"Rule '{rule.name}' refers to missing column '{column}'")
+
+        offset = self.row_count
+        if self._pool is None:
+            for column, rules in self._groups.items():
+                self._update_group(chunk, column, rules, offset, shared.get(column))
+        else:
+            futures = [
+                self._pool.submit(
+                    self._update_group, chunk, column, rules, offset, shared.get(column)
+                )
+                for column, rules in self._groups.items()
+            ]
+            for future in futures:
+                future.result()
+        self.row_count += int(len(chunk))
+
+    def merge(self, other: RuleAccumulator) -> None:
+        """Fold the state of ``other``, which saw rows after this accumulator's rows.
+
+        Values of a ``unique`` rule that repeat across the two are counted, but
+        only rows flagged while updating are kept as examples.
+        """
+
+        if other.rules != self.rules:
+            raise ValueError("Cannot merge results of different rule sets")
+        limit = self.rules.example_limit
+        for name, state in self._states.items():
+            theirs = other._states[name]
+            state.rows_checked += theirs.rows_checked
+            state.violations += theirs.violations
+            if state.seen is not None:
+                # Values first seen in ``other`` that already occurred here repeat them.
+                before = state.seen.duplicate_rows + theirs.seen.duplicate_rows
+                state.seen.merge(theirs.seen)
+                state.violations += state.seen.duplicate_rows - before
+            shifted = [(row + self.row_count, value) for row, value in theirs.examples]
+            state.examples.extend(shifted[: max(0, limit - len(state.examples))])
+        self.row_count += other.row_count
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        for state in self._states.values():
+            if state.seen is not None:
+                state.seen.close()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable form of the rule set and its running counts."""
+
+        return {
+            "rule_set": self.rules.to_dict(),
+            "row_count": self.row_count,
+            "states": [
+                {
+                    "rows_checked": state.rows_checked,
+                    "violations": state.violations,
+                    "examples": [list(example) for example in state.examples],
+                    "seen": None if state.seen is None else state.seen.to_dict(),
+                }
+                for state in self._states.values()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], workers: Optional[int] = None) -> RuleAccumulator:
+        accumulator = cls(RuleSet.from_dict(data["rule_set"]), workers=workers)
+        accumulator.row_count = int(data["row_count"])
+        states = list(accumulator._states.values())
+        if len(data["states"]) != len(states):
+            raise ValueError("Saved rule states do not match the rule set")
+        for state, saved in zip(states, data["states"]):
+            state.rows_checked = int(saved["rows_checked"])
+            state.violations = int(saved["violations"])
+            state.examples = [(int(row), str(value)) for row, value in saved["examples"]]
+            if state.seen is not None:
+                state.seen = ExactDuplicateDetector.from_dict(saved["seen"])
+        return accumulator
+
+    def result(self) -> List[RuleResult]:
+        return [
+            RuleResult(
+                name=state.rule.name,
+                check=state.rule.check,
+                columns=list(state.rule.columns),
+                rows_checked=state.rows_checked,
+                violations=state.violations,
+                examples=list(state.examples),
+                max_ratio=state.rule.max_ratio,
+            )
+            for state in self._states.values()
+        ]
+
+    def _update_group(
+        self,
+        chunk: pd.DataFrame,
+        column: str,
+        rules: List[Rule],
+        offset: int,
+        factorized: Optional[Tuple[np.ndarray, Any]],
+    ) -> None:
+        views = _ColumnViews(chunk[column], factorized)
+        for rule in rules:
+            state = self._states[rule.name]
+            violated = _violations(rule, views, chunk, state)
+            state.rows_checked += int(len(chunk))
+            count = int(np.count_nonzero(violated))
+            state.violations += count
+            room = self.rules.example_limit - len(state.examples)
+            if count and room > 0:
+                positions = np.flatnonzero(violated)[:room]
+                values = views.series.iloc[positions].tolist()
+                for position, value in zip(positions.tolist(), values):
+                    state.examples.append((offset + position, _format_example(value)))
+
+
+def _violations(
+    rule: Rule, views: _ColumnViews, chunk: pd.DataFrame, state: _RuleState
+) -> np.ndarray:
+    missing = views.missing
+    if rule.check == "not_null":
+        return missing
+    if rule.check == "range":
+        numbers = views.numbers
+        with np.errstate(invalid="ignore"):
+            outside = np.isnan(numbers)
+            if rule.min is not None:
+                outside |= numbers < rule.min
+            if rule.max is not None:
+                outside |= numbers > rule.max
+        return outside & ~missing
+    if rule.check == "regex":
+        matched = views.uniques.astype("string").str.fullmatch(rule.pattern)
+        return views.broadcast(matched.to_numpy(dtype=bool, na_value=False))
+    if rule.check == "allowed":
+        return views.broadcast(views.uniques.isin(rule.values).to_numpy(dtype=bool))
+    if rule.check == "unique":
+        present = np.flatnonzero(~missing)
+        hashes = views.hashes[present]
+        repeated = pd.Series(hashes).duplicated().to_numpy() | state.seen.contains(hashes)
+        state.seen.add(hashes)
+        violated = np.zeros(len(missing), dtype=bool)
+        violated[present[repeated]] = True
+        return violated
+    return _compare_violations(rule, views, chunk)
+
+
+def _compare_violations(rule: Rule, views: _ColumnViews, chunk: pd.DataFrame) -> np.ndarray:
+    other = chunk[rule.other]
+    try:
+        holds = COMPARISONS[rule.op](views.series, other)
+    except TypeError as error:
+        raise ValueError(
+            f"Rule '{rule.name}': cannot compare '{rule.column}' with '{rule.other}'"
+        ) from error
+    compared = ~views.missing & ~other.isna().to_numpy(dtype=bool)
+    return ~holds.to_numpy(dtype=bool, na_value=True) & compared
+
+
+def _format_example(value: object) -> str:
+    return "<missing>" if pd.isna(value) else format_value(value)
@@ -0,0 +1,513 @@
+from __future__ import annotations
+
+import base64
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+_NULL_HASH = np.uint64(0x9E3779B97F4A7C15)
+_FLOAT_SALT = np.uint64(0xC2B2AE3D27D4EB4F)
+_NUMERIC_TEXT = r"0|-?[1-9][0-9]{0,17}|-?(?:0|[1-9][0-9]{0,15})\.[0-9]{0,16}[1-9]"
+
+
+def hash_series(series: pd.Series) -> np.ndarray:
+    """Return a 64-bit hash per value of ``series`` that is stable across chunk dtypes.
+
+    Chunks of the same column may be parsed as int, float or object depending on
+    the values they hold. Integers are hashed from their 64-bit value, so large IDs
+    stay distinct, and floats holding an integral value in the int64 range hash
+    like that integer, so ``1`` and ``1.0`` agree. Other floats hash their bits
+    under a separate salt, and nulls hash to a constant.
+    """
+
+    hashes, missing = _hash_with_missing(series)
+    hashes[missing] = _NULL_HASH
+    return hashes
+
+
+def _hash_with_missing(series: pd.Series, scan: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    missing = series.isna().to_numpy() if scan else np.zeros(len(series), dtype=bool)
+    if _is_number_dtype(series.dtype):
+        return _hash_numbers(series, missing), missing
+    # Values are hashed directly: factorizing first would build the same hash
+    # table an exact distinct count needs, which is what sketches avoid.
+    return _hash_values(series.array), missing
+
+
+def hash_distinct(values: Any) -> np.ndarray:
+    """Return the :func:`hash_series` hashes of distinct, non-null ``values``.
+
+    Use it on the uniques of a factorization that has already been computed.
+    """
+
+    dtype = getattr(values, "dtype", None)
+    if dtype is not None and _is_number_dtype(dtype):
+        return hash_series(pd.Series(values))
+    return _hash_values(values)
+
+
+def _hash_values(values: Any) -> np.ndarray:
+    hashes = pd.util.hash_array(np.asarray(values, dtype=object), categorize=False)
+    integer_positions, integers, float_positions, floats = find_numeric_text(values)
+    if len(integer_positions):
+        hashes[integer_positions] = _hash_numbers(pd.Series(integers))
+    if len(float_positions):
+        hashes[float_positions] = _hash_numbers(pd.Series(floats))
+    return hashes
+
+
+def find_numeric_text(values: Any) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Find the distinct text ``values`` that are exactly how a number is written.
+
+    A CSV column is parsed as numbers in one chunk and as text in another once a
+    chunk holds a non-numeric value, so ``"1"`` must count as the number ``1``
+    for chunked results to match a whole-file read. Only the canonical spelling
+    qualifies: integers of up to 18 digits without sign or leading zeros, and
+    decimals written as their shortest round-trip form. ``"01"``, ``"+1"`` and
+    ``"1.0"`` stay text, so distinct strings never become equal. Returns the
+    positions and values of the integers, then of the decimals.
+    """
+
+    empty = np.empty(0, dtype=np.intp)
+    dtype = getattr(values, "dtype", None)
+    if isinstance(dtype, pd.StringDtype):
+        text = pd.Series(values)
+    elif pd.api.types.is_object_dtype(dtype):
+        text = pd.Series(values, dtype=object).astype(str)
+    else:
+        return empty, np.empty(0, np.int64), empty, np.empty(0, np.float64)
+    matched = text.str.fullmatch(_NUMERIC_TEXT).to_numpy(dtype=bool, na_value=False)
+    candidates = np.flatnonzero(matched)
+    numbers = text.iloc[candidates]
+    decimal = numbers.str.contains(".", regex=False).to_numpy(dtype=bool)
+    integer_positions = candidates[~decimal]
+    integers = numbers[~decimal].astype("int64").to_numpy()
+    decimals = numbers[decimal]
+    floats = decimals.astype("float64").to_numpy()
+    canonical = floats.astype(str) == decimals.to_numpy(dtype=object)
+    return integer_positions, integers, candidates[decimal][canonical], floats[canonical]
+
+
+def _hash_numbers(series: pd.Series, missing: Optional[np.ndarray] = None) -> np.ndarray:
+    if missing is None:
+        missing = series.isna().to_numpy()
+    if series.dtype.kind in "iu":
+        integer_dtype = np.uint64 if series.dtype.kind == "u" else np.int64
+        hashes = pd.util.hash_array(series.to_numpy(dtype=integer_dtype, na_value=0))
+    else:
+        values = series.to_numpy(dtype="float64", na_value=np.nan)
+        integral = (values == np.floor(values)) & (values >= -(2.0**63)) & (values < 2.0**63)
+        hashes = pd.util.hash_array(values, categorize=False) ^ _FLOAT_SALT
+        if integral.any():
+            hashes[integral] = pd.util.hash_array(values[integral].astype(np.int64))
+    hashes[missing] = _NULL_HASH
+    return hashes
+
+
+def _is_number_dtype(dtype: object) -> bool:
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+
+class HyperLogLog:
+    """Mergeable cardinality sketch with a relative standard error of ``1.04 / sqrt(m)``."""
+
+    MIN_PRECISION = 4
+    MAX_PRECISION = 18
+
+    def __init__(self, precision: int = 14) -> None:
+        if not self.MIN_PRECISION <= precision <= self.MAX_PRECISION:
+            raise ValueError(
+                f"precision must be between {self.MIN_PRECISION} and {self.MAX_PRECISION}"
+            )
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @classmethod
+    def from_error(cls, error: float) -> HyperLogLog:
+        """Create a sketch whose relative standard error is at most ``error``.
+
+        Raises :class:`ValueError` when ``error`` is below what ``MAX_PRECISION``
+        registers achieve.
+        """
+
+        if not 0 < error < 1:
+            raise ValueError("error must be between 0 and 1")
+        smallest = 1.04 / math.sqrt(1 << cls.MAX_PRECISION)
+        if error < smallest:
+            raise ValueError(f"error must be at least {smallest:.6f}")
+        precision = math.ceil(math.log2((1.04 / error) ** 2))
+        return cls(min(max(precision, cls.MIN_PRECISION), cls.MAX_PRECISION))
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def update(self, series: pd.Series, missing_count: Optional[int] = None) -> int:
+        """Add the non-null values of ``series`` to the sketch and return the null count.
+
+        A ``missing_count`` of 0 that is already known skips the scan for nulls.
+        """
+
+        hashes, missing = _hash_with_missing(series, scan=missing_count != 0)
+        self.add_hashes(hashes[~missing])
+        return int(np.count_nonzero(missing))
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        """Add pre-computed 64-bit ``hashes`` to the sketch."""
+
+        if not len(hashes):
+            return
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        remainder = hashes << np.uint64(self.precision)
+        max_rank = 64 - self.precision + 1
+        ranks = np.minimum(64 - _bit_length(remainder) + 1, max_rank).astype(np.uint8)
+        np.maximum.at(self.registers, index, ranks)
+
+    def merge(self, other: HyperLogLog) -> None:
+        """Fold ``other`` into this sketch; both must share the same precision."""
+
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self) -> int:
+        """Return the estimated number of distinct values added."""
+
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / float(np.sum(np.ldexp(1.0, -self.registers.astype(np.int64))))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable form; the registers are base64-encoded bytes."""
+
+        registers = base64.b64encode(self.registers.tobytes()).decode("ascii")
+        return {"precision": self.precision, "registers": registers}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> HyperLogLog:
+        sketch = cls(int(data["precision"]))
+        registers = np.frombuffer(base64.b64decode(data["registers"]), dtype=np.uint8)
+        if len(registers) != len(sketch.registers):
+            raise ValueError("HyperLogLog registers do not match the precision")
+        sketch.registers = registers.copy()
+        return sketch
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    # Each 32-bit half converts to float64 exactly, and frexp's exponent is then
+    # its bit length (0 for 0).
+    high = np.frexp((values >> np.uint64(32)).astype(np.float64))[1]
+    low = np.frexp((values & np.uint64(0xFFFFFFFF)).astype(np.float64))[1]
+    return np.where(high > 0, high + 32, low).astype(np.int64)
+
+
+class KLLSketch:
+    """Mergeable quantile sketch (Karnin, Lang and Liberty) over float values.
+
+    Values are kept in compactors whose items weigh ``2 ** level``. When the
+    sketch outgrows its capacity the lowest overfull level is sorted and every
+    other item, from a random offset, is promoted one level up, so memory stays
+    ``O(k log(n / k))``. The normalized rank error of a quantile is about
+    ``RANK_ERROR / k``. Until the first compaction every value is still held and
+    quantiles are exact, interpolated like :meth:`pandas.Series.quantile`.
+    """
+
+    RANK_ERROR = 1.7
+    MIN_K = 8
+    _CAPACITY_DECAY = 2 / 3
+
+    def __init__(self, k: int = 200, seed: int = 0) -> None:
+        if k < self.MIN_K:
+            raise ValueError(f"k must be at least {self.MIN_K}")
+        self.k = k
+        self.count = 0
+        self._levels: list[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @classmethod
+    def from_error(cls, error: float) -> KLLSketch:
+        """Create a sketch whose normalized rank error is about ``error``."""
+
+        if not 0 < error < 1:
+            raise ValueError("error must be between 0 and 1")
+        return cls(max(cls.MIN_K, math.ceil(cls.RANK_ERROR / error)))
+
+    @property
+    def rank_error(self) -> float:
+        """Expected normalized rank error; ``0.0`` while quantiles are still exact."""
+
+        return 0.0 if self.is_exact else self.RANK_ERROR / self.k
+
+    @property
+    def is_exact(self) -> bool:
+        return len(self._levels) == 1
+
+    def update(self, values: np.ndarray) -> None:
+        """Add ``values``, which must not contain NaN."""
+
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self.count += len(values)
+        self._compress()
+
+    def merge(self, other: KLLSketch) -> None:
+        """Fold ``other`` into this sketch; both must share the same ``k``."""
+
+        if other.k != self.k:
+            raise ValueError("Cannot merge KLL sketches with different k")
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self.count += other.count
+        self._compress()
+
+    def quantiles(self, probabilities: Sequence[float]) -> np.ndarray:
+        """Return the estimated quantile for each probability in ``[0, 1]``."""
+
+        if not self.count:
+            return np.full(len(probabilities), np.nan)
+        if self.is_exact:
+            return np.quantile(self._levels[0], probabilities)
+        items, cumulative = self._sorted_items()
+        targets = np.asarray(probabilities, dtype=np.float64) * self.count
+        positions = np.searchsorted(cumulative, targets, side="left")
+        return items[np.minimum(positions, len(items) - 1)]
+
+    def cdf(self, points: Sequence[float]) -> np.ndarray:
+        """Return the estimated fraction of values less than or equal to each point."""
+
+        points = np.asarray(points, dtype=np.float64)
+        if not self.count:
+            return np.full(len(points), np.nan)
+        items, cumulative = self._sorted_items()
+        positions = np.searchsorted(items, points, side="right")
+        below = np.where(positions > 0, cumulative[np.maximum(positions - 1, 0)], 0)
+        return below / self.count
+
+    def ks_distance(self, other: KLLSketch) -> float:
+        """Return the estimated Kolmogorov-Smirnov distance to ``other``'s distribution.
+
+        Both empirical distribution functions only step at retained items, so the
+        largest gap is found by evaluating them at the items of both sketches.
+        """
+
+        if not self.count or not other.count:
+            return math.nan
+        points = np.concatenate([np.concatenate(self._levels), np.concatenate(other._levels)])
+        return float(np.max(np.abs(self.cdf(points) - other.cdf(points))))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable form holding the retained items of each level."""
+
+        return {
+            "k": self.k,
+            "count": self.count,
+            "levels": [items.tolist() for items in self._levels],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> KLLSketch:
+        sketch = cls(int(data["k"]))
+        sketch.count = int(data["count"])
+        sketch._levels = [np.asarray(items, dtype=np.float64) for items in data["levels"]] or [
+            np.empty(0)
+        ]
+        return sketch
+
+    def _sorted_items(self) -> Tuple[np.ndarray, np.ndarray]:
+        items = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [np.full(len(values), 1 << level) for level, values in enumerate(self._levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        return items[order], np.cumsum(weights[order])
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return max(2, int(self.k * self._CAPACITY_DECAY**depth))
+
+    def _compress(self) -> None:
+        while True:
+            sizes = [len(items) for items in self._levels]
+            if sum(sizes) <= sum(self._capacity(level) for level in range(len(sizes))):
+                return
+            level = next(
+                level for level, size in enumerate(sizes) if size > self._capacity(level)
+            )
+            if level + 1 == len(self._levels):
+                self._levels.append(np.empty(0))
+            items = np.sort(self._levels[level])
+            # An odd item stays behind at its own weight; the rest halve into the next level.
+            even = len(items) - len(items) % 2
+            promoted = items[int(self._rng.integers(2)) : even : 2]
+            self._levels[level] = items[even:]
+            self._levels[level + 1] = np.concatenate([self._levels[level + 1], promoted])
+
+
+class StreamingMoments:
+    """Count, mean, variance, minimum and maximum of a stream of float values.
+
+    Each batch is reduced with NumPy and folded in with the pairwise update of
+    Chan, Golub and LeVeque (Welford's method generalized to batches), which stays
+    numerically stable and makes partial results from chunks or partitions mergeable.
+    """
+
+    __slots__ = ("count", "mean", "m2", "minimum", "maximum")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def update(self, values: np.ndarray) -> None:
+        """Add ``values``, which must not contain NaN."""
+
+        if not len(values):
+            return
+        batch = StreamingMoments()
+        batch.count = int(len(values))
+        batch.mean = float(values.mean())
+        batch.m2 = float(np.square(values - batch.mean).sum())
+        batch.minimum = float(values.min())
+        batch.maximum = float(values.max())
+        self.merge(batch)
+
+    def merge(self, other: StreamingMoments) -> None:
+        if not other.count:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (``ddof=1``), as reported by :meth:`pandas.Series.std`."""
+
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else math.nan
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> StreamingMoments:
+        moments = cls()
+        moments.count = int(data["count"])
+        for name in ("mean", "m2", "minimum", "maximum"):
+            setattr(moments, name, float(data[name]))
+        return moments
+
+
+class FrequentItems:
+    """Mergeable Misra-Gries summary of the most frequent values of a stream.
+
+    At most ``capacity`` values hold a counter. When a batch or a merge leaves more,
+    the ``capacity + 1``-th largest count is subtracted from every counter and the
+    ones that reach zero are dropped, so a kept count underestimates the true
+    frequency by at most ``error``, which never exceeds ``total / (capacity + 1)``.
+    Values are keyed by their string form, with integral floats written like
+    integers, so chunks parsed as int or float agree.
+    """
+
+    def __init__(self, capacity: int = 100) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.total = 0
+        self.error = 0
+        self.counts: Dict[str, int] = {}
+
+    def update(self, series: pd.Series) -> None:
+        """Add the non-null values of ``series`` to the summary."""
+
+        counts = series.value_counts(sort=False, dropna=True)
+        self.add_counts(counts.index, counts.to_numpy())
+
+    def add_counts(self, values: Any, counts: np.ndarray) -> None:
+        """Add distinct ``values`` that occurred ``counts`` times each."""
+
+        counts = np.asarray(counts, dtype=np.int64)
+        total = int(counts.sum())
+        error = 0
+        # Summarize the batch on its own first so only ``capacity`` values get keys.
+        if len(counts) > self.capacity:
+            error = int(np.partition(counts, len(counts) - self.capacity - 1)[-self.capacity - 1])
+            kept = np.flatnonzero(counts > error)
+            values = values[kept]
+            counts = counts[kept] - error
+        batch: Dict[str, int] = {}
+        for key, count in zip(_frequency_keys(values), counts.tolist()):
+            batch[key] = batch.get(key, 0) + count
+        self._add(batch, total, error)
+
+    def merge(self, other: FrequentItems) -> None:
+        """Fold ``other`` into this summary; both must share the same capacity."""
+
+        if other.capacity != self.capacity:
+            raise ValueError("Cannot merge frequent item summaries with different capacity")
+        self._add(other.counts, other.total, other.error)
+
+    def most_common(self, count: int | None = None) -> List[Tuple[str, int]]:
+        """Return up to ``count`` values with their estimated frequency, most frequent first."""
+
+        items = sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))
+        return items if count is None else items[:count]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "total": self.total,
+            "error": self.error,
+            "counts": dict(self.most_common()),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> FrequentItems:
+        summary = cls(int(data["capacity"]))
+        summary.total = int(data["total"])
+        summary.error = int(data["error"])
+        summary.counts = {str(key): int(count) for key, count in data["counts"].items()}
+        return summary
+
+    def _add(self, counts: Dict[str, int], total: int, error: int) -> None:
+        for key, count in counts.items():
+            self.counts[key] = self.counts.get(key, 0) + count
+        self.total += total
+        self.error += error
+        if len(self.counts) > self.capacity:
+            threshold = sorted(self.counts.values(), reverse=True)[self.capacity]
+            self.counts = {
+                key: count - threshold for key, count in self.counts.items() if count > threshold
+            }
+            self.error += threshold
+
+
+def _frequency_keys(values: Any) -> List[str]:
+    dtype = getattr(values, "dtype", None)
+    if dtype is not None and getattr(dtype, "kind", None) in ("i", "u"):
+        return [str(number) for number in np.asarray(values).tolist()]
+    if dtype is not None and _is_number_dtype(dtype):
+        numbers = np.asarray(values, dtype=np.float64)
+        return [_number_key(number) for number in numbers.tolist()]
+    return [str(value) for value in values]
+
+
+def _number_key(number: float) -> str:
+    if number.is_integer() and abs(number) < 2**53:
+        return str(int(number))
+    return repr(number)
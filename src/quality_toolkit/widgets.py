@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+from tkinter import ttk
+from typing import Any, Callable, Hashable, List, Optional, Sequence, Set, Tuple
+
+BUFFER_ROWS = 2
+DEFAULT_ROW_HEIGHT = 20
+
+RowDescription = Tuple[str, Sequence[Any]]
+
+
+class RowWindow:
+    """Filtered and sorted order of row keys plus the slice of it that is on screen.
+
+    Filtering and sorting only rearrange keys; the rows themselves are described
+    on demand for the keys inside :meth:`window`, so the cost of a scroll or a
+    redraw does not grow with the number of rows.
+    """
+
+    def __init__(self) -> None:
+        self.keys: List[Hashable] = []
+        self.visible: List[Hashable] = []
+        self.offset = 0
+        self.size = 1
+        self._match: Optional[Callable[[Hashable], bool]] = None
+        self._sort_key: Optional[Callable[[Hashable], Any]] = None
+        self._reverse = False
+
+    def set_keys(self, keys: Sequence[Hashable]) -> None:
+        self.keys = list(keys)
+        self.offset = 0
+        self._apply()
+
+    def append(self, key: Hashable) -> None:
+        self.keys.append(key)
+        if self._match is not None and not self._match(key):
+            return
+        if self._sort_key is None:
+            self.visible.append(key)
+        else:
+            self.visible.insert(self._insert_position(key, self._sort_key), key)
+
+    def set_filter(self, match: Optional[Callable[[Hashable], bool]]) -> None:
+        self._match = match
+        self.offset = 0
+        self._apply()
+
+    def sort(self, key: Optional[Callable[[Hashable], Any]], reverse: bool = False) -> None:
+        self._sort_key = key
+        self._reverse = reverse
+        self._apply()
+
+    def scroll_to(self, offset: int) -> None:
+        self.offset = max(0, min(offset, len(self.visible) - self.size))
+
+    def window(self) -> List[Hashable]:
+        return self.visible[self.offset : self.offset + self.size]
+
+    def fractions(self) -> Tuple[float, float]:
+        """Return the visible span as scrollbar fractions."""
+
+        if not self.visible:
+            return 0.0, 1.0
+        total = len(self.visible)
+        return self.offset / total, min(1.0, (self.offset + self.size) / total)
+
+    def _apply(self) -> None:
+        match = self._match
+        keys = list(self.keys) if match is None else [key for key in self.keys if match(key)]
+        if self._sort_key is not None:
+            keys.sort(key=self._sort_key, reverse=self._reverse)
+        self.visible = keys
+        self.scroll_to(self.offset)
+
+    def _insert_position(self, key: Hashable, sort_key: Callable[[Hashable], Any]) -> int:
+        # Binary search past any equal keys, matching the stable full sort.
+        value = sort_key(key)
+        low, high = 0, len(self.visible)
+        while low < high:
+            middle = (low + high) // 2
+            current = sort_key(self.visible[middle])
+            if (current < value) if self._reverse else (value < current):
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+
+class VirtualTable(ttk.Frame):
+    """Treeview that materializes only the rows in view, for lists of any length.
+
+    A fixed pool of Treeview items (enough to fill the widget plus a small buffer)
+    is reused while scrolling: ``describe(key)`` is called only for keys on screen
+    and returns the item text and values. With ``selectable`` the table keeps its
+    own extended selection (click, Ctrl-click, Shift-click) by key, so selected rows
+    stay selected when they scroll out of view or are filtered away.
+    """
+
+    def __init__(
+        self,
+        master: Any,
+        describe: Callable[[Hashable], RowDescription],
+        *,
+        columns: Sequence[Tuple[str, str, int]] = (),
+        selectable: bool = False,
+        on_select: Optional[Callable[[], None]] = None,
+    ) -> None:
+        super().__init__(master)
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+        self._describe = describe
+        self._on_select = on_select
+        self._rows = RowWindow()
+        self._selected: Set[Hashable] = set()
+        self._anchor: Optional[Hashable] = None
+        self._items: List[str] = []
+
+        self.tree = ttk.Treeview(
+            self,
+            columns=[column_id for column_id, _, _ in columns],
+            show="headings" if columns else "tree",
+            selectmode="none",
+        )
+        for column_id, heading, width in columns:
+            self.tree.heading(column_id, text=heading)
+            self.tree.column(column_id, width=width, anchor="w", stretch=True)
+        self.tree.tag_configure("selected", background="#4a6984", foreground="#ffffff")
+        self.tree.grid(row=0, column=0, sticky="nsew")
+
+        self._scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._handle_scrollbar)
+        self._scrollbar.grid(row=0, column=1, sticky="ns")
+
+        row_height = ttk.Style(self).lookup("Treeview", "rowheight")
+        self._row_height = int(row_height) if row_height else DEFAULT_ROW_HEIGHT
+        self.tree.bind("<Configure>", self._handle_resize)
+        self.tree.bind("<MouseWheel>", self._handle_wheel)
+        self.tree.bind("<Button-4>", lambda _: self._scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda _: self._scroll_by(3))
+        self.tree.bind("<Prior>", lambda _: self._scroll_by(-self._rows.size))
+        self.tree.bind("<Next>", lambda _: self._scroll_by(self._rows.size))
+        if selectable:
+            self.tree.bind("<Button-1>", self._handle_click)
+
+    # ------------------------------------------------------------------
+    # Rows
+    def set_rows(self, keys: Sequence[Hashable]) -> None:
+        """Replace every row; the selection is cleared."""
+
+        self._selected.clear()
+        self._anchor = None
+        self._rows.set_keys(keys)
+        self.refresh()
+
+    def append_row(self, key: Hashable) -> None:
+        self._rows.append(key)
+        self.refresh()
+
+    def set_filter(self, match: Optional[Callable[[Hashable], bool]]) -> None:
+        self._rows.set_filter(match)
+        self.refresh()
+
+    def sort_by(self, key: Optional[Callable[[Hashable], Any]], reverse: bool = False) -> None:
+        self._rows.sort(key, reverse)
+        self.refresh()
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows that pass the current filter."""
+
+        return len(self._rows.visible)
+
+    # ------------------------------------------------------------------
+    # Selection
+    def selection(self) -> List[Hashable]:
+        """Return the selected keys in their original row order."""
+
+        return [key for key in self._rows.keys if key in self._selected]
+
+    def clear_selection(self) -> None:
+        self._selected.clear()
+        self._anchor = None
+        self.refresh()
+
+    def _handle_click(self, event: Any) -> str:
+        self.tree.focus_set()
+        item = self.tree.identify_row(event.y)
+        window = self._rows.window()
+        index = self._items.index(item) if item in self._items else len(window)
+        if index >= len(window):
+            return "break"
+
+        key = window[index]
+        if event.state & 0x0001 and self._anchor in self._rows.visible:
+            # Shift extends from the anchor through the clicked row in display order.
+            start = self._rows.visible.index(self._anchor)
+            end = self._rows.offset + index
+            low, high = sorted((start, end))
+            self._selected.update(self._rows.visible[low : high + 1])
+        elif event.state & 0x0004:
+            self._selected.symmetric_difference_update({key})
+            self._anchor = key
+        else:
+            self._selected = {key}
+            self._anchor = key
+        self.refresh()
+        if self._on_select is not None:
+            self._on_select()
+        return "break"
+
+    # ------------------------------------------------------------------
+    # Rendering and scrolling
+    def refresh(self) -> None:
+        """Redraw the rows in view, e.g. after the data behind ``describe`` changed."""
+
+        window = self._rows.window()
+        for index, item in enumerate(self._items):
+            if index < len(window):
+                key = window[index]
+                text, values = self._describe(key)
+                tags = ("selected",) if key in self._selected else ()
+                self.tree.item(item, text=text, values=list(values), tags=tags)
+            else:
+                self.tree.item(item, text="", values=[], tags=())
+        self._scrollbar.set(*self._rows.fractions())
+
+    def _handle_resize(self, event: Any) -> None:
+        heading = self._row_height if self.tree.cget("show") == "headings" else 0
+        size = max(1, (event.height - heading) // self._row_height)
+        self._rows.size = size
+        self._rows.scroll_to(self._rows.offset)
+        wanted = size + BUFFER_ROWS
+        while len(self._items) < wanted:
+            self._items.append(self.tree.insert("", "end", text=""))
+        while len(self._items) > wanted:
+            self.tree.delete(self._items.pop())
+        self.refresh()
+
+    def _handle_wheel(self, event: Any) -> str:
+        self._scroll_by(-3 if event.delta > 0 else 3)
+        return "break"
+
+    def _handle_scrollbar(self, action: str, amount: str, unit: str = "units") -> None:
+        if action == "moveto":
+            self._rows.scroll_to(round(float(amount) * len(self._rows.visible)))
+            self.refresh()
+        elif unit == "pages":
+            self._scroll_by(int(amount) * self._rows.size)
+        else:
+            self._scroll_by(int(amount))
+
+    def _scroll_by(self, rows: int) -> str:
+        self._rows.scroll_to(self._rows.offset + rows)
+        self.refresh()
+        return "break"
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Any, Callable, List, Tuple
+
+TERMINAL_MESSAGES = ("result", "error", "cancelled")
+
+
+class TaskCancelled(Exception):
+    """Raised inside a :class:`BackgroundTask` target once the task has been cancelled."""
+
+
+class BackgroundTask:
+    """Run ``target(task)`` on a daemon thread and queue its messages for the UI thread.
+
+    The target reports through :meth:`post` and :meth:`progress`; both raise
+    :class:`TaskCancelled` after :meth:`cancel`, so a target stops at its next
+    report. The UI thread collects ``(kind, payload)`` messages with :meth:`drain`,
+    for example from a Tk ``after`` callback, and never shares widgets with the
+    worker. The last message is ``("result", value)``, ``("error", exception)`` or
+    ``("cancelled", None)``.
+    """
+
+    def __init__(self, target: Callable[[BackgroundTask], Any]) -> None:
+        self._target = target
+        self._messages: queue.SimpleQueue[Tuple[str, Any]] = queue.SimpleQueue()
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def start(self) -> BackgroundTask:
+        self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def check_cancelled(self) -> None:
+        if self._cancelled.is_set():
+            raise TaskCancelled
+
+    def post(self, kind: str, payload: Any = None) -> None:
+        self.check_cancelled()
+        self._messages.put((kind, payload))
+
+    def progress(self, done: int, total: int) -> None:
+        self.post("progress", (done, total))
+
+    def drain(self) -> List[Tuple[str, Any]]:
+        """Return every message queued since the last call without blocking."""
+
+        messages = []
+        while True:
+            try:
+                messages.append(self._messages.get_nowait())
+            except queue.Empty:
+                return messages
+
+    def join(self, timeout: float | None = None) -> None:
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        try:
+            result = self._target(self)
+            self.check_cancelled()
+        except TaskCancelled:
+            self._messages.put(("cancelled", None))
+        except Exception as error:  # noqa: BLE001 - surfaced to the UI thread
+            self._messages.put(("error", error))
+        else:
+            self._messages.put(("result", result))
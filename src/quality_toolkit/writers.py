@@ -0,0 +1,353 @@
+from __future__ import annotations
+
+import json
+import math
+import sys
+from abc import ABC, abstractmethod
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from .analysis import SUMMARY_PERCENTILES, ColumnQuality, DatasetQuality
+from .report import iter_markdown_report
+
+PARQUET_BATCH_ROWS = 10_000
+STDOUT = "-"
+
+
+class ReportWriter(ABC):
+    """Stream :class:`DatasetQuality` reports to a file or stdout in one format.
+
+    A writer is opened on ``destination``: a path, an open stream, or ``None`` /
+    ``"-"`` for stdout. :meth:`write` may be called for several reports before
+    :meth:`close`, which is how a batch run produces a single JSON Lines stream or
+    Parquet file; ``source`` identifies each report in formats that keep records
+    from several reports apart. Reports are written one column at a time, so the
+    output is never assembled in memory.
+
+    Subclasses set ``name`` and ``suffix`` and implement :meth:`write`; they become
+    available to :func:`open_writer` through :func:`register_writer`.
+    """
+
+    name = ""
+    suffix = ""
+    binary = False
+
+    def __init__(self, destination: str | Path | IO[Any] | None = None) -> None:
+        self._owned = False
+        if destination is None or destination == STDOUT:
+            self.stream: IO[Any] = sys.stdout.buffer if self.binary else sys.stdout
+        elif isinstance(destination, (str, Path)):
+            mode = "wb" if self.binary else "w"
+            encoding = None if self.binary else "utf-8"
+            self.stream = open(destination, mode, encoding=encoding)  # noqa: SIM115
+            self._owned = True
+        else:
+            self.stream = destination
+        self.count = 0
+
+    @abstractmethod
+    def write(
+        self,
+        quality: DatasetQuality,
+        *,
+        source: Optional[str] = None,
+        title: Optional[str] = None,
+    ) -> None:
+        """Write ``quality`` as the next report of the stream."""
+
+    def close(self) -> None:
+        if self._owned:
+            self.stream.close()
+        else:
+            self.stream.flush()
+
+    def __enter__(self) -> ReportWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class MarkdownWriter(ReportWriter):
+    """The markdown report of :func:`~quality_toolkit.report.build_markdown_report`."""
+
+    name = "markdown"
+    suffix = ".md"
+
+    def write(
+        self,
+        quality: DatasetQuality,
+        *,
+        source: Optional[str] = None,
+        title: Optional[str] = None,
+    ) -> None:
+        if self.count:
+            self.stream.write("\n")
+        for line in iter_markdown_report(quality, title=title or "Data Quality Report"):
+            self.stream.write(line + "\n")
+        self.count += 1
+
+
+class JsonWriter(ReportWriter):
+    """One JSON document in the layout of :meth:`DatasetQuality.to_dict`.
+
+    NaN statistics are written as ``null`` so that strict JSON parsers accept the
+    document; :meth:`DatasetQuality.from_dict` reads them back as NaN.
+    """
+
+    name = "json"
+    suffix = ".json"
+
+    def write(
+        self,
+        quality: DatasetQuality,
+        *,
+        source: Optional[str] = None,
+        title: Optional[str] = None,
+    ) -> None:
+        if self.count:
+            raise ValueError("The json format holds a single report; use jsonl for several")
+        head = {
+            item.name: getattr(quality, item.name)
+            for item in fields(quality)
+            if item.name not in ("columns", "timings", "summary", "rule_results")
+        }
+        stream = self.stream
+        stream.write(_dumps(head)[:-1] + ', "columns": [')
+        for index, record in enumerate(_column_records(quality)):
+            stream.write(("," if index else "") + "\n  " + _dumps(record))
+        stream.write("\n]")
+        if quality.timings is not None:
+            timings = [span.to_dict() for span in quality.timings]
+            stream.write(', "timings": ' + _dumps(timings))
+        if quality.summary is not None:
+            stream.write(', "summary": [')
+            for index, (name, summary) in enumerate(quality.summary.items()):
+                record = {"name": name, **asdict(summary)}
+                stream.write(("," if index else "") + "\n  " + _dumps(record))
+            stream.write("\n]")
+        if quality.rule_results is not None:
+            results = [asdict(result) for result in quality.rule_results]
+            stream.write(', "rule_results": ' + _dumps(results))
+        stream.write("}\n")
+        self.count += 1
+
+
+class JsonLinesWriter(ReportWriter):
+    """One JSON object per line: a ``dataset`` record, then one ``column`` record each.
+
+    Every record carries ``source``, so streams of many reports can be concatenated
+    and loaded directly, e.g. with ``pandas.read_json(path, lines=True)``. A
+    column's numeric summary, when present, is nested under ``summary``. Rule
+    results follow as one ``rule`` record each.
+    """
+
+    name = "jsonl"
+    suffix = ".jsonl"
+
+    def write(
+        self,
+        quality: DatasetQuality,
+        *,
+        source: Optional[str] = None,
+        title: Optional[str] = None,
+    ) -> None:
+        dataset = {
+            "record": "dataset",
+            "source": source,
+            "row_count": quality.row_count,
+            "duplicate_rows": quality.duplicate_rows,
+            "duplicates_are_estimate": quality.duplicates_are_estimate,
+            "duplicate_false_positive_rate": quality.duplicate_false_positive_rate,
+            "column_count": len(quality.columns),
+            "warnings": quality.warnings,
+        }
+        self.stream.write(_dumps(dataset) + "\n")
+        summaries = quality.summary or {}
+        for column in _column_records(quality):
+            summary = summaries.get(column["name"])
+            record = {"record": "column", "source": source, **column}
+            record["summary"] = None if summary is None else asdict(summary)
+            self.stream.write(_dumps(record) + "\n")
+        for result in quality.rule_results or []:
+            record = {"record": "rule", "source": source, **asdict(result)}
+            self.stream.write(_dumps(record) + "\n")
+        self.count += 1
+
+
+class ParquetWriter(ReportWriter):
+    """A Parquet table with one row per column of every written report.
+
+    Dataset-level counts (``row_count``, ``duplicate_rows``) are repeated on each
+    row next to ``source``. Summary statistics are flattened into ``summary_*``
+    columns, with one ``summary_quantile_<percent>`` column per percentile.
+    Rows are written in row groups of ``PARQUET_BATCH_ROWS``. Warnings and rule
+    results are not column-level and are left out; use jsonl for them.
+    """
+
+    name = "parquet"
+    suffix = ".parquet"
+    binary = True
+
+    def __init__(self, destination: str | Path | IO[Any] | None = None) -> None:
+        super().__init__(destination)
+        self._writer: Any = None
+        self._labels: Optional[List[str]] = None
+
+    def write(
+        self,
+        quality: DatasetQuality,
+        *,
+        source: Optional[str] = None,
+        title: Optional[str] = None,
+    ) -> None:
+        import pyarrow as pa
+
+        summaries = quality.summary or {}
+        labels = list(next(iter(summaries.values())).quantiles) if summaries else None
+        self._open(labels)
+        if labels is not None and labels != self._labels:
+            raise ValueError("Reports in one Parquet file must share their summary percentiles")
+
+        batch: List[Dict[str, Any]] = []
+        for record in _column_records(quality):
+            record["source"] = source
+            record["row_count"] = quality.row_count
+            record["duplicate_rows"] = quality.duplicate_rows
+            summary = summaries.get(record["name"])
+            if summary is not None:
+                record["summary_count"] = summary.count
+                for key in ("mean", "std", "min", "max", "quantile_error"):
+                    record[f"summary_{key}"] = getattr(summary, key)
+                for label, value in summary.quantiles.items():
+                    record[_quantile_column(label)] = value
+            batch.append(record)
+            if len(batch) >= PARQUET_BATCH_ROWS:
+                self._writer.write_table(pa.Table.from_pylist(batch, schema=self._schema))
+                batch = []
+        if batch:
+            self._writer.write_table(pa.Table.from_pylist(batch, schema=self._schema))
+        self.count += 1
+
+    def close(self) -> None:
+        self._open(None)
+        self._writer.close()
+        super().close()
+
+    def _open(self, labels: Optional[List[str]]) -> None:
+        if self._writer is not None:
+            return
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._labels = labels or [f"{percentile * 100:g}%" for percentile in SUMMARY_PERCENTILES]
+        columns = [
+            pa.field("source", pa.string()),
+            pa.field("name", pa.string()),
+            pa.field("row_count", pa.int64()),
+            pa.field("duplicate_rows", pa.int64()),
+        ]
+        hints = get_type_hints(ColumnQuality)
+        columns.extend(
+            pa.field(item.name, _arrow_type(hints[item.name])) for item in fields(ColumnQuality)
+        )
+        columns.append(pa.field("summary_count", pa.int64()))
+        for key in ("mean", "std", "min", "max"):
+            columns.append(pa.field(f"summary_{key}", pa.float64()))
+        for label in self._labels:
+            columns.append(pa.field(_quantile_column(label), pa.float64()))
+        columns.append(pa.field("summary_quantile_error", pa.float64()))
+        self._schema = pa.schema(columns)
+        self._writer = pq.ParquetWriter(self.stream, self._schema)
+
+
+WRITERS: Dict[str, Type[ReportWriter]] = {}
+
+
+def register_writer(writer: Type[ReportWriter]) -> Type[ReportWriter]:
+    """Make ``writer`` available to :func:`open_writer` under ``writer.name``."""
+
+    WRITERS[writer.name] = writer
+    return writer
+
+
+def open_writer(
+    format_name: str, destination: str | Path | IO[Any] | None = None
+) -> ReportWriter:
+    """Return the writer registered as ``format_name``, opened on ``destination``."""
+
+    writer = WRITERS.get(format_name)
+    if writer is None:
+        raise ValueError(f"Unknown report format: {format_name}")
+    return writer(destination)
+
+
+def write_report(
+    quality: DatasetQuality,
+    destination: str | Path | IO[Any] | None = None,
+    format_name: str = "markdown",
+    *,
+    source: Optional[str] = None,
+) -> None:
+    """Write a single report; see :class:`ReportWriter` for ``destination``."""
+
+    with open_writer(format_name, destination) as writer:
+        writer.write(quality, source=source)
+
+
+for _writer in (MarkdownWriter, JsonWriter, JsonLinesWriter, ParquetWriter):
+    register_writer(_writer)
+
+
+def _column_records(quality: DatasetQuality) -> Iterator[Dict[str, Any]]:
+    for name, column in quality.columns.items():
+        yield {"name": str(name), **asdict(column)}
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(_without_nan(value), separators=(",", ":"), default=str)
+
+
+def _without_nan(value: Any) -> Any:
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, dict):
+        return {key: _without_nan(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_without_nan(item) for item in value]
+    return value
+
+
+def _quantile_column(label: str) -> str:
+    return "summary_quantile_" + label.rstrip("%").replace(".", "_")
+
+
+def _arrow_type(hint: Any) -> Any:
+    import pyarrow as pa
+
+    arguments = [argument for argument in get_args(hint) if argument is not type(None)]
+    if get_origin(hint) is Union and len(arguments) == 1:
+        return _arrow_type(arguments[0])
+    if get_origin(hint) is list:
+        return pa.list_(_arrow_type(arguments[0]))
+    types: Dict[type, Any] = {
+        str: pa.string(),
+        int: pa.int64(),
+        float: pa.float64(),
+        bool: pa.bool_(),
+    }
+    return types[hint]
+
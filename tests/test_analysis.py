@@ -1,7 +1,21 @@
-﻿import pandas as pd
+﻿import json
+
+import pandas as pd
 import pytest
 
-from quality_toolkit.analysis import calculate_summary_statistics, evaluate_data_quality
+from quality_toolkit.analysis import (
+    ColumnProfileCache,
+    DatasetAccumulator,
+    DatasetQuality,
+    SummaryAccumulator,
+    calculate_summary_statistics,
+    calculate_summary_statistics_chunks,
+    collect_samples,
+    evaluate_data_quality,
+    evaluate_data_quality_chunks,
+    profile_column,
+)
+from quality_toolkit.rules import Rule, RuleSet
 
 
 def test_evaluate_data_quality_basic_metrics():
@@ -38,6 +52,97 @@ def test_evaluate_data_quality_rejects_invalid_sample_size():
         evaluate_data_quality(frame, sample_size=0)
 
 
+def test_evaluate_data_quality_chunks_matches_in_memory_result():
+    frame = pd.DataFrame(
+        {
+            "score": [1, 2, 2, None, 1, 3, None, 2],
+            "label": ["a", "b", "b", None, "a", "c", "d", "b"],
+        }
+    )
+    chunks = [frame.iloc[start : start + 3] for start in range(0, len(frame), 3)]
+
+    streamed = evaluate_data_quality_chunks(chunks, sample_size=3)
+
+    assert streamed == evaluate_data_quality(frame, sample_size=3)
+
+
+def test_dataset_accumulator_merge_counts_cross_partition_duplicates():
+    first = DatasetAccumulator()
+    first.update(pd.DataFrame({"value": [1, 2], "label": ["x", "y"]}))
+    second = DatasetAccumulator()
+    second.update(pd.DataFrame({"value": [2, 3], "label": ["y", "z"]}))
+
+    first.merge(second)
+    result = first.result()
+
+    assert result.row_count == 4
+    assert result.duplicate_rows == 1
+    assert result.columns["value"].distinct_count == 3
+
+
+@pytest.mark.parametrize(
+    ("duplicate_mode", "distinct_error"), [("exact", None), ("approximate", 0.02)]
+)
+def test_dataset_accumulator_resumes_from_json_state(duplicate_mode, distinct_error):
+    rules = RuleSet((Rule("unique", "id"), Rule("allowed", "label", values=("x", "y"))))
+    first = pd.DataFrame({"id": [1, 2, 2, None], "label": ["x", "1.5", "z", "x"]})
+    second = pd.DataFrame({"id": [3, 1, 4, 4], "label": ["y", 1.5, "q", None]})
+    options = dict(
+        sample_size=3,
+        distinct_error=distinct_error,
+        duplicate_mode=duplicate_mode,
+        summary=True,
+        rules=rules,
+    )
+    uninterrupted = DatasetAccumulator(**options)
+    uninterrupted.update(first)
+    uninterrupted.update(second)
+    saved = DatasetAccumulator(**options)
+    saved.update(first)
+
+    resumed = DatasetAccumulator.from_dict(json.loads(json.dumps(saved.to_dict())))
+    resumed.update(second)
+
+    assert resumed.result() == uninterrupted.result()
+
+
+def test_evaluate_data_quality_approximate_distinct_reports_error():
+    frame = pd.DataFrame({"id": range(1_000), "label": ["a", "b"] * 500})
+
+    result = evaluate_data_quality(frame, distinct_error=0.02)
+
+    id_column = result.columns["id"]
+    assert id_column.distinct_is_estimate
+    assert 0 < id_column.distinct_error <= 0.02
+    assert id_column.distinct_count == pytest.approx(1_000, rel=0.08)
+    assert result.columns["label"].distinct_count == 2
+
+
+def test_evaluate_data_quality_chunks_merges_distinct_sketches():
+    frame = pd.DataFrame({"id": list(range(600)) * 2})
+    chunks = [frame.iloc[start : start + 250] for start in range(0, len(frame), 250)]
+
+    streamed = evaluate_data_quality_chunks(chunks, distinct_error=0.02)
+
+    assert streamed.columns["id"] == evaluate_data_quality(frame, distinct_error=0.02).columns["id"]
+
+
+def test_profile_column_reads_metrics_from_one_factorization():
+    series = pd.Series(["b", None, "a", "b", None, "c"])
+
+    column = profile_column(series, sample_size=2)
+
+    assert column.missing_count == 2
+    assert column.distinct_count == 3
+    assert column.sample_values == ["b", "a"]
+
+
+def test_collect_samples_returns_first_distinct_values_in_order():
+    series = pd.Series([None] * 500 + [3, 3, 1] + list(range(10_000)))
+
+    assert collect_samples(series, 3) == [3, 1, 0]
+
+
 def test_calculate_summary_statistics_includes_missing_columns():
     frame = pd.DataFrame({"value": [1, None, 3, 4]})
 
@@ -52,3 +157,68 @@ def test_calculate_summary_statistics_requires_numeric():
 
     with pytest.raises(ValueError):
         calculate_summary_statistics(frame)
+
+
+def test_evaluate_data_quality_reports_each_profiled_column():
+    df = pd.DataFrame({"a": [1, None], "b": ["x", "y"]})
+    seen = []
+
+    quality = evaluate_data_quality(df, on_column=lambda name, column: seen.append(name))
+
+    assert seen == ["a", "b"]
+    assert list(quality.columns) == seen
+
+
+def test_column_profile_cache_reuses_profiles_across_selections(monkeypatch):
+    df = pd.DataFrame({"a": [1, 1, 2], "b": ["x", "x", "y"], "c": [1.0, 2.0, None]})
+    cache = ColumnProfileCache()
+
+    first = cache.evaluate(df, ["a", "b"])
+    monkeypatch.setattr("quality_toolkit.analysis.profile_column", None)
+    second = cache.evaluate(df, ["a"])
+
+    assert first.duplicate_rows == 1
+    assert second.columns["a"] == first.columns["a"]
+    assert second.duplicate_rows == 1
+    assert "c" not in cache
+
+
+def test_column_profile_cache_matches_evaluate_data_quality():
+    df = pd.DataFrame({"a": [1, 1, None, 2], "b": ["x", "x", None, "y"], "c": [1, 2, 3, 4]})
+    cache = ColumnProfileCache(max_hash_bytes=0)
+
+    for columns in (["a", "b"], ["c"], ["a", "b", "c"]):
+        assert cache.evaluate(df, columns) == evaluate_data_quality(df[columns])
+
+
+def test_summary_statistics_chunks_match_describe_while_exact():
+    frame = pd.DataFrame({"value": [1, None, 3, 4, 10], "ratio": [0.5, 0.1, 0.2, None, 0.4]})
+    chunks = [frame.iloc[:2], frame.iloc[2:]]
+
+    streamed = calculate_summary_statistics_chunks(chunks)
+
+    pd.testing.assert_frame_equal(streamed, calculate_summary_statistics(frame), check_dtype=False)
+
+
+def test_summary_accumulator_drops_columns_with_text_and_merges_partitions():
+    first = SummaryAccumulator()
+    first.update(pd.DataFrame({"value": [1.0, 2.0], "code": [1, 2]}))
+    second = SummaryAccumulator()
+    second.update(pd.DataFrame({"value": [3.0, None], "code": ["x", "y"]}))
+
+    first.merge(second)
+    summary = first.result()
+
+    assert list(summary) == ["value"]
+    assert summary["value"].count == 3
+    assert summary["value"].quantiles["50%"] == 2.0
+
+
+def test_evaluate_data_quality_summary_round_trips_through_dict():
+    frame = pd.DataFrame({"value": [1, 2, 3, None], "label": ["a", "b", "c", "d"]})
+
+    quality = evaluate_data_quality(frame, summary=True)
+
+    assert list(quality.summary) == ["value"]
+    assert quality.summary["value"].mean == pytest.approx(2.0)
+    assert DatasetQuality.from_dict(quality.to_dict()) == quality
@@ -0,0 +1,53 @@
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+
+from quality_toolkit.batch import evaluate_batch, expand_sources
+from quality_toolkit.cli import main
+
+
+@pytest.fixture
+def batch_dir(tmp_path):
+    pd.DataFrame({"a": [1, 2, 2]}).to_csv(tmp_path / "first.csv", index=False)
+    nested = tmp_path / "nested"
+    nested.mkdir()
+    pd.DataFrame({"b": ["x", None]}).to_csv(nested / "second.csv", index=False)
+    (nested / "notes.md").write_text("ignored")
+    (tmp_path / "broken.csv").write_text("")
+    return tmp_path
+
+
+def test_expand_sources_walks_directories_and_globs(batch_dir):
+    from_directory = expand_sources([batch_dir])
+    from_glob = expand_sources([str(batch_dir / "**" / "*.csv")])
+
+    names = sorted(path.name for path in from_directory)
+    assert names == ["broken.csv", "first.csv", "second.csv"]
+    assert sorted(from_glob) == sorted(from_directory)
+
+
+def test_expand_sources_rejects_patterns_without_matches(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        expand_sources([str(tmp_path / "*.parquet")])
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_evaluate_batch_records_failures_without_aborting(batch_dir, workers):
+    paths = expand_sources([batch_dir])
+    seen = []
+
+    results = evaluate_batch(paths, workers=workers, progress=seen.append)
+
+    assert [result.path for result in results] == paths
+    assert [result.error is None for result in results] == [False, True, True]
+    assert seen[-1].completed == 3
+    assert seen[-1].failed == 1
+    assert seen[-1].rows == 5
+
+
+def test_cli_batch_writes_summary_and_fails_on_bad_files(batch_dir):
+    result = CliRunner().invoke(main, [str(batch_dir), "--no-cache"])
+
+    assert result.exit_code == 1
+    assert "# Batch Data Quality Report" in result.output
+    assert "| ok | 3 | 1 |" in result.output
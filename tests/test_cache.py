@@ -0,0 +1,75 @@
+import gzip
+import json
+import os
+
+import pandas as pd
+
+from quality_toolkit.analysis import evaluate_data_quality
+from quality_toolkit.cache import CACHE_SUFFIX, ResultCache
+from quality_toolkit.pipeline import evaluate_file
+
+
+def _write_csv(path, values):
+    pd.DataFrame({"value": values, "label": ["x"] * len(values)}).to_csv(path, index=False)
+
+
+def test_result_cache_round_trips_dataset_quality(tmp_path):
+    cache = ResultCache(tmp_path / "cache")
+    quality = evaluate_data_quality(pd.DataFrame({"a": [1, None, 1], 2: ["x", "y", None]}))
+
+    cache.put("entry", quality)
+
+    assert cache.get("entry") == quality
+    assert cache.stats().hits == 1
+
+
+def test_result_cache_treats_stale_entries_as_misses(tmp_path):
+    cache = ResultCache(tmp_path / "cache")
+    cache.directory.mkdir()
+    stale = {"missing-keys": {"row_count": 3}, "wrong-types": {"row_count": 3, "columns": [1]}}
+    for key, data in stale.items():
+        with gzip.open(cache.directory / f"{key}{CACHE_SUFFIX}", "wt", encoding="utf-8") as handle:
+            json.dump(data, handle)
+
+    assert [cache.get(key) for key in stale] == [None, None]
+    assert (cache.stats().misses, cache.stats().entries) == (2, 0)
+
+
+def test_evaluate_file_reuses_cached_result_until_file_changes(tmp_path):
+    source = tmp_path / "data.csv"
+    _write_csv(source, [1, 2, 2])
+    cache = ResultCache(tmp_path / "cache")
+
+    first = evaluate_file(source, cache=cache)
+    second = evaluate_file(source, cache=cache)
+    _write_csv(source, [1, 2, 2, 3])
+    os.utime(source, ns=(0, source.stat().st_mtime_ns + 1_000_000))
+    third = evaluate_file(source, cache=cache)
+
+    stats = cache.stats()
+    assert first == second
+    assert third.row_count == 4
+    assert (stats.hits, stats.misses, stats.entries) == (1, 2, 2)
+
+
+def test_cache_key_depends_on_parameters(tmp_path):
+    source = tmp_path / "data.csv"
+    _write_csv(source, [1, 2])
+    cache = ResultCache(tmp_path / "cache")
+
+    assert cache.key(source, {"sample_size": 5}) != cache.key(source, {"sample_size": 3})
+    assert cache.key(source, {}) != cache.key(source, {}, content_hash=True)
+
+
+def test_result_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = ResultCache(tmp_path / "cache", max_entries=2)
+    quality = evaluate_data_quality(pd.DataFrame({"a": [1]}))
+
+    for index, key in enumerate(["old", "recent", "new"]):
+        cache.put(key, quality)
+        os.utime(cache.directory / f"{key}.json.gz", (index, index))
+
+    cache.put("newest", quality)
+
+    remaining = sorted(path.name for path in cache.directory.iterdir())
+    assert remaining == ["new.json.gz", "newest.json.gz"]
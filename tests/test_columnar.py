@@ -0,0 +1,60 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from quality_toolkit.analysis import ColumnQuality, evaluate_data_quality
+from quality_toolkit.columnar import ColumnTable
+
+
+def _quality():
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4],
+            "name": ["Ann", None, "Zoë", None],
+            "score": [1.5, None, None, None],
+            "empty": [None, None, None, None],
+        }
+    )
+    return evaluate_data_quality(df, memory_usage=True)
+
+
+def test_table_views_match_column_quality_and_round_trip():
+    quality = _quality()
+    table = quality.column_table()
+
+    assert list(table) == list(quality.columns)
+    assert table["name"] == quality.columns["name"]
+    assert table[-1].sample_values == quality.columns["empty"].sample_values == []
+    assert table["name"].sample_values == ["Ann", "Zoë"]
+    assert table.to_columns() == quality.columns
+    assert pickle.loads(pickle.dumps(table)).to_columns() == quality.columns
+    assert ColumnTable.from_columns({}).to_columns() == {}
+
+
+def test_filter_and_take_use_vectorized_fields():
+    quality = _quality()
+    table = quality.column_table()
+
+    missing = table.filter(table.missing_ratio > 0.4)
+    assert list(missing) == ["name", "score", "empty"]
+    assert missing["score"] == quality.columns["score"]
+    ordered = table.take(np.argsort(-table.missing_count, kind="stable"))
+    assert list(ordered) == ["empty", "score", "name", "id"]
+    assert ordered["name"].sample_values == ["Ann", "Zoë"]
+
+
+def test_arrow_and_frame_conversions():
+    columns = {
+        "a": ColumnQuality("int64", 0, 0.0, 3, ["1", "2"], memory_bytes=24),
+        "b": ColumnQuality("str", 1, 0.5, 1, ["x"], distinct_is_estimate=True),
+    }
+    table = ColumnTable.from_columns(columns)
+
+    arrow = table.to_arrow()
+    assert arrow.column("sample_values").to_pylist() == [["1", "2"], ["x"]]
+    assert arrow.column("memory_bytes").to_pylist() == [24, None]
+    frame = table.to_frame()
+    assert frame.loc["b", "missing_ratio"] == 0.5
+    assert frame["memory_bytes"].isna().tolist() == [False, True]
+    assert frame["distinct_is_estimate"].tolist() == [False, True]
@@ -2,7 +2,17 @@ import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal
 
-from quality_toolkit.data_loader import load_dataset
+from quality_toolkit import data_loader
+from quality_toolkit.data_loader import (
+    downcast_numeric,
+    infer_compact_dtypes,
+    iter_dataset_chunks,
+    iter_excel_chunks,
+    iter_parquet_row_groups,
+    list_excel_sheets,
+    load_dataset,
+    read_parquet_statistics,
+)
 
 
 def test_load_dataset_supports_excel(tmp_path):
@@ -21,3 +31,182 @@ def test_load_dataset_rejects_unknown_extension(tmp_path):
 
     with pytest.raises(ValueError):
         load_dataset(path)
+
+
+def test_iter_dataset_chunks_streams_csv(tmp_path):
+    path = tmp_path / "sample.csv"
+    path.write_text("a;b\n1;x\n2;y\n3;z\n")
+
+    chunks = list(iter_dataset_chunks(path, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert list(chunks[0].columns) == ["a", "b"]
+
+
+def test_iter_dataset_chunks_streams_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    frame = pd.DataFrame({"a": range(5), "b": list("vwxyz")})
+    path = tmp_path / "sample.parquet"
+    frame.to_parquet(path, index=False)
+
+    chunks = list(iter_dataset_chunks(path, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert_frame_equal(pd.concat(chunks, ignore_index=True), frame)
+
+
+def test_iter_dataset_chunks_rejects_invalid_chunk_size(tmp_path):
+    path = tmp_path / "sample.csv"
+    path.write_text("a\n1\n")
+
+    with pytest.raises(ValueError):
+        list(iter_dataset_chunks(path, chunk_size=0))
+
+
+def test_load_dataset_projects_columns(tmp_path):
+    path = tmp_path / "sample.csv"
+    path.write_text("a,b,c\n1,x,2\n3,y,4\n")
+
+    loaded = load_dataset(path, columns=["c", "a"])
+
+    assert list(loaded.columns) == ["c", "a"]
+
+
+def test_read_parquet_statistics_uses_footer_counts(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table({"a": [1, None, 3, None, 5], "b": ["x", "y", None, "z", "w"]})
+    path = tmp_path / "sample.parquet"
+    pq.write_table(table, path, row_group_size=2)
+
+    statistics = read_parquet_statistics(path, columns=["a"])
+
+    assert statistics.row_count == 5
+    assert statistics.null_counts == {"a": 2}
+    assert len(statistics.row_group_null_counts) == 3
+    assert statistics.row_group_row_counts == [2, 2, 1]
+    batches = iter_parquet_row_groups(path, ["a"], batch_size=1)
+    assert [group for group, chunk in batches if len(chunk) == 1] == [0, 0, 1, 1, 2]
+
+
+def test_read_parquet_statistics_rejects_unknown_columns(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "sample.parquet"
+    pd.DataFrame({"a": [1]}).to_parquet(path)
+
+    with pytest.raises(ValueError):
+        read_parquet_statistics(path, columns=["missing"])
+
+
+def test_load_dataset_reports_bytes_read(tmp_path):
+    path = tmp_path / "rows.csv"
+    pd.DataFrame({"a": range(1000)}).to_csv(path, index=False)
+    reports = []
+
+    load_dataset(path, progress=lambda done, total: reports.append((done, total)))
+
+    size = path.stat().st_size
+    assert reports[-1] == (size, size)
+    assert [done for done, _ in reports] == sorted(done for done, _ in reports)
+
+
+def test_iter_excel_chunks_streams_a_sheet_like_read_excel(tmp_path):
+    frame = pd.DataFrame({"a": [1, 2, 3], "b": ["x", None, "z"], "c": [0.5, None, 1.5]})
+    path = tmp_path / "book.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({"other": [1]}).to_excel(writer, sheet_name="first", index=False)
+        frame.to_excel(writer, sheet_name="data", index=False)
+
+    chunks = list(iter_excel_chunks(path, sheet_name="data", chunk_size=2, columns=["c", "a"]))
+
+    assert list_excel_sheets(path) == ["first", "data"]
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    streamed = pd.concat(chunks, ignore_index=True)
+    assert_frame_equal(streamed, pd.read_excel(path, sheet_name="data")[["c", "a"]])
+    with pytest.raises(ValueError):
+        next(iter_excel_chunks(path, sheet_name="missing"))
+
+
+def test_load_dataset_arrow_engine_returns_arrow_columns(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "rows.csv"
+    path.write_text("id;label;score\n1;a;0.5\n2;;\n3;b;1.5\n")
+
+    loaded = load_dataset(path, engine="arrow", columns=["label", "score"])
+
+    assert list(loaded.columns) == ["label", "score"]
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in loaded.dtypes)
+    assert loaded.isna().sum().tolist() == [1, 1]
+    with pytest.raises(ValueError):
+        load_dataset(path, engine="arrow", columns=["missing"])
+
+
+def test_load_dataset_optimize_memory_uses_compact_dtypes(tmp_path):
+    path = tmp_path / "rows.csv"
+    pd.DataFrame(
+        {
+            "small": [1, 2, 3, 4],
+            "negative": [-1, 0, 1, 2],
+            "half": [0.5, 1.5, None, 2.5],
+            "label": ["a", "b", "a", "a"],
+        }
+    ).to_csv(path, index=False)
+
+    loaded = load_dataset(path, optimize_memory=True)
+
+    assert str(loaded["small"].dtype) == "uint8"
+    assert str(loaded["negative"].dtype) == "int8"
+    assert str(loaded["half"].dtype) == "float32"
+    assert isinstance(loaded["label"].dtype, pd.CategoricalDtype)
+    assert set(loaded.attrs["default_memory_bytes"]) == set(loaded.columns)
+
+
+def test_optimize_memory_never_grows_string_or_empty_columns(tmp_path):
+    path = tmp_path / "rows.csv"
+    pd.DataFrame(
+        {
+            "id": [f"user-{index}" for index in range(200)],
+            "note": [None] * 150 + [f"late-{index}" for index in range(50)],
+        }
+    ).to_csv(path, index=False)
+    default = load_dataset(path)
+
+    compact = infer_compact_dtypes(default.head(100))
+    loaded = load_dataset(path, optimize_memory=True)
+
+    assert compact == {}
+    assert loaded.dtypes.to_dict() == default.dtypes.to_dict()
+    for column in loaded.columns:
+        used = loaded[column].memory_usage(deep=True, index=False)
+        assert used <= default[column].memory_usage(deep=True, index=False)
+
+
+def test_optimize_memory_parses_csv_in_chunks_like_a_whole_file(tmp_path, monkeypatch):
+    path = tmp_path / "rows.csv"
+    pd.DataFrame(
+        {
+            "grows": [1, 2, 3, 300, -40, 5, 6, 7],
+            "gap": [1, 2, 3, 4, None, 6, 7, 8],
+            "precision": [0.5, 1.5, 2.5, 0.1, 3.5, 4.5, 5.5, 6.5],
+            "label": ["a", "a", "b", "a", None, None, "c", "a"],
+        }
+    ).to_csv(path, index=False)
+    whole = load_dataset(path, optimize_memory=True)
+    monkeypatch.setattr(data_loader, "DEFAULT_CHUNK_SIZE", 2)
+
+    chunked = load_dataset(path, optimize_memory=True)
+
+    assert_frame_equal(chunked, whole)
+    assert str(chunked["grows"].dtype) == "int16"
+    assert str(chunked["gap"].dtype) == "float32"
+    assert str(chunked["precision"].dtype) == "float64"
+    assert list(chunked["label"].cat.categories) == ["a", "b", "c"]
+
+
+def test_downcast_numeric_keeps_floats_that_would_lose_precision():
+    frame = pd.DataFrame({"precise": [0.1, 0.2], "big": [1, 2**40]})
+
+    converted = downcast_numeric(frame)
+
+    assert converted["precise"].dtype == "float64"
+    assert converted["big"].dtype == "uint64"
@@ -0,0 +1,142 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+
+from quality_toolkit import analysis, drift
+from quality_toolkit.analysis import DatasetAccumulator, factorize_column
+from quality_toolkit.cli import main
+from quality_toolkit.drift import (
+    DatasetProfile,
+    ProfileAccumulator,
+    compare_profiles,
+    profile_chunks,
+    profile_file,
+)
+
+
+def _frame(seed: int, *, shift: float = 0.0, missing: float = 0.0, rows: int = 20_000):
+    rng = np.random.default_rng(seed)
+    amount = rng.normal(shift, 1, rows)
+    amount[rng.random(rows) < missing] = np.nan
+    weights = [0.5, 0.3, 0.2] if not shift else [0.2, 0.3, 0.5]
+    return pd.DataFrame(
+        {
+            "amount": amount,
+            "country": rng.choice(["DE", "FR", "NL"], rows, p=weights),
+            "id": np.arange(rows).astype(str),
+        }
+    )
+
+
+def test_compare_profiles_flags_shift_missing_and_schema_changes():
+    baseline = profile_chunks([_frame(0)])
+    unchanged = compare_profiles(baseline, profile_chunks([_frame(1)]))
+
+    assert not unchanged.drifted
+    assert unchanged.warnings == []
+
+    changed = _frame(2, shift=1.0, missing=0.2).drop(columns="id")
+    changed["amount"] = changed["amount"].astype(str)
+    changed["channel"] = "web"
+    diff = compare_profiles(baseline, profile_chunks([changed]))
+    columns = {column.name: column for column in diff.columns}
+
+    assert list(columns) == ["amount", "country", "channel", "id"]
+    assert columns["amount"].old_dtype == "float64"
+    assert columns["amount"].new_dtype == "str"
+    assert columns["amount"].new_missing_ratio == pytest.approx(0.2, abs=0.01)
+    assert {"dtype", "missing"} <= set(columns["amount"].changes)
+    assert columns["country"].shift_metric == "tvd"
+    assert columns["country"].shift == pytest.approx(0.3, abs=0.02)
+    assert columns["country"].changes == ["distribution"]
+    assert columns["channel"].changes == ["added"]
+    assert columns["id"].changes == ["removed"]
+    assert "Column 'id' was removed." in diff.warnings
+
+
+def test_numeric_shift_uses_ks_distance_and_merged_chunks_match_one_pass():
+    frame = _frame(0)
+    whole = ProfileAccumulator()
+    whole.update(frame)
+    left = ProfileAccumulator()
+    left.update(frame.iloc[:7_000])
+    right = ProfileAccumulator()
+    right.update(frame.iloc[7_000:])
+    left.merge(right)
+    merged = left.result()
+    single = whole.result()
+
+    assert merged.row_count == single.row_count == len(frame)
+    for name, column in single.columns.items():
+        assert merged.columns[name].distinct_count == column.distinct_count
+        assert merged.columns[name].dtype == column.dtype
+    diff = compare_profiles(single, profile_chunks([_frame(1, shift=0.5)]))
+    amount = diff.columns[0]
+    assert amount.shift_metric == "ks"
+    # The exact distance between N(0, 1) and N(0.5, 1) is 2 * Phi(0.25) - 1, about 0.197.
+    assert amount.shift == pytest.approx(0.197, abs=0.03)
+    assert "distribution" in amount.changes
+
+
+def test_profile_and_evaluation_share_one_factorization_per_column(monkeypatch):
+    frame = _frame(0, missing=0.1)
+    factorized = {column: factorize_column(frame[column]) for column in frame.columns}
+    expected_profile = profile_chunks([frame]).to_dict()
+    expected_quality = analysis.evaluate_data_quality_chunks([frame])
+
+    def fail(series):
+        raise AssertionError(f"{series.name} was factorized again")
+
+    monkeypatch.setattr(analysis, "factorize_column", fail)
+    monkeypatch.setattr(drift, "factorize_column", fail)
+    profile = ProfileAccumulator()
+    profile.update(frame, factorized)
+    quality = DatasetAccumulator()
+    quality.update(frame, factorized=factorized)
+
+    assert profile.result().to_dict() == expected_profile
+    assert quality.result() == expected_quality
+
+
+def test_saved_profile_round_trips_and_skips_rereading(tmp_path):
+    path = tmp_path / "old.csv"
+    _frame(0, missing=0.1).to_csv(path, index=False)
+    profile = profile_file(path, chunk_size=4_000)
+    saved = tmp_path / "baseline.json"
+    profile.save(saved)
+    path.unlink()
+
+    restored = DatasetProfile.load(saved)
+
+    assert restored.to_dict() == profile.to_dict()
+    assert restored.source == str(path)
+    assert compare_profiles(restored, profile).warnings == []
+    saved.write_text(json.dumps({"version": 99}))
+    with pytest.raises(ValueError, match="Unsupported profile version"):
+        DatasetProfile.load(saved)
+
+
+def test_cli_diff_against_data_and_saved_baseline(tmp_path):
+    old = tmp_path / "old.csv"
+    new = tmp_path / "new.csv"
+    baseline = tmp_path / "new.json"
+    _frame(0).to_csv(old, index=False)
+    _frame(1, shift=1.0).to_csv(new, index=False)
+    runner = CliRunner()
+
+    result = runner.invoke(main, ["diff", str(old), str(new), "--save-profile", str(baseline)])
+
+    assert result.exit_code == 0, result.output
+    assert "# Data Drift Report" in result.output
+    assert "| country | str | 0.0% | ~3 | 0.3" in result.output
+    assert "Column 'country' distribution shifted (tvd distance 0.30)." in result.output
+
+    result = runner.invoke(main, ["diff", str(baseline), str(new), "--fail-on-drift"])
+    assert result.exit_code == 0, result.output
+    result = runner.invoke(main, ["diff", str(old), str(baseline), "--fail-on-drift"])
+    assert result.exit_code == 1
+    assert "2 of 3 columns drifted." in result.output
+    assert runner.invoke(main, [str(old), "--no-cache"]).exit_code == 0
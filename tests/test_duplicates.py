@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from quality_toolkit.analysis import evaluate_data_quality, evaluate_data_quality_chunks
+from quality_toolkit.duplicates import (
+    BloomDuplicateDetector,
+    ExactDuplicateDetector,
+    create_duplicate_detector,
+    row_fingerprints,
+)
+
+
+def test_row_fingerprints_ignore_chunk_dtype_drift():
+    as_int = pd.DataFrame({"value": [1, 2], "label": ["x", None]})
+    as_float = pd.DataFrame({"value": [1.0, 2.0], "label": ["x", np.nan]})
+
+    assert np.array_equal(row_fingerprints(as_int), row_fingerprints(as_float))
+
+
+def test_exact_mode_keeps_large_integer_ids_apart():
+    frame = pd.DataFrame({"id": [2**60, 2**60 + 1, 2**60 + 2, 2**60 + 1]})
+
+    assert evaluate_data_quality(frame).duplicate_rows == frame.duplicated().sum() == 1
+    chunked = evaluate_data_quality_chunks([frame.iloc[:2], frame.iloc[2:]])
+    assert chunked.duplicate_rows == 1
+
+
+def test_exact_detector_counts_duplicates_across_spilled_runs(tmp_path):
+    detector = ExactDuplicateDetector(spill_threshold=4, spill_dir=tmp_path)
+    batches = [np.arange(0, 5), np.arange(3, 8), np.array([0, 0, 9])]
+
+    counts = [detector.add(batch.astype(np.uint64)) for batch in batches]
+
+    assert counts == [0, 2, 2]
+    assert detector.duplicate_rows == 4
+    assert detector.unique_count == 9
+    assert any(tmp_path.iterdir())
+    detector.close()
+    assert not any(tmp_path.iterdir())
+
+
+def test_exact_detector_merge_counts_shared_fingerprints():
+    left = ExactDuplicateDetector()
+    left.add(np.array([1, 2, 3], dtype=np.uint64))
+    right = ExactDuplicateDetector()
+    right.add(np.array([3, 4, 4], dtype=np.uint64))
+
+    left.merge(right)
+
+    assert left.duplicate_rows == 2
+    assert left.unique_count == 4
+
+
+def test_bloom_detector_tracks_duplicates_with_bounded_error():
+    detector = BloomDuplicateDetector(capacity=1_000, error_rate=0.01)
+    values = np.arange(3_000, dtype=np.uint64) * np.uint64(0x9E3779B1)
+
+    detector.add(values)
+    detector.add(values[:500])
+
+    assert detector.duplicate_rows == pytest.approx(500, abs=60)
+    assert 0 < detector.false_positive_rate < 0.05
+
+
+def test_create_duplicate_detector_rejects_unknown_mode():
+    with pytest.raises(ValueError):
+        create_duplicate_detector("fuzzy")
@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def _loaded_modules(code: str) -> set[str]:
+    completed = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(' '.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(completed.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import quality_toolkit",
+        "from quality_toolkit.cli import main\n"
+        "try:\n    main(['--help'])\nexcept SystemExit:\n    pass",
+    ],
+)
+def test_startup_does_not_load_heavy_dependencies(code):
+    loaded = _loaded_modules(code)
+
+    assert not {"pandas", "numpy", "tkinter"} & loaded
+
+
+def test_public_names_load_on_first_access():
+    import quality_toolkit
+
+    assert quality_toolkit.DatasetQuality.__module__ == "quality_toolkit.analysis"
+    assert set(quality_toolkit.__all__) <= set(dir(quality_toolkit))
+    with pytest.raises(AttributeError):
+        quality_toolkit.not_a_public_name  # noqa: B018
@@ -0,0 +1,92 @@
+import json
+import pickle
+
+import pandas as pd
+
+from quality_toolkit.incremental import STATE_FORMAT_VERSION, evaluate_incremental
+from quality_toolkit.pipeline import evaluate_file
+
+
+def test_incremental_run_matches_full_scan_after_appends(tmp_path):
+    source = tmp_path / "log.csv"
+    state = tmp_path / "log.state"
+    source.write_text("id,label\n1,a\n2,\n")
+
+    first = evaluate_incremental(source, state)
+    with source.open("a") as handle:
+        handle.write("2,\n3,c\n4,d\n")
+    second = evaluate_incremental(source, state)
+
+    assert first.row_count == 2
+    assert second == evaluate_file(source)
+    assert second.duplicate_rows == 1
+
+
+def test_incremental_run_ignores_partially_written_line(tmp_path):
+    source = tmp_path / "log.csv"
+    state = tmp_path / "log.state"
+    source.write_text("id,label\n1,a\n2,b")
+
+    partial = evaluate_incremental(source, state)
+    with source.open("a") as handle:
+        handle.write("x\n")
+    completed = evaluate_incremental(source, state)
+
+    assert partial.row_count == 1
+    assert completed.row_count == 2
+    assert completed.columns["label"].sample_values == ["a", "bx"]
+
+
+def test_incremental_run_counts_unterminated_last_line_once_file_is_unchanged(tmp_path):
+    source = tmp_path / "log.csv"
+    state = tmp_path / "log.state"
+    source.write_text("id,label\n1,a\n2,b\n3,c")
+
+    first = evaluate_incremental(source, state)
+    second = evaluate_incremental(source, state)
+
+    assert first.row_count == 2
+    assert second == evaluate_file(source)
+    assert second.row_count == 3
+    assert evaluate_incremental(source, state) == second
+
+
+def test_incremental_run_rescans_when_prefix_changes(tmp_path):
+    source = tmp_path / "log.csv"
+    state = tmp_path / "log.state"
+    source.write_text("id,label\n1,a\n2,b\n")
+    evaluate_incremental(source, state)
+
+    source.write_text("id,label\n9,z\n2,b\n3,c\n")
+    rescanned = evaluate_incremental(source, state)
+
+    assert rescanned == evaluate_file(source)
+    assert rescanned.columns["id"].sample_values == ["9", "2", "3"]
+
+
+def test_incremental_run_rescans_when_options_change(tmp_path):
+    source = tmp_path / "log.csv"
+    state = tmp_path / "log.state"
+    pd.DataFrame({"id": range(10)}).to_csv(source, index=False)
+    evaluate_incremental(source, state, sample_size=2)
+
+    result = evaluate_incremental(source, state, sample_size=3)
+
+    assert len(result.columns["id"].sample_values) == 3
+
+
+def test_incremental_state_is_json_and_other_formats_are_ignored(tmp_path):
+    source = tmp_path / "log.csv"
+    state = tmp_path / "log.state"
+    source.write_text("id,label\n1,a\n2,b\n")
+    evaluate_incremental(source, state)
+    saved = json.loads(state.read_text())
+    assert saved["version"] == STATE_FORMAT_VERSION
+
+    saved["version"] = STATE_FORMAT_VERSION - 1
+    saved["offset"] = len("id,label\n1,a\n")
+    state.write_text(json.dumps(saved))
+    assert evaluate_incremental(source, state) == evaluate_file(source)
+
+    state.write_bytes(pickle.dumps({"offset": 0}))
+    assert evaluate_incremental(source, state) == evaluate_file(source)
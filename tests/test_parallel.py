@@ -0,0 +1,52 @@
+import pandas as pd
+import pytest
+
+from quality_toolkit.analysis import evaluate_data_quality, evaluate_data_quality_chunks
+from quality_toolkit.parallel import (
+    PROCESS_START_METHOD,
+    choose_executor,
+    resolve_workers,
+    split_columns,
+)
+
+
+def _wide_frame() -> pd.DataFrame:
+    data = {f"num_{index}": [index, None, index + 1, index] for index in range(6)}
+    data.update({f"text_{index}": ["a", "b", None, "a"] for index in range(6)})
+    return pd.DataFrame(data)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_evaluation_matches_serial(executor):
+    frame = _wide_frame()
+
+    parallel = evaluate_data_quality(frame, workers=3, executor=executor)
+
+    assert parallel == evaluate_data_quality(frame)
+    assert list(parallel.columns) == list(frame.columns)
+
+
+def test_parallel_chunk_evaluation_matches_serial():
+    frame = _wide_frame()
+    chunks = [frame.iloc[:2], frame.iloc[2:]]
+
+    assert evaluate_data_quality_chunks(chunks, workers=4) == evaluate_data_quality(frame)
+
+
+def test_split_columns_deals_round_robin():
+    assert split_columns(["a", "b", "c", "d", "e"], 2) == [["a", "c", "e"], ["b", "d"]]
+    assert split_columns(["a"], 4) == [["a"]]
+
+
+def test_choose_executor_prefers_threads_for_typed_columns():
+    assert choose_executor(pd.DataFrame({"x": [1.0, 2.0]})) == "thread"
+    assert choose_executor(pd.DataFrame({"x": [{"a": 1}, None]})) == "process"
+    # The fingerprint thread may hold locks when the pool starts, so workers never fork.
+    assert PROCESS_START_METHOD in ("forkserver", "spawn")
+
+
+def test_resolve_workers_rejects_negative_values():
+    assert resolve_workers(None) == 1
+    assert resolve_workers(0) >= 1
+    with pytest.raises(ValueError):
+        resolve_workers(-1)
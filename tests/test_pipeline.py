@@ -0,0 +1,142 @@
+import pandas as pd
+import pytest
+
+from quality_toolkit.analysis import evaluate_data_quality
+from quality_toolkit.pipeline import evaluate_file, evaluate_sheets
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame(
+        {
+            "id": [1, 2, 3, 3, 5, 6, 7],
+            "label": ["a", None, "b", "b", None, "c", "a"],
+            "score": [0.5, None, 1.5, 1.5, 2.0, None, 0.5],
+        }
+    )
+
+
+def test_evaluate_file_streams_csv_chunks(tmp_path, frame):
+    path = tmp_path / "sample.csv"
+    frame.to_csv(path, index=False)
+
+    assert evaluate_file(path, chunk_size=3) == evaluate_file(path)
+
+
+def test_evaluate_file_matches_whole_file_when_chunk_dtypes_differ(tmp_path):
+    path = tmp_path / "mixed.csv"
+    path.write_text("v,w\n1,a\n2,b\n3,c\n4,d\n5,e\nx,f\n1,a\n")
+
+    whole = evaluate_file(path)
+    streamed = evaluate_file(path, chunk_size=5)
+
+    assert (whole.columns["v"].distinct_count, whole.duplicate_rows) == (6, 1)
+    assert streamed == whole
+    approximate = evaluate_file(path, chunk_size=5, distinct_error=0.01)
+    assert approximate.columns["v"].distinct_count == 6
+    assert approximate.duplicate_rows == 1
+
+
+def test_evaluate_file_streams_parquet_row_groups(tmp_path, frame):
+    pq = pytest.importorskip("pyarrow.parquet")
+    pa = pytest.importorskip("pyarrow")
+    path = tmp_path / "sample.parquet"
+    pq.write_table(pa.Table.from_pandas(frame, preserve_index=False), path, row_group_size=3)
+
+    streamed = evaluate_file(path, chunk_size=3, columns=["label", "id"])
+
+    assert list(streamed.columns) == ["label", "id"]
+    assert streamed == evaluate_data_quality(frame[["label", "id"]])
+
+
+def test_evaluate_file_seeds_parquet_batches_from_footer_null_counts(tmp_path, frame):
+    pq = pytest.importorskip("pyarrow.parquet")
+    pa = pytest.importorskip("pyarrow")
+    frame = frame.assign(empty=pd.Series([None] * len(frame), dtype="str"))
+    path = tmp_path / "sample.parquet"
+    pq.write_table(pa.Table.from_pandas(frame, preserve_index=False), path, row_group_size=5)
+
+    for distinct_error in (None, 0.01):
+        streamed = evaluate_file(path, chunk_size=2, distinct_error=distinct_error)
+        whole = evaluate_file(path, distinct_error=distinct_error)
+        assert streamed == whole
+        assert streamed.columns["empty"].missing_count == len(frame)
+
+
+def test_evaluate_file_streams_excel_blank_rows_like_whole_sheet(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    path = tmp_path / "blank.xlsx"
+    workbook = openpyxl.Workbook()
+    for row in (["a", "a"], [1, 1], [None, None], [2, 2], [3, 3], [None, None]):
+        workbook.active.append(row)
+    workbook.save(path)
+
+    streamed = evaluate_file(path, chunk_size=2)
+
+    assert streamed == evaluate_file(path)
+    assert streamed.row_count == 4
+    assert streamed.columns["a.1"].dtype == "float64"
+    assert streamed.columns["a.1"].missing_ratio == 0.25
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_evaluate_sheets_streams_every_sheet(tmp_path, frame, workers):
+    path = tmp_path / "book.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        frame.to_excel(writer, sheet_name="full", index=False)
+        frame.head(2).to_excel(writer, sheet_name="head", index=False)
+
+    sheets = evaluate_sheets(path, workers=workers, chunk_size=3)
+
+    assert list(sheets) == ["full", "head"]
+    assert sheets["full"] == evaluate_file(path, sheet_name="full")
+    assert sheets["head"].row_count == 2
+
+
+def test_evaluate_file_arrow_engine_matches_pandas_metrics(tmp_path, frame):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "sample.csv"
+    frame.to_csv(path, index=False)
+
+    arrow = evaluate_file(path, engine="arrow")
+    default = evaluate_file(path)
+
+    assert arrow.duplicate_rows == default.duplicate_rows
+    for name, column in default.columns.items():
+        assert arrow.columns[name].missing_count == column.missing_count
+        assert arrow.columns[name].distinct_count == column.distinct_count
+        assert arrow.columns[name].sample_values == column.sample_values
+    with pytest.raises(ValueError):
+        evaluate_file(path, engine="arrow", chunk_size=3)
+
+
+def test_evaluate_file_optimize_memory_reports_footprints(tmp_path, frame):
+    path = tmp_path / "sample.csv"
+    frame.to_csv(path, index=False)
+
+    compact = evaluate_file(path, optimize_memory=True)
+    default = evaluate_file(path)
+
+    assert compact.duplicate_rows == default.duplicate_rows
+    for name, column in default.columns.items():
+        optimized = compact.columns[name]
+        assert optimized.missing_count == column.missing_count
+        assert optimized.distinct_count == column.distinct_count
+        assert 0 < optimized.memory_bytes <= optimized.default_memory_bytes
+    with pytest.raises(ValueError):
+        evaluate_file(path, optimize_memory=True, chunk_size=3)
+
+
+def test_evaluate_file_streamed_summary_matches_whole_file(tmp_path, frame):
+    path = tmp_path / "sample.csv"
+    frame.to_csv(path, index=False)
+
+    streamed = evaluate_file(path, chunk_size=3, summary=True).summary
+    whole = evaluate_file(path, summary=True).summary
+
+    assert list(whole) == ["id", "score"]
+    for name, summary in whole.items():
+        assert streamed[name].count == summary.count
+        assert streamed[name].mean == pytest.approx(summary.mean)
+        assert streamed[name].std == pytest.approx(summary.std)
+        assert streamed[name].quantiles == summary.quantiles
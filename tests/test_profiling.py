@@ -0,0 +1,54 @@
+import json
+
+import pandas as pd
+from click.testing import CliRunner
+
+from quality_toolkit.analysis import DatasetQuality, evaluate_data_quality
+from quality_toolkit.cli import main
+from quality_toolkit.pipeline import evaluate_file
+from quality_toolkit.profiling import Profiler
+
+
+def test_profiler_records_nested_spans_in_start_order_and_calls_hooks():
+    finished = []
+    with Profiler(hooks=[finished.append]) as profiler, profiler.span("outer") as outer:
+        with profiler.span("inner", column="a"):
+            data = [0] * 100_000
+        outer.rows = len(data)
+
+    spans = profiler.spans
+    assert [(span.name, span.depth) for span in spans] == [("outer", 0), ("inner", 1)]
+    assert [span.name for span in finished] == ["inner", "outer"]
+    assert spans[0].rows == 100_000
+    assert spans[1].column == "a"
+    assert spans[0].peak_memory_bytes >= spans[1].peak_memory_bytes >= 800_000
+
+
+def test_evaluate_file_attaches_stage_and_column_timings(tmp_path):
+    path = tmp_path / "rows.csv"
+    pd.DataFrame({"a": [1, 2, 2], "b": ["x", "y", "y"]}).to_csv(path, index=False)
+
+    with Profiler(trace_memory=False) as profiler:
+        quality = evaluate_file(path, profiler=profiler)
+
+    names = [span.name for span in quality.timings]
+    assert names[:3] == ["load", "load.sniff", "load.parse"]
+    assert [span.column for span in quality.timings if span.name == "evaluate.column"] == ["a", "b"]
+    assert "evaluate.duplicates" in names
+    assert quality == evaluate_data_quality(pd.read_csv(path))
+    assert evaluate_file(path).timings is None
+    restored = DatasetQuality.from_dict(json.loads(json.dumps(quality.to_dict())))
+    assert restored.timings == quality.timings
+
+
+def test_cli_profile_writes_json_breakdown(tmp_path):
+    path = tmp_path / "rows.csv"
+    pd.DataFrame({"a": [1, 2, 2]}).to_csv(path, index=False)
+    output = tmp_path / "profile.json"
+
+    result = CliRunner().invoke(main, [str(path), "--no-cache", "--profile-json", str(output)])
+
+    assert result.exit_code == 0, result.output
+    spans = json.loads(output.read_text())
+    assert spans[-1]["name"] == "report.render"
+    assert all(span["peak_memory_bytes"] is not None for span in spans)
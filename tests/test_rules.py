@@ -0,0 +1,138 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+
+from quality_toolkit import analysis, rules
+from quality_toolkit.analysis import (
+    DatasetAccumulator,
+    DatasetQuality,
+    evaluate_data_quality,
+    evaluate_data_quality_chunks,
+)
+from quality_toolkit.cli import main
+from quality_toolkit.rules import Rule, RuleSet, load_rules
+
+
+def _frame():
+    return pd.DataFrame(
+        {
+            "id": [1, 2, 2, 3, 1, 4],
+            "age": [5, -1, 200, None, 30, 7],
+            "email": ["a@b.io", "bad", None, "d@e.io", "bad", "g@h.io"],
+            "status": ["on", "off", "on", "maybe", None, "on"],
+            "start": [1, 2, 3, 4, 5, 6],
+            "end": [2, 2, 1, None, 9, 7],
+        }
+    )
+
+
+RULES = RuleSet(
+    (
+        Rule("range", "age", min=0, max=120),
+        Rule("regex", "email", pattern=r"[^@]+@[^@]+\.io"),
+        Rule("unique", "id"),
+        Rule("allowed", "status", values=("on", "off")),
+        Rule("compare", "start", other="end", op="<="),
+        Rule("not_null", "status", max_ratio=0.2),
+    ),
+    example_limit=2,
+)
+
+
+def test_rules_count_violations_with_capped_examples_and_warnings():
+    quality = evaluate_data_quality(_frame(), rules=RULES)
+
+    results = {result.name: result for result in quality.rule_results}
+    assert {name: result.violations for name, result in results.items()} == {
+        "age range": 2,
+        "email regex": 2,
+        "id unique": 2,
+        "status allowed": 1,
+        "start compare": 1,
+        "status not_null": 1,
+    }
+    assert results["age range"].examples == [(1, "-1"), (2, "200")]
+    assert results["id unique"].examples == [(2, "2"), (4, "1")]
+    assert results["status not_null"].passed
+    assert "Rule 'age range' failed: 2 of 6 rows (33.3%) violate it." in quality.warnings
+    assert not any("not_null" in warning for warning in quality.warnings)
+    assert DatasetQuality.from_dict(json.loads(json.dumps(quality.to_dict()))) == quality
+
+
+def test_chunked_parallel_and_merged_rules_match_one_pass():
+    frame = _frame()
+    expected = evaluate_data_quality(frame, rules=RULES).rule_results
+    chunks = [frame.iloc[:2], frame.iloc[2:5], frame.iloc[5:]]
+
+    assert evaluate_data_quality_chunks(chunks, rules=RULES).rule_results == expected
+    assert evaluate_data_quality(frame, rules=RULES, workers=3).rule_results == expected
+    first, second = DatasetAccumulator(rules=RULES), DatasetAccumulator(rules=RULES)
+    first.update(frame.iloc[:3])
+    second.update(frame.iloc[3:])
+    first.merge(second)
+    merged = first.result().rule_results
+    assert [result.violations for result in merged] == [r.violations for r in expected]
+
+
+def test_rules_reuse_the_profile_factorization_of_each_column(monkeypatch):
+    factorized = []
+
+    def counting(series):
+        factorized.append(series.name)
+        return pd.factorize(series, use_na_sentinel=True)
+
+    monkeypatch.setattr(analysis, "factorize_column", counting)
+    monkeypatch.setattr(rules, "factorize_column", counting)
+    frame = _frame()
+
+    expected = evaluate_data_quality(frame, rules=RULES).rule_results
+    assert sorted(factorized) == sorted(frame.columns)
+    factorized.clear()
+    chunked = evaluate_data_quality_chunks([frame.iloc[:3], frame.iloc[3:]], rules=RULES, workers=2)
+    assert sorted(factorized) == sorted([*frame.columns] * 2)
+    assert chunked.rule_results == expected
+
+
+def test_unique_rule_counts_repeats_across_many_chunks():
+    ids = pd.Series(np.random.default_rng(5).integers(0, 5_000, 20_000))
+    frame = pd.DataFrame({"id": ids})
+    rules = RuleSet((Rule("unique", "id"),))
+    chunks = [frame.iloc[start : start + 500] for start in range(0, len(frame), 500)]
+
+    (result,) = evaluate_data_quality_chunks(chunks, rules=rules).rule_results
+
+    assert result.violations == int(ids.duplicated().sum())
+    assert result.examples == evaluate_data_quality(frame, rules=rules).rule_results[0].examples
+
+
+def test_load_rules_from_toml_and_yaml(tmp_path):
+    toml = tmp_path / "rules.toml"
+    toml.write_text(
+        'example_limit = 3\n[[rules]]\ncolumn = "status"\ncheck = "allowed"\n'
+        'values = ["on", "off"]\n'
+    )
+    yaml = tmp_path / "rules.yaml"
+    yaml.write_text("rules:\n  - column: status\n    check: allowed\n    values: ['on', 'off']\n")
+
+    assert load_rules(toml) == RuleSet((Rule("allowed", "status", values=("on", "off")),), 3)
+    assert load_rules(yaml).rules == load_rules(toml).rules
+    with pytest.raises(ValueError, match="unknown check"):
+        RuleSet.from_dict({"rules": [{"column": "a", "check": "positive"}]})
+    with pytest.raises(ValueError, match="missing column 'nope'"):
+        evaluate_data_quality(_frame(), rules=RuleSet((Rule("not_null", "nope"),)))
+
+
+def test_cli_reports_rule_section(tmp_path):
+    path = tmp_path / "rows.csv"
+    _frame().to_csv(path, index=False)
+    rules = tmp_path / "rules.toml"
+    rules.write_text('[[rules]]\ncolumn = "age"\ncheck = "range"\nmin = 0\n')
+
+    result = CliRunner().invoke(main, [str(path), "--no-cache", "--rules", str(rules)])
+
+    assert result.exit_code == 0, result.output
+    assert "## Rules" in result.output
+    assert "| age range | age | fail | 1 | 16.7% | row 1: -1 |" in result.output
@@ -0,0 +1,149 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from quality_toolkit.sketches import (
+    FrequentItems,
+    HyperLogLog,
+    KLLSketch,
+    StreamingMoments,
+    hash_series,
+)
+
+
+def test_hyperloglog_estimate_within_error_bound():
+    sketch = HyperLogLog.from_error(0.01)
+    sketch.update(pd.Series(np.arange(50_000)))
+
+    assert sketch.relative_error <= 0.01
+    assert sketch.count() == pytest.approx(50_000, rel=4 * sketch.relative_error)
+
+
+def test_hyperloglog_small_cardinality_is_exact_enough():
+    sketch = HyperLogLog(precision=12)
+    sketch.update(pd.Series(["a", "b", "c", None, "a"]))
+
+    assert sketch.count() == 3
+
+
+def test_hyperloglog_merge_matches_single_sketch():
+    values = pd.Series([f"id-{index}" for index in range(20_000)])
+    combined = HyperLogLog(precision=12)
+    combined.update(values)
+    left = HyperLogLog(precision=12)
+    left.update(values.iloc[:12_000])
+    right = HyperLogLog(precision=12)
+    right.update(values.iloc[8_000:])
+
+    left.merge(right)
+
+    assert left.count() == combined.count()
+
+
+def test_hyperloglog_keeps_large_integer_ids_distinct():
+    ids = pd.Series([2**60, 2**60 + 1, 2**60 + 2], dtype="int64")
+    sketch = HyperLogLog(precision=12)
+    sketch.update(ids)
+    frequent = FrequentItems(capacity=5)
+    frequent.update(ids)
+
+    assert sketch.count() == 3
+    assert len(frequent.counts) == 3
+    # Integral floats hash like integers, so int and float chunks of a column agree.
+    floats = pd.Series([1.0, 2.0, 3.0])
+    assert np.array_equal(hash_series(pd.Series([1, 2, 3])), hash_series(floats))
+    assert len(set(hash_series(pd.Series([0.5, 1.5, 1.0, None])))) == 4
+
+
+def test_hyperloglog_rejects_mismatched_precision_and_unreachable_error():
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=10).merge(HyperLogLog(precision=11))
+    assert HyperLogLog.from_error(1.04 / 2**9).precision == HyperLogLog.MAX_PRECISION
+    with pytest.raises(ValueError, match="error must be at least"):
+        HyperLogLog.from_error(0.001)
+
+
+def test_hyperloglog_update_hashes_text_without_factorizing_and_counts_nulls():
+    values = pd.Series(["a", None, "b", "a", "1"], dtype=object)
+    sketch = HyperLogLog(precision=12)
+
+    assert sketch.update(values) == 1
+    assert sketch.count() == 3
+    other = HyperLogLog(precision=12)
+    other.update(values.astype("str"))
+    other.update(pd.Series([1]))
+    assert np.array_equal(other.registers, sketch.registers)
+
+
+def test_kll_sketch_quantiles_within_rank_error_after_merging():
+    values = np.random.default_rng(0).exponential(size=200_000)
+    probabilities = [0.1, 0.25, 0.5, 0.75, 0.9]
+    merged = KLLSketch.from_error(0.01)
+    for seed, part in enumerate(np.array_split(values, 8)):
+        sketch = KLLSketch(merged.k, seed=seed)
+        sketch.update(part)
+        merged.merge(sketch)
+
+    ranks = np.searchsorted(np.sort(values), merged.quantiles(probabilities)) / len(values)
+
+    assert merged.count == len(values)
+    assert 0 < merged.rank_error <= 0.01
+    assert np.abs(ranks - probabilities).max() <= merged.rank_error
+
+
+def test_kll_sketch_is_exact_before_compacting():
+    sketch = KLLSketch()
+    sketch.update(np.array([4.0, 1.0, 3.0, 2.0]))
+
+    assert sketch.rank_error == 0.0
+    assert sketch.quantiles([0.25, 0.5]).tolist() == [1.75, 2.5]
+
+
+def test_kll_ks_distance_and_serialization_round_trip():
+    rng = np.random.default_rng(3)
+    baseline = KLLSketch(k=200)
+    baseline.update(rng.normal(0, 1, 50_000))
+    restored = KLLSketch.from_dict(baseline.to_dict())
+    shifted = KLLSketch(k=200)
+    shifted.update(rng.normal(1, 1, 50_000))
+
+    assert restored.count == baseline.count
+    assert np.array_equal(restored.quantiles([0.1, 0.5, 0.9]), baseline.quantiles([0.1, 0.5, 0.9]))
+    assert restored.ks_distance(baseline) == 0.0
+    # The exact distance between N(0, 1) and N(1, 1) is 2 * Phi(0.5) - 1, about 0.383.
+    assert baseline.ks_distance(shifted) == pytest.approx(0.383, abs=0.03)
+
+
+def test_frequent_items_keep_heavy_hitters_across_chunks_and_dtypes():
+    rng = np.random.default_rng(4)
+    heavy = np.repeat([1, 2, 3], [3_000, 2_000, 1_000])
+    values = np.concatenate([heavy, rng.integers(4, 10**6, 10_000)])
+    rng.shuffle(values)
+    summary = FrequentItems(capacity=20)
+    for chunk in np.array_split(values, 4):
+        summary.update(pd.Series(chunk))
+    other = FrequentItems(capacity=20)
+    other.update(pd.Series(values[:100].astype(float)))
+    summary.merge(FrequentItems.from_dict(other.to_dict()))
+
+    exact = pd.Series(np.concatenate([values, values[:100]])).value_counts()
+    top = summary.most_common(3)
+    assert [key for key, _ in top] == ["1", "2", "3"]
+    assert summary.total == len(values) + 100
+    assert summary.error <= summary.total / (summary.capacity + 1)
+    for key, count in top:
+        assert exact[int(key)] - summary.error <= count <= exact[int(key)]
+
+
+def test_streaming_moments_merge_matches_numpy():
+    values = np.random.default_rng(1).normal(50, 5, 10_001)
+    moments = StreamingMoments()
+    for part in np.array_split(values, 7):
+        partial = StreamingMoments()
+        partial.update(part)
+        moments.merge(partial)
+
+    assert moments.count == len(values)
+    assert moments.mean == pytest.approx(values.mean())
+    assert moments.std == pytest.approx(values.std(ddof=1))
+    assert (moments.minimum, moments.maximum) == (values.min(), values.max())
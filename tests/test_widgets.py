@@ -0,0 +1,34 @@
+import pytest
+
+pytest.importorskip("tkinter")
+
+from quality_toolkit.widgets import RowWindow  # noqa: E402
+
+
+def test_row_window_exposes_only_the_visible_slice():
+    rows = RowWindow()
+    rows.size = 3
+    rows.set_keys([f"column_{index}" for index in range(20_000)])
+
+    rows.scroll_to(19_999)
+
+    assert rows.window() == ["column_19997", "column_19998", "column_19999"]
+    assert rows.fractions() == (19_997 / 20_000, 1.0)
+
+
+def test_row_window_filters_and_sorts_without_touching_the_keys():
+    rows = RowWindow()
+    rows.size = 10
+    rows.set_keys(["b_1", "a_2", "b_3", "a_4"])
+    values = {"b_1": 3, "a_2": 1, "b_3": 2, "a_4": 5, "b_5": 0}
+
+    rows.set_filter(lambda key: key.startswith("b"))
+    rows.sort(values.get, reverse=True)
+    rows.append("b_5")
+
+    assert rows.window() == ["b_1", "b_3", "b_5"]
+    values["b_6"] = 4
+    rows.append("b_6")
+    assert rows.window() == ["b_6", "b_1", "b_3", "b_5"]
+    rows.set_filter(None)
+    assert rows.keys == ["b_1", "a_2", "b_3", "a_4", "b_5", "b_6"]
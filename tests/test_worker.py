@@ -0,0 +1,42 @@
+import pandas as pd
+import pytest
+
+from quality_toolkit.data_loader import load_dataset
+from quality_toolkit.worker import BackgroundTask, TaskCancelled
+
+
+def test_background_task_queues_messages_then_result():
+    def target(task):
+        task.progress(1, 2)
+        task.post("column", "a")
+        return 42
+
+    task = BackgroundTask(target).start()
+    task.join()
+
+    assert task.drain() == [("progress", (1, 2)), ("column", "a"), ("result", 42)]
+
+
+def test_background_task_reports_errors():
+    def target(task):
+        raise ValueError("bad input")
+
+    task = BackgroundTask(target).start()
+    task.join()
+
+    [(kind, error)] = task.drain()
+    assert kind == "error"
+    assert str(error) == "bad input"
+
+
+def test_cancel_stops_a_load_at_its_next_progress_report(tmp_path):
+    path = tmp_path / "rows.csv"
+    pd.DataFrame({"a": range(1000)}).to_csv(path, index=False)
+    task = BackgroundTask(lambda task: load_dataset(path, progress=task.progress))
+
+    task.cancel()
+    task.start().join()
+
+    assert task.drain() == [("cancelled", None)]
+    with pytest.raises(TaskCancelled):
+        task.check_cancelled()
@@ -0,0 +1,73 @@
+import json
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+from click.testing import CliRunner
+
+from quality_toolkit.analysis import DatasetQuality, evaluate_data_quality
+from quality_toolkit.cli import main
+from quality_toolkit.report import build_markdown_report
+from quality_toolkit.writers import ReportWriter, open_writer, write_report
+
+
+def _quality():
+    df = pd.DataFrame({"a": [1.0, None, 3.0, 3.0], "b": ["x", "y", "z", "z"]})
+    return evaluate_data_quality(df, summary=True)
+
+
+def test_json_round_trips_and_markdown_matches_builder(tmp_path):
+    quality = _quality()
+    write_report(quality, tmp_path / "report.json", "json")
+    write_report(quality, tmp_path / "report.md")
+
+    restored = DatasetQuality.from_dict(json.loads((tmp_path / "report.json").read_text()))
+    assert restored == quality
+    assert (tmp_path / "report.md").read_text() == build_markdown_report(quality)
+
+
+def test_jsonl_and_parquet_stream_several_reports(tmp_path):
+    quality = _quality()
+    for format_name in ("jsonl", "parquet"):
+        with open_writer(format_name, tmp_path / f"reports.{format_name}") as writer:
+            writer.write(quality, source="first")
+            writer.write(quality, source="second")
+
+    records = pd.read_json(tmp_path / "reports.jsonl", lines=True)
+    assert list(records["record"]) == ["dataset", "column", "column"] * 2
+    assert records["source"].tolist()[3] == "second"
+    table = pq.read_table(tmp_path / "reports.parquet").to_pandas()
+    assert table[["source", "name"]].values.tolist() == [
+        ["first", "a"],
+        ["first", "b"],
+        ["second", "a"],
+        ["second", "b"],
+    ]
+    assert table["summary_quantile_50"].iloc[0] == 3.0
+    assert table["row_count"].tolist() == [4] * 4
+    schema = pq.read_schema(tmp_path / "reports.parquet")
+    assert schema.field("sample_values").type.value_type == "string"
+    assert schema.field("memory_bytes").type == "int64"
+
+
+def test_report_writer_subclasses_must_implement_write():
+    class Incomplete(ReportWriter):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_cli_writes_jsonl_output(tmp_path):
+    path = tmp_path / "rows.csv"
+    pd.DataFrame({"a": [1, 2, 2]}).to_csv(path, index=False)
+    output = tmp_path / "report.jsonl"
+
+    result = CliRunner().invoke(
+        main, [str(path), "--no-cache", "--format", "jsonl", "--output", str(output)]
+    )
+
+    assert result.exit_code == 0, result.output
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert lines[0]["row_count"] == 3
+    assert lines[1]["name"] == "a"